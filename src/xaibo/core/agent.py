@@ -5,9 +5,16 @@ from xaibo.core.exchange import Exchange
 
 
 class Agent:
+    # agents are created for every request, so they don't carry a per-instance __dict__
+    __slots__ = ("id", "exchange", "_caller_id", "_handlers", "_response_module")
+
     def __init__(self, id: str, exchange: Exchange):
         self.id = id
         self.exchange = exchange
+        self._caller_id = f"agent:{id}"
+        # message handlers and the response module are resolved on first use, see _get_handler
+        self._handlers = {}
+        self._response_module = None
 
     def __str__(self) -> str:
         """Get a string representation of the agent.
@@ -21,12 +28,27 @@ class Agent:
         return self.exchange.get_entry_point_ids()
 
     def _get_entry_module(self, entry_point_id='__entry__'):
-        module = self.exchange.get_module(entry_point_id, caller_id=f"agent:{self.id}")
+        module = self.exchange.get_module(entry_point_id, caller_id=self._caller_id)
         return module
 
     def _get_response_module(self):
-        module = self.exchange.get_module("__response__", caller_id=f"agent:{self.id}")
-        return module
+        if self._response_module is None:
+            self._response_module = self.exchange.get_module("__response__", caller_id=self._caller_id)
+        return self._response_module
+
+    def _get_handler(self, entry_point: str, method_name: str, protocol_name: str):
+        """Get a message handler method of an entry module, resolving it only once per entry point.
+
+        Raises:
+            AttributeError: If the entry module doesn't implement the given protocol
+        """
+        handler = self._handlers.get((entry_point, method_name))
+        if handler is None:
+            entry_module = self._get_entry_module(entry_point)
+            if not hasattr(entry_module, method_name):
+                raise AttributeError(f"Entry module does not implement {protocol_name}")
+            handler = self._handlers[(entry_point, method_name)] = getattr(entry_module, method_name)
+        return handler
 
     async def handle_text(self, text: str, entry_point='__entry__') -> Response:
         """Handle an incoming text message by delegating to the entry module.
@@ -40,10 +62,8 @@ class Agent:
         Raises:
             AttributeError: If entry module doesn't implement TextMessageHandlerProtocol
         """
-        entry_module = self._get_entry_module(entry_point)
-        if not hasattr(entry_module, "handle_text"):
-            raise AttributeError("Entry module does not implement TextMessageHandlerProtocol")
-        await entry_module.handle_text(text)
+        handle_text = self._get_handler(entry_point, "handle_text", "TextMessageHandlerProtocol")
+        await handle_text(text)
         return await self._get_response_module().get_response()
 
     async def handle_image(self, image: BinaryIO, entry_point='__entry__') -> Response:
@@ -58,10 +78,8 @@ class Agent:
         Raises:
             AttributeError: If entry module doesn't implement ImageMessageHandlerProtocol
         """
-        entry_module = self._get_entry_module(entry_point)
-        if not hasattr(entry_module, "handle_image"):
-            raise AttributeError("Entry module does not implement ImageMessageHandlerProtocol")
-        await entry_module.handle_image(image)
+        handle_image = self._get_handler(entry_point, "handle_image", "ImageMessageHandlerProtocol")
+        await handle_image(image)
         return await self._get_response_module().get_response()
 
     async def handle_audio(self, audio: BinaryIO, entry_point='__entry__') -> Response:
@@ -76,10 +94,8 @@ class Agent:
         Raises:
             AttributeError: If entry module doesn't implement AudioMessageHandlerProtocol
         """
-        entry_module = self._get_entry_module(entry_point)
-        if not hasattr(entry_module, "handle_audio"):
-            raise AttributeError("Entry module does not implement AudioMessageHandlerProtocol")
-        await entry_module.handle_audio(audio)
+        handle_audio = self._get_handler(entry_point, "handle_audio", "AudioMessageHandlerProtocol")
+        await handle_audio(audio)
         return await self._get_response_module().get_response()
 
     async def handle_video(self, video: BinaryIO, entry_point='__entry__') -> Response:
@@ -94,8 +110,6 @@ class Agent:
         Raises:
             AttributeError: If entry module doesn't implement VideoMessageHandlerProtocol
         """
-        entry_module = self._get_entry_module(entry_point)
-        if not hasattr(entry_module, "handle_video"):
-            raise AttributeError("Entry module does not implement VideoMessageHandlerProtocol")
-        await entry_module.handle_video(video)
+        handle_video = self._get_handler(entry_point, "handle_video", "VideoMessageHandlerProtocol")
+        await handle_video(video)
         return await self._get_response_module().get_response()
\ No newline at end of file
@@ -1,8 +1,80 @@
+import importlib
+import inspect
+import os
 from enum import Enum
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, List, Optional, Tuple, Type, Union, get_type_hints
 from pydantic import BaseModel, Field
 from pydantic_yaml import parse_yaml_raw_as, to_yaml_str
 from collections import defaultdict
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def _import_class(module_path: str):
+    """Import a class from its dotted path, caching the result per path."""
+    # Split the path into module path and class name
+    module_parts = module_path.split('.')
+    class_name = module_parts[-1]
+    module_import_path = '.'.join(module_parts[:-1])
+
+    # Import the module
+    module = importlib.import_module(module_import_path)
+
+    # Get the class
+    return getattr(module, class_name)
+
+
+
+@lru_cache(maxsize=None)
+def _get_provided_protocols(module_class) -> tuple:
+    """Get the names of the protocols a module class provides, cached per class.
+
+    These are the protocols returned by an explicit `provides` method followed by the
+    protocols the class inherits from.
+    """
+    protocol_names = []
+
+    # Check for explicit provides method
+    if hasattr(module_class, "provides") and callable(getattr(module_class, "provides")):
+        for protocol_type in module_class.provides():
+            # Convert protocol type to string reference
+            protocol_names.append(protocol_type.__name__)
+
+    # Check for implicit protocol provision through inheritance
+    for base in module_class.__mro__[1:]:  # Skip the class itself
+        if getattr(base, "_is_protocol", False) and base.__name__ != "Protocol":
+            protocol_names.append(base.__name__)
+
+    return tuple(dict.fromkeys(protocol_names))
+
+
+@lru_cache(maxsize=None)
+def _get_constructor_requirements(module_class) -> tuple:
+    """Get the (parameter name, protocol name) pairs a module class constructor requires, cached per class."""
+    if not hasattr(module_class, "__init__"):
+        return ()
+
+    # Get constructor signature
+    signature = inspect.signature(module_class.__init__)
+    type_hints = get_type_hints(module_class.__init__)
+
+    # Extract parameters that aren't self or config
+    requirements = []
+    for param_name in signature.parameters:
+        if param_name in ('self', 'config') or param_name not in type_hints:
+            continue
+        param_type = type_hints[param_name]
+        # Get the name of the type for protocol matching
+        if hasattr(param_type, "__args__"):
+            requirements.append((param_name, ",".join(x.__name__ for x in param_type.__args__)))
+        elif hasattr(param_type, "__name__"):
+            requirements.append((param_name, param_type.__name__))
+        elif hasattr(param_type, "_name"):
+            # Handle Optional types
+            type_name = str(param_type).replace("typing.Optional[", "").replace("]", "")
+            if "." in type_name:
+                type_name = type_name.split(".")[-1]
+            requirements.append((param_name, type_name))
+    return tuple(requirements)
 
 class Scope(Enum):
     Instance = 'instance'
@@ -64,11 +136,14 @@ class AgentConfig(BaseModel):
         self.populate_implicits()
 
     @classmethod
-    def load_directory(cls, directory: str) -> Dict[str, "AgentConfig"]:
+    def load_directory(cls, directory: str, cache: Optional[Dict[str, Tuple[int, int, "AgentConfig"]]] = None) -> Dict[str, "AgentConfig"]:
         """Load all agent configurations from a directory recursively.
 
         Args:
             directory: Path to directory containing YAML agent configurations
+            cache: Optional dictionary mapping filenames to their (mtime_ns, size, config) from a previous load.
+                Files whose modification time and size are unchanged reuse the cached config instead of
+                being parsed again. The cache is updated in place.
 
         Returns:
             Dictionary mapping filenames to AgentConfig instances
@@ -76,21 +151,52 @@ class AgentConfig(BaseModel):
         Raises:
             ValueError: If any YAML files cannot be parsed as valid agent configs
         """
-        import os
-
         configs = {}
 
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.yml', '.yaml')):
-                    full_path = os.path.join(root, file)
-                    with open(full_path) as f:
-                        try:
-                            yaml_content = f.read()
-                            config = cls.from_yaml(yaml_content)
-                            configs[full_path] = config
-                        except Exception as e:
-                            raise ValueError(f"Invalid agent config in {full_path}: {str(e)}")
+        # walk the tree with scandir, whose entries already know their type and cache their stat
+        directories = [directory]
+        while directories:
+            try:
+                with os.scandir(directories.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                # unreadable directories are skipped, like os.walk does
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                if entry.is_dir():
+                    # symlinked directories are not followed
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                    continue
+                if not entry.name.endswith(('.yml', '.yaml')):
+                    continue
+
+                full_path = entry.path
+                if cache is not None:
+                    stat = entry.stat()
+                    cached = cache.get(full_path)
+                    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        configs[full_path] = cached[2]
+                        continue
+                with open(full_path, 'rb', buffering=0) as f:
+                    # read the whole file unbuffered, a buffer would only add a copy for a single read
+                    yaml_bytes = f.read()
+                try:
+                    config = cls.from_yaml(yaml_bytes.decode())
+                    configs[full_path] = config
+                except Exception as e:
+                    raise ValueError(f"Invalid agent config in {full_path}: {str(e)}")
+                if cache is not None:
+                    cache[full_path] = (stat.st_mtime_ns, stat.st_size, config)
+
+            # visit subdirectories in the order they were listed
+            directories.extend(reversed(subdirectories))
+
+        if cache is not None:
+            for path in cache.keys() - configs.keys():
+                del cache[path]
 
         return configs
 
@@ -102,11 +208,11 @@ class AgentConfig(BaseModel):
             yaml_str: YAML string containing agent configuration
 
         Returns:
-            AgentConfig instance parsed from the YAML
+            AgentConfig instance parsed from the YAML. Identical YAML strings are only parsed once.
         """
 
-        config = parse_yaml_raw_as(AgentConfig, yaml_str)
-        return config
+        # configs are mutable, so every caller gets its own copy of the cached parse result
+        return _parse_agent_config(yaml_str).model_copy(deep=True)
 
     def to_yaml(self) -> str:
         """Convert this AgentConfig to YAML string format.
@@ -165,19 +271,21 @@ class AgentConfig(BaseModel):
             if module.id in module_requirements:
                 if module.uses is None:
                     module.uses = []
-                
+
+                used = set(module.uses)
                 for param_name, param_type in module_requirements[module.id].items():
-                    if param_type not in module.uses:
+                    if param_type not in used:
                         module.uses.append(param_type)
+                        used.add(param_type)
+
+        configured = self._get_configured_exchanges()
 
         # For each module that uses protocols
         for module in self.modules:
             if module.uses:
                 for protocol in module.uses:
                     # Skip if module already has an exchange config for this protocol
-                    has_config = any(ex.module == module.id and ex.protocol == protocol
-                                     for ex in self.exchange)
-                    if has_config:
+                    if (module.id, protocol) in configured:
                         continue
 
                     providers = protocol_providers[protocol]
@@ -189,12 +297,21 @@ class AgentConfig(BaseModel):
                             protocol=protocol,
                             provider=provider
                         ))
+                        configured.add((module.id, protocol))
                     elif len(providers) > 1:
                         # Only raise if module isn't already configured
                         raise ValueError(
                             f"Multiple providers found for protocol {protocol} used by module {module.id}: {providers}"
                         )
-                    
+
+    def _get_configured_exchanges(self):
+        """Get the (module, protocol) pairs that already have an exchange config.
+
+        Returns:
+            A set of (module ID, protocol name) tuples
+        """
+        return {(ex.module, ex.protocol) for ex in self.exchange}
+
     def _get_protocol_providers(self):
         """Map protocols to provider modules.
         
@@ -210,31 +327,14 @@ class AgentConfig(BaseModel):
             # Check referenced module for provided protocols
             try:
                 module_class = self._import_module_class(module.module)
-                
-                # Check for explicit provides method
-                if hasattr(module_class, "provides") and callable(getattr(module_class, "provides")):
-                    provided_protocols = module_class.provides()
-                    for protocol_type in provided_protocols:
-                        # Convert protocol type to string reference
-                        protocol_name = protocol_type.__name__
-                        if protocol_name not in (module.provides or []):
-                            if module.provides is None:
-                                module.provides = []
-                            module.provides.append(protocol_name)
-                            protocol_providers[protocol_name].append(module.id)
-                
-                # Check for implicit protocol provision through inheritance
-                for base in module_class.__mro__[1:]:  # Skip the class itself                   
-                    if getattr(base, "_is_protocol", False):
-                        protocol_name = base.__name__
-                        if protocol_name == "Protocol":
-                            continue
-                        if protocol_name not in (module.provides or []):
-                            if module.provides is None:
-                                module.provides = []
-                            module.provides.append(protocol_name)
-                            protocol_providers[protocol_name].append(module.id)
-                            
+                provided = set(module.provides or ())
+                for protocol_name in _get_provided_protocols(module_class):
+                    if protocol_name not in provided:
+                        if module.provides is None:
+                            module.provides = []
+                        module.provides.append(protocol_name)
+                        provided.add(protocol_name)
+                        protocol_providers[protocol_name].append(module.id)
             except (ImportError, AttributeError):
                 # Skip if module can't be imported or doesn't have provides method
                 pass
@@ -246,43 +346,14 @@ class AgentConfig(BaseModel):
         Returns:
             A dictionary mapping module IDs to dictionaries of parameter names and their types
         """
-        import inspect
-        from typing import get_type_hints
-        
         module_requirements = {}
         
         for module in self.modules:
             try:
                 module_class = self._import_module_class(module.module)
-                if hasattr(module_class, "__init__"):
-                    # Get constructor signature
-                    signature = inspect.signature(module_class.__init__)
-                    type_hints = get_type_hints(module_class.__init__)
-                    
-                    # Extract parameters that aren't self or config
-                    requirements = {}
-                    for param_name, param in signature.parameters.items():
-                        if param_name not in ('self', 'config'):
-                            # Try to get the type hint
-                            if param_name in type_hints:
-                                param_type = type_hints[param_name]
-                                # Get the name of the type for protocol matching
-                                if hasattr(param_type, "__args__"):
-                                    type_name = ",".join(x.__name__ for x in param_type.__args__)
-
-                                    requirements[param_name] = type_name
-                                elif hasattr(param_type, "__name__"):
-                                    type_name = param_type.__name__
-                                    requirements[param_name] = type_name
-                                elif hasattr(param_type, "_name"):
-                                    # Handle Optional types
-                                    type_name = str(param_type).replace("typing.Optional[", "").replace("]", "")
-                                    if "." in type_name:
-                                        type_name = type_name.split(".")[-1]
-                                    requirements[param_name] = type_name
-                    
-                    if requirements:
-                        module_requirements[module.id] = requirements
+                requirements = _get_constructor_requirements(module_class)
+                if requirements:
+                    module_requirements[module.id] = dict(requirements)
             except (ImportError, AttributeError):
                 # Skip if module can't be imported or doesn't have __init__ method
                 pass
@@ -301,18 +372,7 @@ class AgentConfig(BaseModel):
         Raises:
             ImportError: If the module cannot be imported
         """
-        import importlib
-        
-        # Split the path into module path and class name
-        module_parts = module_path.split('.')
-        class_name = module_parts[-1]
-        module_import_path = '.'.join(module_parts[:-1])
-        
-        # Import the module
-        module = importlib.import_module(module_import_path)
-        
-        # Get the class
-        return getattr(module, class_name)
+        return _import_class(module_path)
 
     def _add_implicit_entry_handlers(self):
         """Add implicit entry handlers for message protocols if unambiguous.
@@ -321,12 +381,11 @@ class AgentConfig(BaseModel):
             ValueError: If multiple message handlers are found for a message type protocol
         """
         message_handlers = self._get_message_handlers()
+        configured = self._get_configured_exchanges()
 
         for protocol, handlers in message_handlers.items():
             # Skip if __entry__ already has an exchange config for this protocol
-            has_config = any(ex.module == "__entry__" and ex.protocol == protocol
-                             for ex in self.exchange)
-            if has_config:
+            if ("__entry__", protocol) in configured:
                 continue
 
             if len(handlers) == 1:
@@ -360,4 +419,71 @@ class AgentConfig(BaseModel):
                     if protocol in message_handlers:
                         message_handlers[protocol].append(module.id)
                         
-        return message_handlers
\ No newline at end of file
+        return message_handlers
+
+
+@lru_cache(maxsize=128)
+def _parse_agent_config(yaml_str: str) -> AgentConfig:
+    """Parse an AgentConfig from YAML, cached by content. The result is shared, callers must copy it."""
+    if _FastYamlLoader is None:
+        return parse_yaml_raw_as(AgentConfig, yaml_str)
+    return AgentConfig.model_validate(yaml.load(yaml_str, Loader=_FastYamlLoader))
+
+
+def _construct_yaml12_int(loader, node) -> int:
+    """Construct YAML 1.2 integers, where a leading 0 is decimal and octals are written as 0o..."""
+    value = loader.construct_scalar(node).replace('_', '')
+    sign = 1
+    if value[0] in '+-':
+        if value[0] == '-':
+            sign = -1
+        value = value[1:]
+    if value.startswith('0o'):
+        return sign * int(value[2:], 8)
+    if value.startswith(('0b', '0x')):
+        return sign * int(value, 0)
+    return sign * int(value)
+
+
+try:
+    import yaml
+    from ruamel.yaml.constructor import DuplicateKeyError
+    from ruamel.yaml.resolver import implicit_resolvers
+
+    class _FastYamlLoader(yaml.CSafeLoader):
+        """libyaml based safe loader that reads YAML like the YAML 1.2 parser of pydantic_yaml.
+
+        PyYAML resolves YAML 1.1 scalars, e.g. `no` and `off` as booleans or `010` as an octal number,
+        so its resolvers are replaced with the YAML 1.2 ones of ruamel.yaml. PyYAML also keeps the last
+        value of duplicate mapping keys, which ruamel.yaml rejects with a DuplicateKeyError, so this loader does too.
+        """
+        yaml_implicit_resolvers = {}
+
+        def construct_mapping(self, node, deep=False):
+            if isinstance(node, yaml.MappingNode):
+                keys = set()
+                for key_node, _ in node.value:
+                    # keys of merged mappings (<<) may be overridden
+                    if key_node.tag == 'tag:yaml.org,2002:merge':
+                        continue
+                    key = self.construct_object(key_node, deep=True)
+                    try:
+                        duplicate = key in keys
+                    except TypeError:
+                        # unhashable keys are rejected by the base implementation
+                        continue
+                    if duplicate:
+                        raise DuplicateKeyError(
+                            "while constructing a mapping", node.start_mark,
+                            f"found duplicate key {key!r}", key_node.start_mark
+                        )
+                    keys.add(key)
+            return super().construct_mapping(node, deep=deep)
+
+    for versions, tag, regexp, first_chars in implicit_resolvers:
+        if (1, 2) in versions:
+            _FastYamlLoader.add_implicit_resolver(tag, regexp, first_chars)
+    _FastYamlLoader.add_constructor('tag:yaml.org,2002:int', _construct_yaml12_int)
+except (ImportError, AttributeError):
+    # PyYAML is optional and CSafeLoader needs it to be built with libyaml
+    _FastYamlLoader = None
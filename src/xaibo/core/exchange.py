@@ -1,14 +1,44 @@
-from itertools import chain
-from collections import defaultdict
+from itertools import chain, count
+from collections import defaultdict, deque
+from functools import lru_cache
 from typing import Type, Union, Any
 from typing_extensions import get_origin, get_args
 from .config import AgentConfig, ModuleConfig, ConfigOverrides, ExchangeConfig
 from .models import EventType, Event
-import time
+from time import time_ns
 
+import inspect
+import sys
 import traceback
 
 
+@lru_cache(maxsize=None)
+def _get_init_parameters(module_class) -> tuple:
+    """Get the injectable (parameter, type) pairs of a module class constructor, cached per class.
+
+    The `config` parameter and the `return` annotation are not injectable and are skipped.
+    """
+    return tuple(
+        (param, param_type)
+        for (param, param_type) in module_class.__init__.__annotations__.items()
+        if param not in ('config', 'return')
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_params_by_type(module_class) -> dict[str, list[str]]:
+    """Map protocol names to the constructor parameters of a module class that accept them, cached per class.
+
+    The returned mapping is shared, callers must not modify it.
+    """
+    types = {}
+    for param, type_hint in _get_init_parameters(module_class):
+        args = get_args(type_hint)
+        type_name = type_hint.__name__ if len(args) == 0 else args[0].__name__
+        types.setdefault(type_name, []).append(param)
+    return types
+
+
 class Exchange:
     """Handles module instantiation and dependency injection for agents."""
 
@@ -31,9 +61,13 @@ class Exchange:
         self.overrides = override_config
         self.event_listeners = event_listeners or []
         self.config = config
+        self._exchange_by_module: dict[str | None, list[ExchangeConfig]] = {}
+        self._proxies: dict[tuple[str, str], Proxy] = {}
 
         if config:
-            self.config.exchange = [ex for ex in self.config.exchange]
+            # the config is shared by every exchange built from it (e.g. by the registry),
+            # so the bindings of this exchange are added to a shallow copy with its own list
+            self.config = config.model_copy(update={'exchange': list(config.exchange)})
             self.config.exchange.append(ExchangeConfig(
                 protocol=Exchange,
                 provider='__exchange__'
@@ -45,15 +79,22 @@ class Exchange:
                     for conflict in conflicts:
                         self.config.exchange.remove(conflict)
                     self.config.exchange.append(ex)
+            self._index_exchange()
             self._instantiate_modules(specific_modules)
 
-    def get_entry_point_ids(self):
+    def _index_exchange(self) -> None:
+        """Group the exchange configs by the module they apply to."""
+        exchange_by_module = defaultdict(list)
         for exchange in self.config.exchange:
-            if exchange.module == "__entry__":
-                if isinstance(exchange.provider, list):
-                    return exchange.provider
-                else:
-                    return [exchange.provider]
+            exchange_by_module[exchange.module].append(exchange)
+        self._exchange_by_module = dict(exchange_by_module)
+
+    def get_entry_point_ids(self):
+        for exchange in self._exchange_by_module.get("__entry__", ()):
+            if isinstance(exchange.provider, list):
+                return exchange.provider
+            else:
+                return [exchange.provider]
         return []
 
     def _instantiate_modules(self, specific_modules: list[str]) -> None:
@@ -64,9 +105,27 @@ class Exchange:
             for module in self.config.modules
         }
 
+        # resolve every module class exactly once
+        module_classes = {
+            module.id: self.config._import_module_class(module.module)
+            for module in self.config.modules
+        }
+
+        # without any injectable parameters there is nothing to resolve or order
+        if not any(_get_init_parameters(module_class) for module_class in module_classes.values()):
+            module_ids = module_mapping.keys() if specific_modules is None else specific_modules
+            for module_id in module_ids:
+                if module_id in self.module_instances:
+                    continue
+                module_config = module_mapping.get(module_id)
+                if module_config is None:
+                    raise ValueError(f"Requested module {module_id} could not be found!")
+                self.module_instances[module_id] = module_classes[module_id](config=module_config.config)
+            return
+
         # figure out what the module really depends on
         dependency_mapping = {
-            module.id: self._get_module_dependencies(module)
+            module.id: self._get_module_dependencies(module, module_classes[module.id])
             for module in self.config.modules
         }
         # modules that have already been instantiated don't depend on anything
@@ -75,30 +134,22 @@ class Exchange:
 
         if specific_modules is None:
             # Collect all known module ids
-            module_order = [module.id for module in self.config.modules] + [module_id for module_id in self.module_instances]
+            module_ids = [module.id for module in self.config.modules] + [module_id for module_id in self.module_instances]
         else:
-            # only instantiate those specific modules and their dependencies
-            module_order = set(module_id for module_id in specific_modules)
-            for module_id in specific_modules:
-                cur_deps = dependency_mapping[module_id]
-                for deps in cur_deps.values():
-                    module_order.update(deps)
-            module_order = list(module_order)
-
-        # presort modules based on their dependency count
-        module_order.sort(key=lambda x: len(dependency_mapping[x]))
-
-        # sort modules such that dependencies will be instantiated before their dependents
-        i = 0
-        while i < len(module_order):
-            current_module_id = module_order[i]
-            cur_dependencies = set(chain(*dependency_mapping[current_module_id].values()))
-            if len(cur_dependencies) > 0:
-                highest_dependency_idx = max(module_order.index(m) for m in cur_dependencies)
-                if highest_dependency_idx > i:
-                    module_order[i], module_order[highest_dependency_idx] = module_order[highest_dependency_idx], module_order[i]
+            # only instantiate those specific modules and their (transitive) dependencies
+            module_ids = []
+            seen = set()
+            pending = deque(specific_modules)
+            while pending:
+                module_id = pending.popleft()
+                if module_id in seen:
                     continue
-            i = i + 1
+                seen.add(module_id)
+                module_ids.append(module_id)
+                for deps in dependency_mapping.get(module_id, {}).values():
+                    pending.extend(deps)
+
+        module_order = self._sort_modules(module_ids, dependency_mapping)
 
         # instantiate modules in correct order
         for module_id in module_order:
@@ -106,10 +157,12 @@ class Exchange:
                 # skip already instantiated modules (e.g. from overrides or other lifecycles)
                 continue
 
-            module_config = module_mapping[module_id]
+            module_config = module_mapping.get(module_id)
+            if module_config is None:
+                raise ValueError(f"Requested module {module_id} could not be found!")
             dependencies = dependency_mapping[module_id]
 
-            module_class = self.config._import_module_class(module_config.module)
+            module_class = module_classes[module_id]
 
             init_parameters = {}
             for (param, param_type) in self._get_module_parameters(module_class):
@@ -125,29 +178,81 @@ class Exchange:
 
             self.module_instances[module_id] = module_class(**init_parameters, config=module_config.config)
 
-    def _get_module_dependencies(self, module_config: ModuleConfig) -> dict[str, list[str]]:
+    @staticmethod
+    def _sort_modules(module_ids: list[str], dependency_mapping: dict[str, dict[str, list[str]]]) -> list[str]:
+        """Sort modules such that dependencies are instantiated before their dependents.
+
+        Uses Kahn's algorithm, keeping the given order for modules that are ready at the same time.
+
+        Args:
+            module_ids (list[str]): Ids of the modules to sort
+            dependency_mapping (dict[str, dict[str, list[str]]]): Dependencies per module id and parameter
+
+        Returns:
+            list[str]: The module ids in instantiation order
+
+        Raises:
+            ValueError: If the dependencies between the given modules are circular
+        """
+        module_ids = list(dict.fromkeys(module_ids))
+        known = set(module_ids)
+        dependents = {module_id: [] for module_id in module_ids}
+        module_dependencies = {}
+        in_degree = {}
+        for module_id in module_ids:
+            # dict keeps the configured order, so the resulting order is deterministic;
+            # unknown dependencies are reported when the module is instantiated
+            dependencies = [
+                dependency for dependency in dict.fromkeys(chain(*dependency_mapping.get(module_id, {}).values()))
+                if dependency in known
+            ]
+            module_dependencies[module_id] = dependencies
+            in_degree[module_id] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(module_id)
+
+        ready = deque(module_id for module_id in module_ids if in_degree[module_id] == 0)
+        module_order = []
+        while ready:
+            module_id = ready.popleft()
+            module_order.append(module_id)
+            for dependent in dependents[module_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(module_order) < len(module_ids):
+            # every unresolved module waits on another unresolved one, so following those leads into a cycle
+            path = []
+            visited = set()
+            module_id = next(module_id for module_id in module_ids if in_degree[module_id] > 0)
+            while module_id not in visited:
+                visited.add(module_id)
+                path.append(module_id)
+                module_id = next(dependency for dependency in module_dependencies[module_id] if in_degree[dependency] > 0)
+            cycle = path[path.index(module_id):] + [module_id]
+            raise ValueError(f"Circular dependency detected between modules: {' -> '.join(cycle)}")
+        return module_order
+
+    def _get_module_dependencies(self, module_config: ModuleConfig, module_class: Type = None) -> dict[str, list[str]]:
         """Get dependencies for a module from exchange config.
         """
-        module_class = self.config._import_module_class(module_config.module)
-
-        types = defaultdict(list)
-        dependencies = {}
-        for param, type_hint in self._get_module_parameters(module_class):
-            args = get_args(type_hint)
-            if len(args) == 0:
-                types[type_hint.__name__].append(param)
-            else:
-                types[args[0].__name__].append(param)
+        if module_class is None:
+            module_class = self.config._import_module_class(module_config.module)
 
-            dependencies[param] = []
+        types = _get_params_by_type(module_class)
+        dependencies = {param: [] for param, _ in self._get_module_parameters(module_class)}
 
         # When an override exchange does not provide a module, it is meant for all modules
-        relevant_exchange_configs = [e for e in self.config.exchange if e.module == module_config.id or e.module is None]
+        relevant_exchange_configs = chain(
+            self._exchange_by_module.get(module_config.id, ()),
+            self._exchange_by_module.get(None, ())
+        )
         for exchange_config in relevant_exchange_configs:
             if exchange_config.field_name is not None:
                 param_list = [exchange_config.field_name]
             else:
-                param_list = types[exchange_config.protocol]
+                param_list = types.get(exchange_config.protocol, ())
             for param in param_list:
                 if isinstance(exchange_config.provider, list):
                     dependencies[param].extend(exchange_config.provider)
@@ -157,13 +262,12 @@ class Exchange:
 
     def _get_module_parameters(self, module_class):
         """Get the injectable parameters for the given module class."""
-        return ((param, param_type) for (param, param_type) in module_class.__init__.__annotations__.items() if param != 'config')
+        return _get_init_parameters(module_class)
 
     def _get_entry_module_id(self) -> Any:
         """Get the entry module from exchange config."""
-        for exchange in self.config.exchange:
-            if exchange.module == "__entry__":
-                return exchange.provider
+        for exchange in self._exchange_by_module.get("__entry__", ()):
+            return exchange.provider
         raise ValueError("No message handler found in exchange config")
 
     def get_module(self, module_id: str, caller_id: str, raise_on_not_found: bool = False):
@@ -179,14 +283,22 @@ class Exchange:
         """
         if module_id == '__entry__':
             module_id = self._get_entry_module_id()
+
+        # proxies are reused so their method proxies are only built once per caller
+        proxy = self._proxies.get((module_id, caller_id))
+        if proxy is not None:
+            return proxy
+
         module = self.module_instances.get(module_id)
 
         if module:
-            return Proxy(module,
-                         event_listeners=self.event_listeners,
-                         agent_id=self.config.id,
-                         caller_id=caller_id,
-                         module_id=module_id)
+            proxy = Proxy(module,
+                          event_listeners=self.event_listeners,
+                          agent_id=self.config.id,
+                          caller_id=caller_id,
+                          module_id=module_id)
+            self._proxies[(module_id, caller_id)] = proxy
+            return proxy
         else:
             if raise_on_not_found:
                 raise ValueError(f"Requested module {module_id} could not be found!")
@@ -200,6 +312,13 @@ class MethodProxy:
     to the parent object to preserve the method's context and emits events to registered listeners.
     """
 
+    # one proxy exists per method, caller and agent instance, so they don't carry a per-instance __dict__
+    __slots__ = (
+        "_method", "_parent", "_event_listeners", "_next_call_id", "_agent_id", "_caller_id", "_module_id",
+        "_call_id_prefix", "_has_listeners", "_event_name_base", "_module_class_name", "_method_name",
+        "_dispatch_by_type"
+    )
+
     def __init__(self, method, parent, event_listeners=None, agent_id=None, caller_id=None, module_id=None):
         """Initialize the method proxy.
         
@@ -214,12 +333,42 @@ class MethodProxy:
         self._method = method
         self._parent = parent
         self._event_listeners = event_listeners or []
-        self._call_id = 0
+        self._next_call_id = count(1).__next__
         self._agent_id = agent_id
         self._caller_id = caller_id
         self._module_id = module_id
-
-    def _emit_event(self, event_type: EventType, result=None, arguments=None, exception=None):
+        self._call_id_prefix = f"{id(parent)}-{id(method)}-"
+        self._has_listeners = len(self._event_listeners) > 0
+        self._event_name_base = None
+        self._module_class_name = None
+        self._method_name = None
+        self._dispatch_by_type = {}
+
+    def _get_event_name_base(self) -> str:
+        """Get the `{package}.{class}.{method_name}` part of the event names, computed on first use."""
+        if self._event_name_base is None:
+            module_class = self._parent.__class__
+            self._module_class_name = module_class.__name__
+            self._method_name = self._method.__name__
+            self._event_name_base = f"{module_class.__module__}.{self._module_class_name}.{self._method_name}"
+        return self._event_name_base
+
+    def _get_dispatch(self, event_type: EventType) -> tuple[str, list]:
+        """Get the event name and the handlers whose prefix matches it for the given event type.
+
+        Every event of this method has the same name per type, so this is resolved once per type.
+        """
+        dispatch = self._dispatch_by_type.get(event_type)
+        if dispatch is None:
+            event_name = f"{self._get_event_name_base()}.{event_type.value}"
+            handlers = [
+                handler for prefix, handler in self._event_listeners
+                if not prefix or event_name.startswith(prefix)
+            ]
+            dispatch = self._dispatch_by_type[event_type] = (event_name, handlers)
+        return dispatch
+
+    def _emit_event(self, event_type: EventType, result=None, arguments=None, exception=None, call_id=None):
         """Emit an event to all registered listeners.
         
         Args:
@@ -227,37 +376,37 @@ class MethodProxy:
             result: Optional result value for RESULT events
             arguments: Optional arguments for CALL events
             exception: Optional exception for EXCEPTION events
+            call_id: ID of the call this event belongs to
         """
-        if len(self._event_listeners) == 0:
+        if not self._has_listeners:
             return
-        
-        method_name = self._method.__name__
-        module_class = self._parent.__class__.__name__
-        module_package = self._parent.__class__.__module__
-        
+
+        event_name, handlers = self._get_dispatch(event_type)
+        if len(handlers) == 0:
+            return
+
         event = Event(
-            event_name=f"{module_package}.{module_class}.{method_name}.{event_type.value}",
-            event_type=event_type,
-            module_class=module_class,
-            method_name=method_name,
-            time=time.time(),
-            result=result,
-            arguments=arguments,
-            exception=exception,
-            call_id=f"{id(self._parent)}-{id(self._method)}-{self._call_id}",
-            agent_id=self._agent_id,
-            caller_id=self._caller_id,
-            module_id=self._module_id
+            self._agent_id,
+            event_name,
+            event_type,
+            self._module_id,
+            self._module_class_name,
+            self._method_name,
+            time_ns() / 1e9,
+            call_id,
+            self._caller_id,
+            arguments,
+            result,
+            exception
         )
 
-        for prefix, handler in self._event_listeners:
-            if not prefix or event.event_name.startswith(prefix):
-                try:
-                    handler(event)
-                except:
-                    print("Exception during event handling")
-                    traceback.print_exc()
-                
+        for handler in handlers:
+            try:
+                handler(event)
+            except:
+                print("Exception during event handling")
+                traceback.print_exc()
+
     async def __call__(self, *args, **kwargs):
         """Forward calls to the wrapped method.
         
@@ -268,30 +417,44 @@ class MethodProxy:
         Returns:
             The result of calling the wrapped method
         """
-        self._call_id += 1
+        if not self._has_listeners:
+            # nothing to report, so skip all event bookkeeping
+            try:
+                return await self._method(*args, **kwargs)
+            except:
+                traceback.print_exc()
+                raise
+
+        # The proxy is shared between concurrent calls, so keep this call's id local
+        call_id = self._call_id_prefix + str(self._next_call_id())
         
         # Emit call event
         self._emit_event(
             EventType.CALL,
-            arguments={"args": args, "kwargs": kwargs}
+            arguments={"args": args, "kwargs": kwargs},
+            call_id=call_id
         )
 
         try:
             # Call method
             result = await self._method(*args, **kwargs)
         except:
+            # format the traceback once for both the event and stderr
+            exception = traceback.format_exc()
             self._emit_event(
                 EventType.EXCEPTION,
-                exception=traceback.format_exc()
+                exception=exception,
+                call_id=call_id
             )
-            traceback.print_exc()
+            sys.stderr.write(exception)
             raise
 
 
         # Emit result event
         self._emit_event(
             EventType.RESULT,
-            result=result
+            result=result,
+            call_id=call_id
         )
 
         return result
@@ -300,6 +463,106 @@ class MethodProxy:
         return f"MethodProxy({self._method.__name__})"
 
 
+class SyncMethodProxy(MethodProxy):
+    """A method proxy for callables that are not coroutine functions.
+
+    The wrapped callable is invoked directly, so synchronous methods and async generators can be used through
+    a Proxy as well. Callables can return awaitables without being coroutine functions, e.g. coroutine functions
+    wrapped by a decorator or a functools.partial. Those are awaited by the returned coroutine, which reports
+    their result or exception once they complete.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, *args, **kwargs):
+        """Forward calls to the wrapped callable.
+
+        Args:
+            *args: Positional arguments to pass to wrapped callable
+            **kwargs: Keyword arguments to pass to wrapped callable
+
+        Returns:
+            The result of calling the wrapped callable
+        """
+        if not self._has_listeners:
+            try:
+                result = self._method(*args, **kwargs)
+            except:
+                traceback.print_exc()
+                raise
+            if inspect.isawaitable(result):
+                return self._await_result(result)
+            return result
+
+        call_id = self._call_id_prefix + str(self._next_call_id())
+
+        self._emit_event(
+            EventType.CALL,
+            arguments={"args": args, "kwargs": kwargs},
+            call_id=call_id
+        )
+
+        try:
+            result = self._method(*args, **kwargs)
+        except:
+            # format the traceback once for both the event and stderr
+            exception = traceback.format_exc()
+            self._emit_event(
+                EventType.EXCEPTION,
+                exception=exception,
+                call_id=call_id
+            )
+            sys.stderr.write(exception)
+            raise
+
+        if inspect.isawaitable(result):
+            return self._await_result(result, call_id)
+
+        self._emit_event(
+            EventType.RESULT,
+            result=result,
+            call_id=call_id
+        )
+
+        return result
+
+    async def _await_result(self, awaitable, call_id=None):
+        """Await the awaitable returned by the wrapped callable, reporting how it completes.
+
+        Args:
+            awaitable: The awaitable returned by the wrapped callable
+            call_id: ID of the call the awaitable belongs to, None if no events are emitted
+
+        Returns:
+            The result of the awaitable
+        """
+        try:
+            result = await awaitable
+        except:
+            if call_id is None:
+                traceback.print_exc()
+                raise
+            exception = traceback.format_exc()
+            self._emit_event(
+                EventType.EXCEPTION,
+                exception=exception,
+                call_id=call_id
+            )
+            sys.stderr.write(exception)
+            raise
+
+        if call_id is not None:
+            self._emit_event(
+                EventType.RESULT,
+                result=result,
+                call_id=call_id
+            )
+        return result
+
+    def __repr__(self):
+        return f"SyncMethodProxy({self._method.__name__})"
+
+
 class Proxy:
     """A proxy class that wraps an object and delegates attribute access.
     
@@ -323,6 +586,7 @@ class Proxy:
         self._agent_id = agent_id
         self._caller_id = caller_id
         self._module_id = module_id
+        self._method_cache = {}
 
     def __getattr__(self, name):
         """Forward attribute access to the wrapped object.
@@ -333,9 +597,22 @@ class Proxy:
         Returns:
             The attribute value from the wrapped object, wrapped in a MethodProxy if callable
         """        
+        # dunder lookups are protocol plumbing, not module calls
+        if name.startswith('__') and name.endswith('__'):
+            return getattr(self._obj, name)
+
+        method_proxy = self._method_cache.get(name)
+        if method_proxy is not None:
+            return method_proxy
+
         attr = getattr(self._obj, name)
         if callable(attr):
-            return MethodProxy(attr, self._obj, self._event_listeners, self._agent_id, self._caller_id, self._module_id)
+            proxy_class = MethodProxy if inspect.iscoroutinefunction(attr) else SyncMethodProxy
+            method_proxy = proxy_class(attr, self._obj, self._event_listeners, self._agent_id, self._caller_id, self._module_id)
+            self._method_cache[name] = method_proxy
+            # later lookups are served from the instance dict without entering __getattr__
+            object.__setattr__(self, name, method_proxy)
+            return method_proxy
         return attr
 
     def __repr__(self):
@@ -1,7 +1,10 @@
+import json
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
+from pydantic_core import PydanticSerializationError
 
 
 class EventType(str, Enum):
@@ -10,7 +13,13 @@ class EventType(str, Enum):
     EXCEPTION = "exception"
 
 
-class Event(BaseModel):
+@dataclass(slots=True)
+class Event:
+    """Event emitted for calls between modules.
+
+    Events are created on every proxied method call, so this is a plain slotted
+    dataclass instead of a validated pydantic model.
+    """
     agent_id: str
     event_name: str
     event_type: EventType
@@ -23,3 +32,18 @@ class Event(BaseModel):
     arguments: dict[str, Any] | None = None
     result: Any | None = None
     exception: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert this event to a dictionary, serializing pydantic models in its arguments and result."""
+        return _event_adapter.dump_python(self)
+
+    def to_json(self) -> bytes:
+        """Serialize this event to JSON, using the repr of values that have no JSON representation."""
+        try:
+            return _event_adapter.dump_json(self, fallback=repr)
+        except PydanticSerializationError:
+            # e.g. binary data that is not valid UTF-8
+            return json.dumps(self.to_dict(), default=repr).encode()
+
+
+_event_adapter = TypeAdapter(Event)
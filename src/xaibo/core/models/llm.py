@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Optional, List, Dict, Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 from xaibo.core.models.tools import Tool
 
@@ -89,27 +89,13 @@ class LLMMessage(BaseModel):
 
 class LLMOptions(BaseModel):
     """Common options for LLM requests"""
-    temperature: Optional[float] = 1.0
-    top_p: Optional[float] = 1.0
+    temperature: Optional[float] = Field(default=1.0, ge=0, le=2)
+    top_p: Optional[float] = Field(default=1.0, ge=0, le=1)
     max_tokens: Optional[int] = None
     stop_sequences: Optional[List[str]] = None
     functions: Optional[List[Tool]] = None
     vendor_specific: Optional[Dict[str, Any]] = Field(default_factory=dict)
 
-    @field_validator('temperature')
-    @classmethod
-    def validate_temperature(cls, v):
-        if v is not None and (v < 0 or v > 2):
-            raise ValueError('temperature must be between 0 and 2')
-        return v
-
-    @field_validator('top_p')
-    @classmethod
-    def validate_top_p(cls, v):
-        if v is not None and (v < 0 or v > 1):
-            raise ValueError('top_p must be between 0 and 1')
-        return v
-
 
 class LLMUsage(BaseModel):
     """Token usage statistics from an LLM response"""
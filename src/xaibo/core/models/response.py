@@ -11,6 +11,8 @@ class FileType(Enum):
 
 class FileAttachment:
     """Model for file attachments in responses"""
+    __slots__ = ("content", "type")
+
     content: BinaryIO
     type: FileType
 
@@ -20,10 +22,31 @@ class FileAttachment:
 
 
 class Response:
-    """Model for responses that can include text and file attachments"""
-    text: Optional[str] = None
-    attachments: List[FileAttachment] = []
+    """Model for responses that can include text and file attachments
+
+    Text added with add_text is joined lazily, when text is read, as appending to a str copies it every time.
+    """
+    __slots__ = ("_text_parts", "attachments")
+
+    attachments: List[FileAttachment]
 
     def __init__(self, text: Optional[str] = None, attachments: Optional[List[FileAttachment]] = None) -> None:
-        self.text = text
+        self._text_parts: List[str] = [] if text is None else [text]
         self.attachments = attachments or []
+
+    @property
+    def text(self) -> Optional[str]:
+        """The text of the response, None if no text was added"""
+        if not self._text_parts:
+            return None
+        if len(self._text_parts) > 1:
+            self._text_parts = ["".join(self._text_parts)]
+        return self._text_parts[0]
+
+    @text.setter
+    def text(self, text: Optional[str]) -> None:
+        self._text_parts = [] if text is None else [text]
+
+    def add_text(self, text: str) -> None:
+        """Append text to the response"""
+        self._text_parts.append(text)
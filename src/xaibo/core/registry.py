@@ -1,3 +1,4 @@
+import threading
 from typing import Callable, Union, Type, Optional
 
 from .agent import Agent
@@ -15,8 +16,15 @@ class Registry:
 
     def __init__(self):
         """Initialize a new Registry instance with an empty configuration dictionary."""
+        # Agents are registered rarely but instantiated for every request, possibly from several threads.
+        # Registration replaces these dicts with updated copies under a lock, so readers never need a lock.
+        self._registration_lock = threading.Lock()
         self.known_agent_configs: dict[str, AgentConfig] = dict()
         self.event_listeners: list[tuple[str, str | None, callable]] = []
+        # bumped by register_event_listener and unregister_event_listener, so cached filtered lists can't go stale
+        self._event_listeners_version = 0
+        # listeners that apply to an agent, by agent id, see _get_agent_listeners
+        self._agent_listeners: dict[str, tuple[tuple[int, int], list[tuple[str, callable]]]] = dict()
         self.server_module_instances: dict[str, object] = dict()
         self.agent_module_instances: dict[str, dict[str, object]] = dict()
 
@@ -33,14 +41,17 @@ class Registry:
         Args:
             agent_config (AgentConfig): The configuration to register
         """
-        self.known_agent_configs[agent_config.id] = agent_config
-        self.agent_module_instances[agent_config.id] = dict()
+        module_instances = dict()
         agent_lifecycle_modules = [m.id for m in agent_config.modules if m.scope == Scope.Agent]
         if len(agent_lifecycle_modules) > 0:
             exchange = Exchange(agent_config, specific_modules=agent_lifecycle_modules)
             for module_id in agent_lifecycle_modules:
-                self.agent_module_instances[agent_config.id][module_id] = exchange.module_instances[module_id]
+                module_instances[module_id] = exchange.module_instances[module_id]
 
+        with self._registration_lock:
+            # publish the module instances first, so a reader that finds the config also finds them
+            self.agent_module_instances = {**self.agent_module_instances, agent_config.id: module_instances}
+            self.known_agent_configs = {**self.known_agent_configs, agent_config.id: agent_config}
 
     def unregister_agent(self, agent_id: str) -> None:
         """Unregister an agent configuration.
@@ -48,9 +59,11 @@ class Registry:
         Args:
             agent_id (str): The ID of the agent configuration to unregister
         """
-        if agent_id in self.known_agent_configs:
-            del self.known_agent_configs[agent_id]
-            del self.agent_module_instances[agent_id]
+        with self._registration_lock:
+            if agent_id in self.known_agent_configs:
+                # withdraw the config first, so readers stop finding the agent before its module instances go
+                self.known_agent_configs = {k: v for k, v in self.known_agent_configs.items() if k != agent_id}
+                self.agent_module_instances = {k: v for k, v in self.agent_module_instances.items() if k != agent_id}
 
     def get_agent_config(self, agent_id: str) -> AgentConfig:
         """Get the configuration for a registered agent.
@@ -64,9 +77,10 @@ class Registry:
         Raises:
             KeyError: If no agent configuration is found for the given ID
         """
-        if agent_id not in self.known_agent_configs:
+        config = self.known_agent_configs.get(agent_id)
+        if config is None:
             raise KeyError(f"No agent configuration found for id: {agent_id}")
-        return self.known_agent_configs[agent_id]
+        return config
 
     def list_agents(self) -> list[str]:
         """Get a list of IDs for all registered agent configurations.
@@ -99,15 +113,14 @@ class Registry:
         Returns:
             Agent: A new agent instance with the specified bindings
         """
-        if id not in self.known_agent_configs:
+        config = self.known_agent_configs.get(id)
+        if config is None:
             raise KeyError(f"No agent configuration found for id: {id}")
-        config = self.known_agent_configs[id]
-        
-        # Filter event listeners for this agent
-        agent_listeners = [
-            (prefix, handler) for prefix, agent_filter, handler in self.event_listeners 
-            if agent_filter is None or agent_filter == id
-        ]
+        # if the agent is unregistered concurrently, its agent scoped modules may be gone already and are created anew
+        agent_module_instances = self.agent_module_instances.get(id, {})
+
+        # Copy the event listeners for this agent, as additional ones are added to the list
+        agent_listeners = list(self._get_agent_listeners(id))
 
         # Add any additional event listeners
         if additional_event_listeners:
@@ -121,7 +134,7 @@ class Registry:
             override_config=ConfigOverrides(
                 instances=dict(
                     list(override_config.instances.items()) +
-                    list(self.agent_module_instances[id].items()) +
+                    list(agent_module_instances.items()) +
                     list(self.server_module_instances.items())
                 ),
                 exchange=(
@@ -139,6 +152,25 @@ class Registry:
 
         return Agent(id=id, exchange=exchange)
     
+    def _get_agent_listeners(self, agent_id: str) -> list[tuple[str, callable]]:
+        """Get the (prefix, handler) pairs of the event listeners that apply to an agent, in registration order.
+
+        The filtered list is kept until a listener is registered or unregistered, or the length of event_listeners
+        changes otherwise. The returned list is shared, callers must not modify it.
+        """
+        # taken before filtering, so a listener registered meanwhile invalidates the new entry
+        version = (self._event_listeners_version, len(self.event_listeners))
+        cached = self._agent_listeners.get(agent_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        agent_listeners = [
+            (prefix, handler) for prefix, agent_filter, handler in list(self.event_listeners)
+            if agent_filter is None or agent_filter == agent_id
+        ]
+        self._agent_listeners[agent_id] = (version, agent_listeners)
+        return agent_listeners
+
     def register_event_listener(self, prefix: str, handler: Callable[[Event], None], agent_id: str | None = None) -> None:
         """Register an event listener for module events.
 
@@ -156,4 +188,21 @@ class Registry:
                               - result: Method result (for RESULT events)
             agent_id (str | None): Optional agent ID to filter events for
         """
-        self.event_listeners.append((prefix, agent_id, handler))
\ No newline at end of file
+        with self._registration_lock:
+            self.event_listeners.append((prefix, agent_id, handler))
+            self._event_listeners_version += 1
+
+    def unregister_event_listener(self, prefix: str, handler: Callable[[Event], None], agent_id: str | None = None) -> None:
+        """Unregister an event listener.
+
+        Agents that were created before keep calling it.
+
+        Args:
+            prefix (str): Event prefix the listener was registered with
+            handler (Callable[[Event], None]): The registered handler
+            agent_id (str | None): Agent ID the listener was registered with
+        """
+        with self._registration_lock:
+            if (prefix, agent_id, handler) in self.event_listeners:
+                self.event_listeners.remove((prefix, agent_id, handler))
+                self._event_listeners_version += 1
\ No newline at end of file
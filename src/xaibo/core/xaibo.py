@@ -81,6 +81,16 @@ class Xaibo:
         """
         self.registry.register_event_listener(prefix, handler, agent_id=agent_id)
 
+    def unregister_event_listener(self, prefix: str, handler: Callable[[Event], None], agent_id: str | None = None):
+        """Unregister an event listener, agents created afterwards no longer call it.
+
+        Args:
+            prefix (str): Event prefix the listener was registered with
+            handler (Callable[[Event], None]): The registered handler
+            agent_id (str | None): Agent ID the listener was registered with
+        """
+        self.registry.unregister_event_listener(prefix, handler, agent_id=agent_id)
+
     def get_agent(self, agent_id: str) -> Agent:
         """Create and return an agent instance with default bindings.
 
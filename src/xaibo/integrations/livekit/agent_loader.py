@@ -25,6 +25,7 @@ class XaiboAgentLoader:
         """Initialize the XaiboAgentLoader with a new Xaibo instance."""
         self._xaibo = Xaibo()
         self._configs: Dict[str, AgentConfig] = {}
+        self._config_cache = {}
         self._debug_enabled = False
         self._debug_dir: Optional[str] = None
         self._watcher_task: Optional[asyncio.Task] = None
@@ -51,7 +52,8 @@ class XaiboAgentLoader:
         
         try:
             # Load all agent configurations from the directory
-            new_configs = AgentConfig.load_directory(directory)
+            # unchanged files keep their config instance, so they need neither parsing nor a deep comparison
+            new_configs = AgentConfig.load_directory(directory, cache=self._config_cache)
             
             # Unregister removed agents
             for path in set(self._configs.keys()) - set(new_configs.keys()):
@@ -61,7 +63,10 @@ class XaiboAgentLoader:
             
             # Register new/changed agents
             for path, config in new_configs.items():
-                if path not in self._configs or self._configs[path] != config:
+                old_config = self._configs.get(path)
+                if old_config is config:
+                    continue
+                if old_config is None or old_config != config:
                     self._xaibo.register_agent(config)
                     logger.info(f"Registered agent: {config.id} from {path}")
             
@@ -1,7 +1,7 @@
 import asyncio
 import uuid
 from typing import Any
-from asyncio import Queue, create_task, wait_for, TimeoutError
+from asyncio import Queue, create_task, wait, FIRST_COMPLETED
 
 from livekit.agents import llm
 from livekit.agents.llm import (
@@ -24,6 +24,14 @@ from xaibo.core.models.llm import LLMMessage, LLMRole, LLMMessageContent, LLMMes
 from .log import logger
 
 
+# Role mapping from LiveKit to Xaibo
+_ROLE_MAP = {
+    "system": LLMRole.SYSTEM,
+    "user": LLMRole.USER,
+    "assistant": LLMRole.ASSISTANT,
+    "developer": LLMRole.SYSTEM,  # Map developer to system
+}
+
 class XaiboLLM(llm.LLM):
     """
     Xaibo LLM implementation that integrates with Xaibo's agent system.
@@ -79,8 +87,8 @@ class XaiboLLM(llm.LLM):
         Returns:
             XaiboLLMStream: A stream for processing the chat
         """
-        # Convert LiveKit ChatContext to Xaibo conversation
-        conversation = self._convert_chat_context_to_conversation(chat_ctx)
+        # Convert LiveKit ChatContext to Xaibo conversation and find the last user message in one pass
+        conversation, text_input = self._convert_chat_context_to_conversation(chat_ctx)
         
         return XaiboLLMStream(
             llm=self,
@@ -90,70 +98,85 @@ class XaiboLLM(llm.LLM):
             xaibo=self._xaibo,
             agent_id=self._agent_id,
             conversation=conversation,
+            text_input=text_input,
         )
 
-    def _convert_chat_context_to_conversation(self, chat_ctx: ChatContext) -> SimpleConversation:
+    def _convert_chat_context_to_conversation(self, chat_ctx: ChatContext) -> tuple[SimpleConversation, str]:
         """
-        Convert LiveKit ChatContext directly to Xaibo's SimpleConversation format.
+        Convert LiveKit ChatContext directly to Xaibo's SimpleConversation format
+        and extract the last user message for agents that only handle text.
+
+        The messages are converted on every turn, chat items can still change between
+        turns and every conversation needs its own messages.
         
         Args:
             chat_ctx: The LiveKit chat context
             
         Returns:
-            SimpleConversation: Populated conversation instance
+            tuple[SimpleConversation, str]: Populated conversation instance and the last
+            user message text, or empty string if none found
         """
         conversation = SimpleConversation()
-        
-        # Role mapping from LiveKit to Xaibo
-        role_map = {
-            "system": LLMRole.SYSTEM,
-            "user": LLMRole.USER,
-            "assistant": LLMRole.ASSISTANT,
-            "developer": LLMRole.SYSTEM,  # Map developer to system
-        }
-        
+        history = conversation._history
+        last_user_message = ""
+
         for item in chat_ctx.items:
-            if item.type == "message":
-                role = role_map.get(item.role, LLMRole.USER)
-                content = item.text_content
-                
-                if content:
-                    # Create LLMMessage with text content
-                    message = LLMMessage(
-                        role=role,
-                        content=[LLMMessageContent(
-                            type=LLMMessageContentType.TEXT,
-                            text=content
-                        )]
-                    )
-                    conversation._history.append(message)
-                    
-            elif item.type == "function_call":
-                # Handle function calls as assistant messages with tool calls
-                # For now, convert to text representation
-                function_text = f"Function Call: {item.name}({item.arguments})"
-                message = LLMMessage(
-                    role=LLMRole.ASSISTANT,
-                    content=[LLMMessageContent(
-                        type=LLMMessageContentType.TEXT,
-                        text=function_text
-                    )]
-                )
-                conversation._history.append(message)
-                
-            elif item.type == "function_call_output":
-                # Handle function outputs as function result messages
-                output_text = f"Function Output: {item.output}"
-                message = LLMMessage(
-                    role=LLMRole.FUNCTION,
-                    content=[LLMMessageContent(
-                        type=LLMMessageContentType.TEXT,
-                        text=output_text
-                    )]
-                )
-                conversation._history.append(message)
-        
-        return conversation
+            message = _convert_chat_item(item)
+            if message is not None:
+                history.append(message)
+                if item.type == "message" and item.role == "user":
+                    last_user_message = message.content[0].text
+
+        return conversation, last_user_message
+
+
+def _convert_chat_item(item) -> LLMMessage | None:
+    """
+    Convert a single LiveKit chat item to an LLMMessage.
+
+    Args:
+        item: The LiveKit chat item
+
+    Returns:
+        LLMMessage | None: The converted message, or None if the item has no conversation content
+    """
+    if item.type == "message":
+        content = item.text_content
+
+        if content:
+            # Create LLMMessage with text content
+            return LLMMessage(
+                role=_ROLE_MAP.get(item.role, LLMRole.USER),
+                content=[LLMMessageContent(
+                    type=LLMMessageContentType.TEXT,
+                    text=content
+                )]
+            )
+
+    elif item.type == "function_call":
+        # Handle function calls as assistant messages with tool calls
+        # For now, convert to text representation
+        function_text = f"Function Call: {item.name}({item.arguments})"
+        return LLMMessage(
+            role=LLMRole.ASSISTANT,
+            content=[LLMMessageContent(
+                type=LLMMessageContentType.TEXT,
+                text=function_text
+            )]
+        )
+
+    elif item.type == "function_call_output":
+        # Handle function outputs as function result messages
+        output_text = f"Function Output: {item.output}"
+        return LLMMessage(
+            role=LLMRole.FUNCTION,
+            content=[LLMMessageContent(
+                type=LLMMessageContentType.TEXT,
+                text=output_text
+            )]
+        )
+
+    return None
 
 
 class XaiboLLMStream(llm.LLMStream):
@@ -175,6 +198,7 @@ class XaiboLLMStream(llm.LLMStream):
         xaibo: Xaibo,
         agent_id: str,
         conversation: SimpleConversation,
+        text_input: str = "",
     ) -> None:
         """
         Initialize the Xaibo LLM stream.
@@ -187,11 +211,13 @@ class XaiboLLMStream(llm.LLMStream):
             xaibo: The Xaibo instance
             agent_id: The agent ID to use
             conversation: The conversation history
+            text_input: The last user message, used as text input for the agent
         """
         super().__init__(llm, chat_ctx=chat_ctx, tools=tools, conn_options=conn_options)
         self._xaibo = xaibo
         self._agent_id = agent_id
         self._conversation = conversation
+        self._text_input = text_input
         self._request_id = str(uuid.uuid4())
         self._streaming_timeout = 10.0  # Timeout for waiting for chunks
 
@@ -207,8 +233,8 @@ class XaiboLLMStream(llm.LLMStream):
         5. Converts chunks to LiveKit ChatChunk format in real-time
         """
         try:
-            # Extract the last user message for text-based processing
-            text_input = self._convert_chat_context_to_text(self._chat_ctx)
+            # The last user message is used for text-based processing
+            text_input = self._text_input
             
             logger.debug(
                 f"Sending text to Xaibo agent {self._agent_id}: {text_input[:100]}..."
@@ -256,29 +282,6 @@ class XaiboLLMStream(llm.LLMStream):
             logger.error(f"Error in XaiboLLMStream._run: {e}", exc_info=True)
             raise
 
-    def _convert_chat_context_to_text(self, chat_ctx: ChatContext) -> str:
-        """
-        Convert LiveKit ChatContext to a text string, extracting the last user message.
-        This is used as a fallback for agents that only handle text-based processing.
-        
-        Args:
-            chat_ctx: The LiveKit chat context
-            
-        Returns:
-            str: The last user message text, or empty string if none found
-        """
-        # Extract the last user message from the ChatContext
-        last_user_message = ""
-        
-        for item in reversed(chat_ctx.items):
-            if item.type == "message" and item.role == "user":
-                content = item.text_content
-                if content:
-                    last_user_message = content
-                    break
-        
-        return last_user_message
-
     def _create_streaming_response_handler(self, chunk_queue: Queue):
         """
         Create a streaming response handler that puts chunks into a queue.
@@ -308,43 +311,54 @@ class XaiboLLMStream(llm.LLMStream):
             chunk_queue: The queue containing streaming text chunks
             agent_task: The background task running the agent
         """
-        total_content = ""
+        sent_chunks = []
         
         while True:
             try:
-                # Check if agent task is done
-                if agent_task.done():
+                # Wait for the next chunk or the end of the agent, whichever comes first,
+                # so the stream is closed as soon as the agent is done
+                next_chunk = create_task(chunk_queue.get())
+                done, _ = await wait({next_chunk, agent_task}, timeout=self._streaming_timeout, return_when=FIRST_COMPLETED)
+
+                if next_chunk in done:
+                    chunk_text = next_chunk.result()
+                else:
+                    next_chunk.cancel()
+                    if not agent_task.done():
+                        # Continue waiting on timeout
+                        continue
+
                     # Check for agent task exceptions
                     if agent_task.exception():
                         logger.error(f"Agent task failed: {agent_task.exception()}")
                         raise agent_task.exception()
-                    
-                    # Send final usage chunk and exit
-                    await self._send_final_usage_chunk(total_content)
-                    break
 
-                # Wait for next chunk with timeout
-                try:
-                    chunk_text = await wait_for(chunk_queue.get(), timeout=self._streaming_timeout)
-                    
-                    # Create and send chat chunk
-                    chunk = ChatChunk(
-                        id=self._request_id,
-                        delta=ChoiceDelta(
-                            role=None,  # Role already set in initial chunk
-                            content=chunk_text,
-                            tool_calls=[],
-                        ),
-                    )
-                    
-                    self._event_ch.send_nowait(chunk)
-                    total_content += chunk_text
-                    
-                    logger.debug(f"Sent streaming chunk: {chunk_text[:50]}...")
-                    
-                except TimeoutError:
-                    # Continue checking if agent is done on timeout
-                    continue
+                    if chunk_queue.empty():
+                        # Send final usage chunk and exit
+                        await self._send_final_usage_chunk("".join(sent_chunks))
+                        break
+
+                    # Forward chunks that were queued right before the agent finished
+                    chunk_text = chunk_queue.get_nowait()
+
+                # Agents may respond word by word, so send everything that is already
+                # queued as a single chat chunk instead of one chunk per piece
+                if not chunk_queue.empty():
+                    pieces = [chunk_text]
+                    while not chunk_queue.empty():
+                        pieces.append(chunk_queue.get_nowait())
+                    chunk_text = "".join(pieces)
+
+                # Create and send chat chunk, the role was already set in the initial chunk
+                chunk = ChatChunk(
+                    id=self._request_id,
+                    delta=ChoiceDelta(content=chunk_text),
+                )
+
+                self._event_ch.send_nowait(chunk)
+                sent_chunks.append(chunk_text)
+
+                logger.debug(f"Sent streaming chunk: {chunk_text[:50]}...")
                     
             except Exception as e:
                 logger.error(f"Error in streaming loop: {e}", exc_info=True)
@@ -0,0 +1,89 @@
+import asyncio
+import queue
+import threading
+import traceback
+from typing import Callable
+
+from xaibo.core.models.events import Event
+
+_STOP = object()
+
+
+class QueuedEventListener:
+    """Event listener that hands events to another handler on a background thread.
+
+    Event handlers are called inline with the module calls they observe, so a slow handler, e.g. one writing
+    every event to disk, delays every traced call. Wrapping it in this listener reduces the inline work to putting
+    the event into a bounded queue. When the queue is full, events are dropped and counted in `dropped`.
+
+    Events reference the live arguments and results of the calls, which may be modified after the event was
+    queued. Handlers that need the state at call time should not be wrapped.
+
+    flush and close block until the background thread caught up, so they must not be called on a running event
+    loop. Use aflush and aclose there instead.
+    """
+
+    def __init__(self, handler: Callable[[Event], None], max_queue_size: int = 8192):
+        """Initialize the queued event listener.
+
+        Args:
+            handler: The handler to call with every event on the background thread
+            max_queue_size: Maximum number of events waiting to be handled (default: 8192)
+        """
+        self.handler = handler
+        self.dropped = 0
+        self._closed = False
+        # guards dropped and _closed, so no event is queued after the stop marker
+        self._lock = threading.Lock()
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="xaibo-queued-event-listener", daemon=True)
+        self._thread.start()
+
+    def handle_event(self, event: Event) -> None:
+        """Queue an event for the background thread, events after close are dropped.
+
+        Args:
+            event: The event to handle
+        """
+        with self._lock:
+            if not self._closed:
+                try:
+                    self._queue.put_nowait(event)
+                    return
+                except queue.Full:
+                    pass
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Wait until all queued events have been handled."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Handle the remaining events and stop the background thread. Closing again has no effect."""
+        with self._lock:
+            closing = not self._closed
+            self._closed = True
+        if closing:
+            self._queue.put(_STOP)
+        self._thread.join()
+
+    async def aflush(self) -> None:
+        """Wait until all queued events have been handled, without blocking the event loop."""
+        await asyncio.to_thread(self.flush)
+
+    async def aclose(self) -> None:
+        """Close the listener, without blocking the event loop."""
+        await asyncio.to_thread(self.close)
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                if event is _STOP:
+                    return
+                self.handler(event)
+            except:
+                print("Exception during event handling")
+                traceback.print_exc()
+            finally:
+                self._queue.task_done()
@@ -24,4 +24,5 @@ except ImportError:
     BedrockLLM = None
 
 
-from .combinator import LLMCombinator
\ No newline at end of file
+from .combinator import LLMCombinator
+from .cache import LLMCache, SemanticLLMCache
@@ -5,12 +5,16 @@ from typing import List, Optional, AsyncIterator, Dict, Any
 
 from xaibo.core.protocols.llm import LLMProtocol
 from xaibo.core.models.llm import LLMMessage, LLMMessageContentType, LLMOptions, LLMResponse, LLMFunctionCall, LLMUsage, LLMRole
+from xaibo.core.models.tools import Tool
+from xaibo.primitives.modules.llm.tool_definitions import ToolDefinitionCache
 
 logger = logging.getLogger(__name__)
 
 
 class AnthropicLLM(LLMProtocol):
     """Implementation of LLMProtocol for Anthropic API"""
+
+    _tool_schemas = ToolDefinitionCache()
     
     def __init__(
         self,
@@ -169,33 +173,34 @@ class AnthropicLLM(LLMProtocol):
         
         return schema
 
+    def _build_tool_schema(self, tool: Tool) -> Dict[str, Any]:
+        """Build the Anthropic tool definition for a tool"""
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": {
+                "type": "object",
+                "properties": {
+                    param_name: {
+                        **self._build_parameter_schema(param),
+                        "description": param.description + (f" Default: {param.default}" if param.default is not None else ""),
+                        **({"enum": param.enum} if param.enum else {})
+                    }
+                    for param_name, param in tool.parameters.items()
+                },
+                "required": [
+                    param_name for param_name, param in tool.parameters.items()
+                    if param.required
+                ]
+            }
+        }
+
     def _prepare_tools(self, options: LLMOptions) -> Optional[List[Dict[str, Any]]]:
         """Prepare tool calling if needed"""
         if not options.functions:
             return None
-            
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": {
-                    "type": "object",
-                    "properties": {
-                        param_name: {
-                            **self._build_parameter_schema(param),
-                            "description": param.description + (f" Default: {param.default}" if param.default is not None else ""),
-                            **({"enum": param.enum} if param.enum else {})
-                        }
-                        for param_name, param in tool.parameters.items()
-                    },
-                    "required": [
-                        param_name for param_name, param in tool.parameters.items()
-                        if param.required
-                    ]
-                }
-            }
-            for tool in options.functions
-        ]
+
+        return [self._tool_schemas.get(tool, self._build_tool_schema) for tool in options.functions]
     
     def _prepare_request_kwargs(self, 
                                anthropic_messages: List[Dict[str, Any]], 
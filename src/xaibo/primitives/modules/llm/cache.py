@@ -0,0 +1,297 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import List, Optional, AsyncIterator, Dict, Any, Deque
+
+import numpy as np
+
+from xaibo.core.protocols.llm import LLMProtocol
+from xaibo.core.protocols.memory import EmbeddingProtocol
+from xaibo.core.models.llm import LLMMessage, LLMMessageContentType, LLMOptions, LLMResponse, LLMRole
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache(LLMProtocol):
+    """Caches the responses of another language model for identical requests.
+
+    Requests are identified by a hash of their messages and options. By default only deterministic
+    requests, i.e. those with a temperature of 0, are cached, as sampled responses are expected to vary.
+    Streaming requests are always passed through.
+    """
+
+    def __init__(
+            self,
+            llm: LLMProtocol,
+            config: Dict[str, Any] = None
+    ):
+        """
+        Initialize the LLMCache module.
+
+        Args:
+            llm: The LLM whose responses are cached
+            config: Configuration dictionary with the following optional keys:
+                - max_entries: Number of responses kept in memory. Defaults to 1024.
+                - cache_dir: Directory to persist responses in, so they survive restarts. Defaults to None,
+                  keeping responses in memory only.
+                - cache_namespace: Part of every cache key, so differently configured LLMs sharing a cache_dir
+                  don't reuse each other's responses. Defaults to the model of the wrapped LLM.
+                - cache_sampled: Also cache requests with a temperature above 0. Defaults to False.
+        """
+        config = config or {}
+        self.llm = llm
+        self.max_entries = config.get('max_entries', 1024)
+        self.cache_dir = Path(config['cache_dir']) if config.get('cache_dir') else None
+        self.cache_namespace = config.get('cache_namespace', _default_namespace(llm))
+        self.cache_sampled = config.get('cache_sampled', False)
+
+        self._responses: OrderedDict[str, LLMResponse] = OrderedDict()
+
+    async def generate(
+            self,
+            messages: List[LLMMessage],
+            options: Optional[LLMOptions] = None
+    ) -> LLMResponse:
+        """Generate a response, reusing the response of an identical earlier request if there is one.
+
+        Args:
+            messages: List of input messages
+            options: Optional generation options that are passed to the wrapped LLM
+
+        Returns:
+            The response of the wrapped LLM
+        """
+        if not self._is_cacheable(options):
+            return await self.llm.generate(messages, options)
+
+        key = self._cache_key(messages, options)
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+            return response.model_copy(deep=True)
+
+        if self.cache_dir is not None:
+            response = await asyncio.to_thread(self._read_response, key)
+            if response is not None:
+                self._remember(key, response)
+                return response.model_copy(deep=True)
+
+        response = await self.llm.generate(messages, options)
+        self._remember(key, response.model_copy(deep=True))
+        if self.cache_dir is not None:
+            await asyncio.to_thread(self._write_response, key, response)
+        return response
+
+    async def generate_stream(
+            self,
+            messages: List[LLMMessage],
+            options: Optional[LLMOptions] = None
+    ) -> AsyncIterator[str]:
+        """Stream a response from the wrapped LLM without caching it.
+
+        Args:
+            messages: List of input messages
+            options: Optional generation options that are passed to the wrapped LLM
+
+        Yields:
+            Text chunks of the wrapped LLM
+        """
+        async for chunk in self.llm.generate_stream(messages, options):
+            yield chunk
+
+    def _is_cacheable(self, options: Optional[LLMOptions]) -> bool:
+        """Check whether the response to a request with the given options may be reused."""
+        if self.cache_sampled:
+            return True
+        # without options the default temperature of 1.0 applies
+        return options is not None and options.temperature == 0
+
+    def _cache_key(self, messages: List[LLMMessage], options: Optional[LLMOptions]) -> str:
+        """Hash the parts of a request that determine its response."""
+        request = {
+            "namespace": self.cache_namespace,
+            "messages": [message.model_dump(mode="json", fallback=repr) for message in messages],
+            "options": options.model_dump(mode="json", fallback=repr) if options is not None else None
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def _remember(self, key: str, response: LLMResponse) -> None:
+        """Keep a response in memory, evicting the least recently used ones beyond max_entries."""
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_entries:
+            self._responses.popitem(last=False)
+
+    def _read_response(self, key: str) -> Optional[LLMResponse]:
+        """Read a persisted response, or None if there is no usable one."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            return LLMResponse.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached response {path}: {str(e)}")
+            return None
+
+    def _write_response(self, key: str, response: LLMResponse) -> None:
+        """Persist a response, writing it to a temporary file first so readers never see partial files."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(response.model_dump_json(fallback=repr).encode())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist cached response {path}: {str(e)}")
+
+
+def _default_namespace(llm: LLMProtocol) -> Optional[str]:
+    """The model of an LLM module, if it has one."""
+    model = getattr(llm, 'model', None)
+    return model if isinstance(model, str) else None
+
+
+class SemanticLLMCache(LLMCache):
+    """Caches the responses of another language model for requests with a similar last user message.
+
+    The text of a request's last user message is embedded, and the response of an earlier request is reused
+    when its embedding is similar enough. Everything else about the requests, i.e. the earlier messages, the
+    options, roles, images, tool calls and tool results, has to match exactly, so a long shared system prompt
+    or history can't make different questions look alike. Requests without a user message are only reused
+    when they are identical. Like LLMCache, only deterministic requests are cached by default and streaming
+    requests are always passed through. Responses are only kept in memory.
+    """
+
+    def __init__(
+            self,
+            llm: LLMProtocol,
+            embedder: EmbeddingProtocol,
+            config: Dict[str, Any] = None
+    ):
+        """
+        Initialize the SemanticLLMCache module.
+
+        Args:
+            llm: The LLM whose responses are cached
+            embedder: The embedder used to compare the last user messages of requests
+            config: Configuration dictionary with the following optional keys:
+                - similarity_threshold: Minimum cosine similarity for a cached response to be reused.
+                  Defaults to 0.92.
+                - max_entries: Number of responses kept in memory, the oldest ones are dropped first.
+                  Defaults to 1024.
+                - cache_sampled: Also cache requests with a temperature above 0. Defaults to False.
+        """
+        config = config or {}
+        super().__init__(llm, {k: v for k, v in config.items() if k != 'cache_dir'})
+        self.embedder = embedder
+        self.similarity_threshold = config.get('similarity_threshold', 0.92)
+
+        # normalized embeddings and their responses, grouped by the hash of the exactly matching request parts
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._semantic_responses: Dict[str, List[LLMResponse]] = {}
+        # the group of every kept response, oldest first
+        self._order: Deque[str] = deque()
+
+    async def generate(
+            self,
+            messages: List[LLMMessage],
+            options: Optional[LLMOptions] = None
+    ) -> LLMResponse:
+        """Generate a response, reusing the response of a similar earlier request if there is one.
+
+        Args:
+            messages: List of input messages
+            options: Optional generation options that are passed to the wrapped LLM
+
+        Returns:
+            The response of the wrapped LLM
+        """
+        if not self._is_cacheable(options):
+            return await self.llm.generate(messages, options)
+
+        index = self._last_user_message(messages)
+        text = self._message_text(messages[index]) if index is not None else ""
+        if not text:
+            return await super().generate(messages, options)
+
+        key = self._structure_key(messages, options, index)
+        embedding = np.asarray(await self.embedder.text_to_embedding(text), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding = embedding / norm
+
+        embeddings = self._embeddings.get(key)
+        if embeddings is not None and embeddings.shape[1] == embedding.shape[0]:
+            # cosine similarity against every cached request at once
+            similarities = embeddings @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                return self._semantic_responses[key][best].model_copy(deep=True)
+
+        response = await self.llm.generate(messages, options)
+        self._add(key, embedding, response.model_copy(deep=True))
+        return response
+
+    def _add(self, key: str, embedding: np.ndarray, response: LLMResponse) -> None:
+        """Keep a response, dropping the oldest ones of all groups beyond max_entries."""
+        embeddings = self._embeddings.get(key)
+        if embeddings is not None and embeddings.shape[1] != embedding.shape[0]:
+            # a different embedding dimension means the embedder changed, so older entries can't be compared
+            self._embeddings.clear()
+            self._semantic_responses.clear()
+            self._order.clear()
+            embeddings = None
+        if embeddings is None:
+            embeddings = np.empty((0, embedding.shape[0]), dtype=np.float32)
+            self._semantic_responses[key] = []
+        self._embeddings[key] = np.vstack([embeddings, embedding])
+        self._semantic_responses[key].append(response)
+        self._order.append(key)
+
+        while len(self._order) > self.max_entries:
+            oldest = self._order.popleft()
+            if len(self._semantic_responses[oldest]) == 1:
+                del self._embeddings[oldest]
+                del self._semantic_responses[oldest]
+            else:
+                self._embeddings[oldest] = self._embeddings[oldest][1:]
+                del self._semantic_responses[oldest][0]
+
+    @staticmethod
+    def _last_user_message(messages: List[LLMMessage]) -> Optional[int]:
+        """Find the index of the last user message, the one compared by its embedding."""
+        for i in range(len(messages) - 1, -1, -1):
+            if messages[i].role == LLMRole.USER:
+                return i
+        return None
+
+    @staticmethod
+    def _message_text(message: LLMMessage) -> str:
+        """Join the texts of a message."""
+        return "\n".join(
+            content.text
+            for content in message.content
+            if content.type == LLMMessageContentType.TEXT and content.text
+        )
+
+    @staticmethod
+    def _structure_key(messages: List[LLMMessage], options: Optional[LLMOptions], compared: int) -> str:
+        """Hash the parts of a request that have to match exactly, which is everything but the compared texts."""
+        request = {
+            "messages": [
+                message.model_dump(
+                    mode="json",
+                    fallback=repr,
+                    exclude={"content": {j: {"text"} for j in range(len(message.content))}} if i == compared else None
+                )
+                for i, message in enumerate(messages)
+            ],
+            "options": options.model_dump(mode="json", fallback=repr) if options is not None else None
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
@@ -7,7 +7,9 @@ from google.genai import types
 import base64
 
 from xaibo.core.models.llm import LLMMessage, LLMMessageContentType, LLMOptions, LLMResponse, LLMFunctionCall, LLMUsage, LLMRole
+from xaibo.core.models.tools import Tool
 from xaibo.core.protocols.llm import LLMProtocol
+from xaibo.primitives.modules.llm.tool_definitions import ToolDefinitionCache
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +17,8 @@ logger = logging.getLogger(__name__)
 class GoogleLLM(LLMProtocol):
     """Implementation of LLMProtocol for Google's Gemini API"""
 
+    _tool_declarations = ToolDefinitionCache()
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the Google Gemini LLM client.
@@ -151,6 +155,28 @@ class GoogleLLM(LLMProtocol):
         
         return schema_dict
 
+    def _build_tool(self, function: Tool) -> types.Tool:
+        """Build the Gemini tool declaration for a tool"""
+        properties = {}
+        for param_name, param in function.parameters.items():
+            schema_dict = self._build_parameter_schema(param)
+            # For array types, add items property
+            if schema_dict["type"] == "ARRAY":
+                # Create a simple items schema for arrays
+                schema_dict["items"] = {"type": "STRING"}
+            
+            properties[param_name] = types.Schema(**schema_dict)
+        
+        function_declaration = types.FunctionDeclaration(
+            name=function.name,
+            description=function.description,
+            parameters=types.Schema(
+                type='OBJECT',
+                properties=properties
+            )
+        )
+        return types.Tool(function_declarations=[function_declaration])
+
     def _prepare_config(self, options: Optional[LLMOptions]) -> types.GenerateContentConfig:
         """Prepare configuration for the API request"""
         if not options:
@@ -170,28 +196,7 @@ class GoogleLLM(LLMProtocol):
             
         # Handle functions/tools
         if options.functions:
-            tools = []
-            for function in options.functions:
-                properties = {}
-                for param_name, param in function.parameters.items():
-                    schema_dict = self._build_parameter_schema(param)
-                    # For array types, add items property
-                    if schema_dict["type"] == "ARRAY":
-                        # Create a simple items schema for arrays
-                        schema_dict["items"] = {"type": "STRING"}
-                    
-                    properties[param_name] = types.Schema(**schema_dict)
-                
-                function_declaration = types.FunctionDeclaration(
-                    name=function.name,
-                    description=function.description,
-                    parameters=types.Schema(
-                        type='OBJECT',
-                        properties=properties
-                    )
-                )
-                tools.append(types.Tool(function_declarations=[function_declaration]))
-            config_dict["tools"] = tools
+            config_dict["tools"] = [self._tool_declarations.get(function, self._build_tool) for function in options.functions]
             
         # Add any vendor-specific parameters
         if options.vendor_specific:
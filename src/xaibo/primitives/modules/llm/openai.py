@@ -1,20 +1,101 @@
 import os
 import json
+import asyncio
 import logging
+import weakref
 from typing import List, Optional, AsyncIterator, Dict, Any
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from openai.types.chat import ChatCompletion
 
 from xaibo.core.protocols.llm import LLMProtocol
 from xaibo.core.models.llm import LLMMessage, LLMMessageContentType, LLMOptions, LLMResponse, LLMFunctionCall, LLMUsage, LLMRole
+from xaibo.core.models.tools import Tool
+from xaibo.primitives.modules.llm.tool_definitions import ToolDefinitionCache
 
 
 logger = logging.getLogger(__name__)
 
+# Agents and their modules are usually created per request, so the HTTP clients are shared
+# by all OpenAILLM instances on an event loop to keep their connections alive between requests
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _SharedHttpClient]" = weakref.WeakKeyDictionary()
+# API clients by their connection settings, which the clients of the instances are copied from
+_api_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, AsyncOpenAI]]" = weakref.WeakKeyDictionary()
+
+
+class _SharedHttpClient(DefaultAsyncHttpxClient):
+    """HTTP client whose connection pool is shared by the OpenAILLM instances of an event loop.
+
+    The pool is owned by this module. Closing it through the API client of an instance would end the requests
+    of all other instances, so aclose does nothing and the pool is closed by aclose_shared_clients instead.
+    """
+
+    async def aclose(self) -> None:
+        pass
+
+    async def _close_pool(self) -> None:
+        await super().aclose()
+
+
+def _get_shared_http_client() -> Optional[httpx.AsyncClient]:
+    """Get the HTTP client shared on the running event loop, or None when there is no running loop"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    http_client = _http_clients.get(loop)
+    if http_client is None or http_client.is_closed:
+        http_client = _SharedHttpClient(
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60.0)
+        )
+        _http_clients[loop] = http_client
+    return http_client
+
+
+def _get_shared_client(api_key: str, base_url: str, timeout: float) -> AsyncOpenAI:
+    """Get an API client with the given settings that uses the connections shared on the running event loop.
+
+    Every call returns a new copy, so changes to the client of one instance don't affect the others.
+    Without a running event loop, a new client with its own HTTP client is created.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
+
+    clients = _api_clients.setdefault(loop, {})
+    key = (api_key, base_url, timeout)
+    client = clients.get(key)
+    if client is None or client.is_closed():
+        client = clients[key] = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            http_client=_get_shared_http_client()
+        )
+    # copying a configured client is much cheaper than creating a new one
+    return client.with_options()
+
+
+async def aclose_shared_clients() -> None:
+    """Close the connections shared by the OpenAILLM instances on the running event loop.
+
+    Call this when shutting down, e.g. in the lifespan of a server. Instances created afterwards open new
+    connections.
+    """
+    loop = asyncio.get_running_loop()
+    _api_clients.pop(loop, None)
+    http_client = _http_clients.pop(loop, None)
+    if http_client is not None:
+        await http_client._close_pool()
+
 
 class OpenAILLM(LLMProtocol):
     """Implementation of LLMProtocol for OpenAI API"""
+
+    _function_schemas = ToolDefinitionCache()
     
     def __init__(
         self,
@@ -43,12 +124,8 @@ class OpenAILLM(LLMProtocol):
         base_url = config.get('base_url', "https://api.openai.com/v1")
         timeout = config.get('timeout', 60.0)
         
-        # Create client with core parameters
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url=base_url,
-            timeout=timeout
-        )
+        # Reuse the connections of the other instances on this event loop, closing this client leaves them open
+        self.client = _get_shared_client(self.api_key, base_url, timeout)
         
         # Store any additional parameters as default kwargs
         self.default_kwargs = {k: v for k, v in config.items() 
@@ -138,36 +215,37 @@ class OpenAILLM(LLMProtocol):
         
         return schema
     
+    def _build_function_schema(self, tool: Tool) -> Dict[str, Any]:
+        """Build the OpenAI function definition for a tool"""
+        return {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        param_name: {
+                            **self._build_parameter_schema(param),
+                            "description": (param.description or "") + (f" Default: {param.default}" if param.default is not None else ""),
+                            **({} if param.enum is None else {"enum": param.enum})
+                        }
+                        for param_name, param in tool.parameters.items()
+                    },
+                    "required": [
+                        param_name for param_name, param in tool.parameters.items()
+                        if param.required
+                    ]
+                }
+            }
+        }
+
     def _prepare_functions(self, options: LLMOptions) -> Optional[List[Dict[str, Any]]]:
         """Prepare function calling if needed"""
         if not options.functions:
             return None
-            
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            param_name: {
-                                **self._build_parameter_schema(param),
-                                "description": (param.description or "") + (f" Default: {param.default}" if param.default is not None else ""),
-                                **({} if param.enum is None else {"enum": param.enum})
-                            }
-                            for param_name, param in tool.parameters.items()
-                        },
-                        "required": [
-                            param_name for param_name, param in tool.parameters.items()
-                            if param.required
-                        ]
-                    }
-                }
-            }
-            for tool in options.functions
-        ]
+
+        return [self._function_schemas.get(tool, self._build_function_schema) for tool in options.functions]
 
     def _prepare_request_kwargs(self, 
                                openai_messages: List[Dict[str, Any]], 
@@ -0,0 +1,61 @@
+import weakref
+from typing import Any, Callable, Dict, Tuple
+
+from xaibo.core.models.tools import Tool
+
+
+class ToolDefinitionCache:
+    """Provider specific definitions of tools, kept for as long as their Tool objects are alive.
+
+    Tool providers return the same Tool objects on every call, and orchestrators pass them to the LLM on every
+    step of a conversation. As the LLM modules are created per request, the definitions are cached process wide
+    by tool object identity. Tools can be changed in place, so each definition is only used while the tool has
+    the same content as when it was built.
+    """
+
+    def __init__(self):
+        self._definitions: Dict[int, Tuple[weakref.ref, tuple, Any]] = {}
+
+    def get(self, tool: Tool, build: Callable[[Tool], Any]) -> Any:
+        """Get the definition of a tool, building it on first use or when the tool changed.
+
+        Args:
+            tool: The tool to get the definition for
+            build: Builds the definition of a tool that isn't cached yet
+
+        Returns:
+            The cached or newly built definition
+        """
+        key = id(tool)
+        fingerprint = _fingerprint(tool)
+        cached = self._definitions.get(key)
+        if cached is not None and cached[0]() is tool and cached[1] == fingerprint:
+            return cached[2]
+
+        definition = build(tool)
+        self._definitions[key] = (weakref.ref(tool, lambda ref: self._forget(key, ref)), fingerprint, definition)
+        return definition
+
+    def _forget(self, key: int, ref: weakref.ref) -> None:
+        """Drop the definition of a tool that was garbage collected, unless its id was reused already"""
+        cached = self._definitions.get(key)
+        if cached is not None and cached[0] is ref:
+            del self._definitions[key]
+
+
+def _fingerprint(tool: Tool) -> tuple:
+    """Snapshot of the tool fields the definitions are built from, much cheaper than building a definition.
+
+    Enum values are copied and defaults rendered, so changing them in place changes the fingerprint as well.
+    """
+    return tool.name, tool.description, tuple(
+        (
+            name,
+            parameter.type,
+            parameter.description,
+            parameter.required,
+            None if parameter.default is None else repr(parameter.default),
+            None if parameter.enum is None else tuple(parameter.enum),
+        )
+        for name, parameter in tool.parameters.items()
+    )
@@ -1,15 +1,27 @@
 import os
+import asyncio
 import logging
 import numpy as np
-from typing import Dict, Any, Optional
-from openai import AsyncOpenAI
+from typing import Dict, Any, List, Optional, Tuple
+from openai import AsyncOpenAI, BadRequestError
 
 from xaibo.core.protocols.memory import EmbeddingProtocol
 
 logger = logging.getLogger(__name__)
 
+# The embeddings API accepts at most this many inputs per request
+MAX_BATCH_SIZE = 2048
+# ... and at most this many tokens summed over all inputs of a request
+MAX_BATCH_TOKENS = 300_000
+
+
 class OpenAIEmbedder(EmbeddingProtocol):
-    """Implementation of EmbeddingProtocol using OpenAI's embedding API"""
+    """Implementation of EmbeddingProtocol using OpenAI's embedding API
+
+    Texts that are embedded concurrently, e.g. the chunks of a memory, are sent together in as few requests as
+    the API limits allow. When the API rejects a request with several texts, it is split up, so only the callers
+    of the rejected texts get the error.
+    """
     
     def __init__(
         self,
@@ -48,6 +60,10 @@ class OpenAIEmbedder(EmbeddingProtocol):
         # Store any additional parameters as default kwargs
         self.default_kwargs = {k: v for k, v in config.items() 
                               if k not in ['api_key', 'model', 'base_url', 'timeout']}
+
+        # Texts waiting to be sent with the next batch and the futures of their callers
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._batch_tasks = set()
     
     async def text_to_embedding(self, text: str) -> np.ndarray:
         """Convert text into vector embedding
@@ -58,20 +74,84 @@ class OpenAIEmbedder(EmbeddingProtocol):
         Returns:
             Numpy array representing the vector embedding
         """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) == 1:
+            # send the batch once the other calls that are ready to run have added their texts
+            loop.call_soon(self._start_batch)
+        return await future
+
+    def _start_batch(self) -> None:
+        """Send all pending texts in the background, keeping a reference to the task until it is done."""
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._embed_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a batch of texts and resolve the futures of their callers."""
+        for requests in self._split_batch(batch):
+            await self._embed_requests(requests)
+
+    @staticmethod
+    def _split_batch(batch: List[Tuple[str, asyncio.Future]]) -> List[List[Tuple[str, asyncio.Future]]]:
+        """Split a batch into parts within the input and token limits of a single request.
+
+        The UTF-8 length of a text is used as its token count, which is cheap and never less than the actual
+        count, as every token of the byte-level tokenizers stands for at least one byte.
+        """
+        parts = []
+        part = []
+        part_tokens = 0
+        for request in batch:
+            tokens = len(request[0].encode("utf-8"))
+            if part and (len(part) == MAX_BATCH_SIZE or part_tokens + tokens > MAX_BATCH_TOKENS):
+                parts.append(part)
+                part = []
+                part_tokens = 0
+            part.append(request)
+            part_tokens += tokens
+        if part:
+            parts.append(part)
+        return parts
+
+    async def _embed_requests(self, requests: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed the texts of a single request, splitting it up if the API rejects it."""
         try:
             response = await self.client.embeddings.create(
                 model=self.model,
-                input=text,
+                input=[text for text, _ in requests],
                 **self.default_kwargs
             )
-            
-            # Extract the embedding from the response
-            embedding = response.data[0].embedding
-            
-            return np.array(embedding)
+        except BadRequestError as e:
+            if len(requests) > 1:
+                # one of the texts was rejected, e.g. an empty or too long one, so find it by halving the request
+                middle = len(requests) // 2
+                await self._embed_requests(requests[:middle])
+                await self._embed_requests(requests[middle:])
+                return
+            logger.error(f"Error generating text embedding from OpenAI: {str(e)}")
+            self._fail(requests, e)
+            return
         except Exception as e:
             logger.error(f"Error generating text embedding from OpenAI: {str(e)}")
-            raise
+            self._fail(requests, e)
+            return
+
+        # Extract the embeddings from the response, which are identified by the index of their input
+        for item in response.data:
+            future = requests[item.index][1]
+            if not future.done():
+                future.set_result(np.array(item.embedding))
+        self._fail(requests, ValueError("OpenAI returned no embedding for the text"))
+
+    @staticmethod
+    def _fail(requests: List[Tuple[str, asyncio.Future]], exception: Exception) -> None:
+        """Fail the futures of all requests that are not resolved yet."""
+        for _, future in requests:
+            if not future.done():
+                future.set_exception(exception)
     
     async def image_to_embedding(self, image_data: bytes) -> np.ndarray:
         """Convert image data into vector embedding
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 import os
 import pickle
@@ -61,6 +62,10 @@ class VectorMemory(MemoryProtocol):
         with open(self.memory_file_path, 'wb') as f:
             pickle.dump(self.memories, f)
     
+    async def _embed_chunks(self, chunks: List[str]) -> List[np.ndarray]:
+        """Create the embeddings of the given chunks, keeping their order"""
+        return list(await asyncio.gather(*(self.embedder.text_to_embedding(chunk) for chunk in chunks)))
+    
     async def store_memory(self, text: str, attributes: Optional[dict] = None) -> str:
         """
         Store a new memory by chunking text, creating embeddings, and storing in vector index.
@@ -86,14 +91,11 @@ class VectorMemory(MemoryProtocol):
         # Chunk the text
         chunks = await self.chunker.chunk(text)
         
-        # Create embeddings for each chunk
-        vectors = []
+        # Create embeddings for all chunks concurrently, so embedders can batch them
+        vectors = await self._embed_chunks(chunks)
         chunk_attributes = []
         
         for i, chunk in enumerate(chunks):
-            vector = await self.embedder.text_to_embedding(chunk)
-            vectors.append(vector)
-            
             # Create attributes for this chunk that link back to the original memory
             chunk_attr = {
                 "memory_id": memory_id,
@@ -228,14 +230,11 @@ class VectorMemory(MemoryProtocol):
         # Chunk the text
         chunks = await self.chunker.chunk(text)
         
-        # Create embeddings for each chunk
-        vectors = []
+        # Create embeddings for all chunks concurrently, so embedders can batch them
+        vectors = await self._embed_chunks(chunks)
         chunk_attributes = []
         
         for i, chunk in enumerate(chunks):
-            vector = await self.embedder.text_to_embedding(chunk)
-            vectors.append(vector)
-            
             # Create attributes for this chunk that link back to the original memory
             chunk_attr = {
                 "memory_id": memory_id,
@@ -1,7 +1,9 @@
 from xaibo.core.protocols import TextMessageHandlerProtocol, ResponseProtocol, LLMProtocol, ToolProviderProtocol, \
     ConversationHistoryProtocol
-from xaibo.core.models.llm import LLMMessage, LLMOptions, LLMRole, LLMFunctionResult, LLMMessageContentType, LLMMessageContent
+from xaibo.core.models.llm import LLMMessage, LLMOptions, LLMRole, LLMFunctionResult, LLMMessageContentType, LLMMessageContent, \
+    LLMFunctionCall
 
+import asyncio
 import json
 
 class SimpleToolOrchestrator(TextMessageHandlerProtocol):
@@ -40,10 +42,13 @@ class SimpleToolOrchestrator(TextMessageHandlerProtocol):
             config: Configuration dictionary with optional parameters:
                    - system_prompt: Initial system prompt for the conversation
                    - max_thoughts: Maximum number of tool usage iterations
+                   - parallel_tool_calls: Execute the tool calls of a single LLM response concurrently. Only
+                     enable it for tools that don't depend on each other's side effects. Defaults to False.
         """
         self.config: dict = config or {}
         self.system_prompt = self.config.get('system_prompt', '')
         self.max_thoughts = self.config.get('max_thoughts', 10)
+        self.parallel_tool_calls = self.config.get('parallel_tool_calls', False)
         self.response: ResponseProtocol = response
         self.llm: LLMProtocol = llm
         self.tool_provider: ToolProviderProtocol = tool_provider
@@ -106,36 +111,15 @@ class SimpleToolOrchestrator(TextMessageHandlerProtocol):
             # Check if tool was called and we haven't reached max thoughts
             if thoughts < self.max_thoughts and llm_response.tool_calls and len(llm_response.tool_calls) > 0:
                 # Execute all tools and collect results
-                tool_results = []
-                
-                for tool_call in llm_response.tool_calls:
-                    tool_name = tool_call.name
-                    tool_args = tool_call.arguments
-                    
-                    try:
-                        tool_result = await self.tool_provider.execute_tool(tool_name, tool_args)
-                        
-                        if tool_result.success:
-                            tool_results.append({
-                                "id": tool_call.id,
-                                "name": tool_name,
-                                "result": json.dumps(tool_result.result, default=repr)
-                            })
-                        else:
-                            # Tool execution failed
-                            tool_results.append({
-                                "id": tool_call.id,
-                                "name": tool_name,
-                                "error": f"Error: {tool_result.error}"
-                            })
-                            stress_level += 0.1
-                    except Exception as e:
-                        # Handle any exceptions during tool execution
-                        tool_results.append({
-                            "id": tool_call.id,
-                            "name": tool_name,
-                            "error": f"Error: {str(e)}"
-                        })
+                if self.parallel_tool_calls and len(llm_response.tool_calls) > 1:
+                    tool_results = await asyncio.gather(
+                        *(self._execute_tool_call(tool_call) for tool_call in llm_response.tool_calls)
+                    )
+                else:
+                    tool_results = [await self._execute_tool_call(tool_call) for tool_call in llm_response.tool_calls]
+
+                for tool_result in tool_results:
+                    if "error" in tool_result:
                         stress_level += 0.1
 
                 conversation.append(LLMMessage(
@@ -155,4 +139,41 @@ class SimpleToolOrchestrator(TextMessageHandlerProtocol):
                 break
         
         # Send the final response
-        await self.response.respond_text(conversation[-1].content[0].text)
\ No newline at end of file
+        await self.response.respond_text(conversation[-1].content[0].text)
+
+    async def _execute_tool_call(self, tool_call: LLMFunctionCall) -> dict:
+        """
+        Execute a single tool call.
+
+        Args:
+            tool_call: The tool call requested by the LLM
+
+        Returns:
+            dict: The id and name of the call, with either its "result" or an "error"
+        """
+        tool_name = tool_call.name
+        tool_args = tool_call.arguments
+
+        try:
+            tool_result = await self.tool_provider.execute_tool(tool_name, tool_args)
+
+            if tool_result.success:
+                return {
+                    "id": tool_call.id,
+                    "name": tool_name,
+                    "result": json.dumps(tool_result.result, default=repr)
+                }
+            else:
+                # Tool execution failed
+                return {
+                    "id": tool_call.id,
+                    "name": tool_name,
+                    "error": f"Error: {tool_result.error}"
+                }
+        except Exception as e:
+            # Handle any exceptions during tool execution
+            return {
+                "id": tool_call.id,
+                "name": tool_name,
+                "error": f"Error: {str(e)}"
+            }
\ No newline at end of file
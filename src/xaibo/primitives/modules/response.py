@@ -12,10 +12,7 @@ class ResponseHandler(ResponseProtocol):
         return self._response
 
     async def respond_text(self, response: str) -> None:
-        if self._response.text is None:
-            self._response.text = response
-        else:
-            self._response.text += response
+        self._response.add_text(response)
 
     async def respond_image(self, iolike: BinaryIO) -> None:
         self._response.attachments.append(FileAttachment(content=iolike, type=FileType.IMAGE))
@@ -28,8 +25,5 @@ class ResponseHandler(ResponseProtocol):
 
     async def respond(self, response: Response) -> None:
         if response.text is not None:
-            if self._response.text is None:
-                self._response.text = response.text
-            else:
-                self._response.text += response.text
-        self._response.attachments.extend(response.attachments)
\ No newline at end of file
+            self._response.add_text(response.text)
+        self._response.attachments.extend(response.attachments)
@@ -1,7 +1,9 @@
 import importlib
 import inspect
+import os
 import sys
-from typing import Any, Dict, List
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import docstring_parser
 
@@ -11,6 +13,40 @@ from xaibo.core.protocols.tools import ToolProviderProtocol
 import logging
 logger = logging.getLogger(__name__)
 
+# Source file (mtime_ns, size) of each tool package when it was last loaded, process wide like sys.modules
+_package_stamps: Dict[str, Tuple[int, int]] = {}
+
+# Tool definitions by function, dropped together with functions that are replaced by a reload
+_tool_definitions: "weakref.WeakKeyDictionary[Callable, Tool]" = weakref.WeakKeyDictionary()
+
+
+def _source_stamp(module) -> Optional[Tuple[int, int]]:
+    """Get the (mtime_ns, size) of a module's source file, or None if it has none"""
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_package(package_path: str):
+    """Import a tool package, reloading an already imported one only if its source changed since it was loaded"""
+    module = sys.modules.get(package_path)
+    if module is None:
+        module = importlib.import_module(package_path)
+        stamp = _source_stamp(module)
+    else:
+        # taken before reloading, so a change during the reload is picked up next time
+        stamp = _source_stamp(module)
+        if stamp is None or _package_stamps.get(package_path) != stamp:
+            module = importlib.reload(module)
+    if stamp is not None:
+        _package_stamps[package_path] = stamp
+    return module
+
 
 class PythonToolProvider(ToolProviderProtocol):
     """Provider for Python function-based tools"""
@@ -25,23 +61,25 @@ class PythonToolProvider(ToolProviderProtocol):
         """
         self.tool_packages = config.get("tool_packages", [])
         self.tool_functions = config.get("tool_functions", [])
+        # tool name to (package module, attribute name) of the package tools seen by list_tools
+        self._package_tools: Dict[str, Tuple[Any, str]] = {}
 
     async def list_tools(self) -> List[Tool]:
         """List all available tools from the configured packages and functions"""
         tools = []
+        package_tools = {}
         
         # Get tools from packages
         for package_path in self.tool_packages:
             try:
-                if package_path in sys.modules:
-                    pkg = importlib.reload(sys.modules[package_path])
-                else:
-                    pkg = importlib.import_module(package_path)
+                pkg = _load_package(package_path)
                     
                 # Find all functions marked as tools
-                for obj in pkg.__dict__.values():
+                for attr_name, obj in pkg.__dict__.items():
                     if hasattr(obj, "__xaibo_tool__"):
-                        tools.append(self._function_to_tool(obj))
+                        tool = self._get_tool(obj)
+                        tools.append(tool)
+                        package_tools.setdefault(tool.name, (pkg, attr_name))
 
             except ImportError as e:
                 logger.warning("Failed to import tool module '%s'", package_path, exc_info=True)
@@ -53,8 +91,9 @@ class PythonToolProvider(ToolProviderProtocol):
                 # Mark the function as a tool if not already marked
                 if not hasattr(func, "__xaibo_tool__"):
                     setattr(func, "__xaibo_tool__", True)
-                tools.append(self._function_to_tool(func))
+                tools.append(self._get_tool(func))
         
+        self._package_tools = package_tools
         return tools
 
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> ToolResult:
@@ -71,30 +110,25 @@ class PythonToolProvider(ToolProviderProtocol):
         for func in self.tool_functions:
             if (hasattr(func, "__xaibo_tool__") and 
                 self._get_tool_name(func) == tool_name):
-                try:
-                    result = func(**parameters)
-                    return ToolResult(success=True, result=result)
-                except Exception as e:
-                    return ToolResult(
-                        success=False,
-                        error=str(e)
-                    )
+                return self._run_tool(func, parameters)
         
-        # Then check package-based tools
+        # Then check the package-based tools found by list_tools, looking them up in the package
+        # at call time, so the current definition is used after a reload
+        package_tool = self._package_tools.get(tool_name)
+        if package_tool is not None:
+            pkg, attr_name = package_tool
+            obj = pkg.__dict__.get(attr_name)
+            if obj is not None and hasattr(obj, "__xaibo_tool__") and self._get_tool_name(obj) == tool_name:
+                return self._run_tool(obj, parameters)
+
+        # Tools that have not been listed yet are searched in their packages
         for package_path in self.tool_packages:
             try:
                 pkg = importlib.import_module(package_path)
                 for obj in pkg.__dict__.values():
                     if (hasattr(obj, "__xaibo_tool__") and 
                         self._get_tool_name(obj) == tool_name):
-                        try:
-                            result = obj(**parameters)
-                            return ToolResult(success=True, result=result)
-                        except Exception as e:
-                            return ToolResult(
-                                success=False,
-                                error=str(e)
-                            )
+                        return self._run_tool(obj, parameters)
             except ImportError:
                 # Skip packages that don't exist
                 continue
@@ -104,6 +138,32 @@ class PythonToolProvider(ToolProviderProtocol):
             error=f"Tool {tool_name} not found"
         )
 
+    @staticmethod
+    def _run_tool(fn, parameters: Dict[str, Any]) -> ToolResult:
+        """Call a tool function, reporting exceptions as a failed result"""
+        try:
+            result = fn(**parameters)
+            return ToolResult(success=True, result=result)
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                error=str(e)
+            )
+
+    def _get_tool(self, fn) -> Tool:
+        """Get the Tool definition of a function, building it only once per function object.
+
+        The definitions are shared between calls and providers, so callers must not modify them.
+        """
+        try:
+            tool = _tool_definitions.get(fn)
+        except TypeError:
+            # not weakly referenceable, e.g. builtins
+            return self._function_to_tool(fn)
+        if tool is None:
+            tool = _tool_definitions[fn] = self._function_to_tool(fn)
+        return tool
+
     def _function_to_tool(self, fn) -> Tool:
         """Convert a Python function to a Tool definition"""
         docstr = docstring_parser.parse(inspect.getdoc(fn))
@@ -111,15 +171,12 @@ class PythonToolProvider(ToolProviderProtocol):
         
         parameters = {}
         for param in inspect.signature(fn).parameters.values():
+            param_type = param.annotation.__name__ if param.annotation != inspect._empty else "any"
             parameters[param.name] = ToolParameter(
-                type=param.annotation.__name__ if param.annotation != inspect._empty else "any",
+                type={'str': 'string', 'int': 'integer'}.get(param_type, param_type),
                 description=param_docs.get(param.name, ""),
                 required=param.default == inspect.Parameter.empty
             )
-            if parameters[param.name].type == 'str':
-                parameters[param.name].type = 'string'
-            elif parameters[param.name].type == 'int':
-                parameters[param.name].type = 'integer'
 
         return Tool(
             name=self._get_tool_name(fn),
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, List
 
 from xaibo.core.models import ToolResult, Tool
@@ -7,21 +8,21 @@ from xaibo.core.protocols import ToolProviderProtocol
 class ToolCollector(ToolProviderProtocol):
     def __init__(self, tool_providers: list[ToolProviderProtocol], config: dict[str, Any] = None):
         self.tool_providers = tool_providers
-        self.tool_cache = {}
+        self.tool_cache: dict[str, ToolProviderProtocol] = {}
+        self._tools: list[Tool] | None = None
+        self._refresh_lock = asyncio.Lock()
 
     async def list_tools(self) -> List[Tool]:
-        self.tool_cache = {}
-        res = []
-        for provider in self.tool_providers:
-            tools = await provider.list_tools()
-            res.extend(tools)
-            for tool in tools:
-                self.tool_cache[tool.name] = provider
-        return res
+        # Listing always asks the providers, as their tools may change (e.g. reloaded packages)
+        await self._refresh_cache()
+        return list(self._tools)
 
     async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> ToolResult:
-        if len(self.tool_cache) == 0:
-            await self._fill_cache()
+        if self._tools is None:
+            async with self._refresh_lock:
+                # another call may have filled the cache while we were waiting
+                if self._tools is None:
+                    await self._fill_cache()
         provider = self.tool_cache.get(tool_name)
         if provider is not None:
             return await provider.execute_tool(tool_name, parameters)
@@ -30,9 +31,23 @@ class ToolCollector(ToolProviderProtocol):
             error=f"Could not find {tool_name}"
         )
 
-    async def _fill_cache(self):
+    def invalidate(self) -> None:
+        """Drop the cached tool to provider mapping, e.g. after the set of providers changed."""
         self.tool_cache = {}
-        for provider in self.tool_providers:
-            tools = await provider.list_tools()
-            for tool in tools:
-                self.tool_cache[tool.name] = provider
+        self._tools = None
+
+    async def _refresh_cache(self):
+        async with self._refresh_lock:
+            await self._fill_cache()
+
+    async def _fill_cache(self):
+        tool_cache = {}
+        tools = []
+        # providers may list their tools over the network, so ask all of them concurrently
+        provider_tool_lists = await asyncio.gather(*(provider.list_tools() for provider in self.tool_providers))
+        for provider, provider_tools in zip(self.tool_providers, provider_tool_lists):
+            tools.extend(provider_tools)
+            for tool in provider_tools:
+                tool_cache[tool.name] = provider
+        self.tool_cache = tool_cache
+        self._tools = tools
@@ -1,4 +1,3 @@
-import json
 import time
 import logging
 import os
@@ -8,11 +7,12 @@ from typing import Optional
 from fastapi import FastAPI, Request, HTTPException, APIRouter, Depends
 from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic_core import to_json
 
 from xaibo import Xaibo, ConfigOverrides, ExchangeConfig
 from xaibo.primitives.modules.conversation.conversation import SimpleConversation
 
-from asyncio import wait_for, Queue, create_task, TimeoutError
+from asyncio import wait, Queue, create_task, FIRST_COMPLETED
 
 logger = logging.getLogger(__name__)
 
@@ -105,27 +105,25 @@ class OpenAiApiAdapter:
             raise
 
     async def handle_streaming_request(self, data, last_user_message, conversation_id, conversation):
-        # Create response helper
-        def create_chunk_response(delta={}, finish_reason=None):
-            return {
-                "id": f"chatcmpl-{conversation_id}",
-                "created": int(time.time()),
-                "model": data['model'],
-                "object": "chat.completion.chunk",
-                "choices": [{
-                    "delta": delta,
-                    "finish_reason": finish_reason,
-                    "index": 0
-                }]
-            }
+        # Only the delta and finish reason differ between the chunks of a completion, so everything
+        # before them is serialized once and every chunk only serializes its own parts
+        chunk_prefix = (
+            b'data: {"id":' + to_json(f"chatcmpl-{conversation_id}") +
+            b',"created":' + to_json(int(time.time())) +
+            b',"model":' + to_json(data['model']) +
+            b',"object":"chat.completion.chunk","choices":[{"delta":'
+        )
+
+        def create_chunk_event(delta={}, finish_reason=None) -> bytes:
+            return chunk_prefix + to_json(delta) + b',"finish_reason":' + to_json(finish_reason) + b',"index":0}]}\n\n'
             
         async def generate_stream():
             queue = Queue()
             
             class StreamingResponse:
                 async def respond_text(self, text: str) -> None:
-                    response = create_chunk_response({"content": text})
-                    await queue.put(f"data: {json.dumps(response)}\n\n")
+                    # the queue is unbounded, so putting never has to wait
+                    queue.put_nowait(create_chunk_event({"content": text}))
 
                 async def get_response(self):
                     return None
@@ -158,35 +156,51 @@ class OpenAiApiAdapter:
             agent_task = create_task(agent.handle_text(last_user_message, entry_point=entry_point))
             
             # Send initial empty chunk to flush headers
-            yield f"data: {json.dumps(create_chunk_response({'content': ''}))}\n\n"
-
-            while True:
-                try:
-                    # Check if agent is done
-                    if agent_task.done():
-                        # Check if there was an exception in the agent task
-                        if agent_task.exception():
-                            logger.exception(f"Agent task failed with exception: {agent_task.exception()}")
-                            raise agent_task.exception()
-                        
-                        # Send final chunks and exit
-                        yield f"data: {json.dumps(create_chunk_response({}, 'stop'))}\n\n"
-                        yield "data: [DONE]\n\n"
+            yield create_chunk_event({'content': ''})
+
+            # wait for the next chunk and the agent at the same time, so the stream ends as soon as the agent is done
+            get_chunk = None
+            try:
+                while True:
+                    if get_chunk is None:
+                        get_chunk = create_task(queue.get())
+                    done, _ = await wait({get_chunk, agent_task}, timeout=self.streaming_timeout, return_when=FIRST_COMPLETED)
+                    if get_chunk in done:
+                        chunk = get_chunk.result()
+                        get_chunk = None
+                        yield chunk
+                    elif agent_task in done:
                         break
+                    else:
+                        # Send empty chunk on timeout
+                        yield create_chunk_event({'content': ''})
+            except Exception as e:
+                logger.exception(f"Unexpected error in streaming response: {str(e)}")
+                raise
+            finally:
+                if get_chunk is not None:
+                    get_chunk.cancel()
 
-                    # Get next chunk from queue with timeout
-                    chunk = await wait_for(queue.get(), timeout=self.streaming_timeout)
-                    yield chunk                    
-                except TimeoutError:
-                    # Send empty chunk on timeout
-                    yield f"data: {json.dumps(create_chunk_response({'content': ''}))}\n\n"
-                    continue
-                except Exception as e:
-                    logger.exception(f"Unexpected error in streaming response: {str(e)}")
-                    raise
+            # Send the chunks the agent queued before it finished
+            while not queue.empty():
+                yield queue.get_nowait()
+
+            # Check if there was an exception in the agent task
+            if agent_task.exception():
+                logger.exception(f"Agent task failed with exception: {agent_task.exception()}")
+                raise agent_task.exception()
+
+            # Send final chunks and exit
+            yield create_chunk_event({}, 'stop')
+            yield b"data: [DONE]\n\n"
 
         try:
-            return StreamingResponse(generate_stream(), media_type='text/event-stream')
+            return StreamingResponse(
+                generate_stream(),
+                media_type='text/event-stream',
+                # keep caches and reverse proxies like nginx from buffering the events
+                headers={'Cache-Control': 'no-cache, no-transform', 'X-Accel-Buffering': 'no'}
+            )
         except Exception as e:
             logger.exception(f"Error setting up streaming response: {str(e)}")
             raise
@@ -602,7 +602,12 @@ class OpenAiResponsesApiAdapter:
                     raise
 
         try:
-            return StreamingResponse(generate_stream(), media_type='text/event-stream')
+            return StreamingResponse(
+                generate_stream(),
+                media_type='text/event-stream',
+                # keep caches and reverse proxies like nginx from buffering the events
+                headers={'Cache-Control': 'no-cache, no-transform', 'X-Accel-Buffering': 'no'}
+            )
         except Exception as e:
             logger.exception(f"Error setting up streaming response: {str(e)}")
             raise
@@ -1,11 +1,12 @@
+import os
 from os import PathLike
 
 import strawberry
 from fastapi import FastAPI, APIRouter, Request, HTTPException
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse
+from starlette.responses import Response
 from strawberry.fastapi import GraphQLRouter, BaseContext
-from typing import List, Optional, Dict, Union
+from typing import List, Optional, Dict, Union, BinaryIO
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
@@ -15,6 +16,9 @@ from strawberry.scalars import JSON
 from xaibo import Xaibo, ConfigOverrides, ExchangeConfig
 from xaibo.core import models
 from xaibo.primitives.modules.conversation.conversation import SimpleConversation
+import asyncio
+import hashlib
+from functools import lru_cache
 import json
 from pathlib import Path
 from importlib.resources import files
@@ -102,10 +106,27 @@ class Query:
         target_path = Path("./debug") / f"{agent_id}.jsonl"
         events = []
         if target_path.exists():
-            lines = target_path.read_text().splitlines()
-            events = [Event(**json.loads(line)) for line in lines]
+            # parse off the event loop, the trace can grow large
+            events = await asyncio.to_thread(_read_debug_events, target_path)
         return DebugTrace(agent_id=agent_id, events=events)
 
+
+def _read_debug_events(target_path: Path) -> List[Event]:
+    """Parse a JSONL debug trace line by line.
+
+    Lines that are not valid JSON, e.g. an event that is still being written, are skipped.
+    """
+    events = []
+    with target_path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                events.append(Event(**json.loads(line)))
+            except json.JSONDecodeError:
+                continue
+    return events
+
 @strawberry.type
 class Mutation:
     @strawberry.mutation
@@ -113,13 +134,27 @@ class Mutation:
         target_path = Path("./debug") / f"{agent_id}.jsonl"
         events = []
         if target_path.exists():
-            target_path.unlink()
+            # truncate instead of deleting, the debug listener keeps the trace open (and Windows can't delete open files)
+            os.truncate(target_path, 0)
         return DebugTrace(agent_id=agent_id, events=events)
 
-schema = strawberry.Schema(
-    query=Query,
-    mutation=Mutation,
-)
+@lru_cache(maxsize=None)
+def get_schema() -> strawberry.Schema:
+    """Build the UI GraphQL schema on first use, it is shared by all adapters."""
+    return strawberry.Schema(
+        query=Query,
+        mutation=Mutation,
+    )
+
+def __getattr__(name: str):
+    # the schema used to be built at import time as `schema`
+    if name == "schema":
+        return get_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# SvelteKit emits its content hashed build output below this path
+_IMMUTABLE_ASSETS_PATH = "/_app/immutable/"
+
 
 class UiApiAdapter:
     def __init__(self, xaibo: Xaibo):
@@ -127,7 +162,7 @@ class UiApiAdapter:
         self.router = APIRouter()
 
         graphql_router = GraphQLRouter(
-            schema,
+            get_schema(),
             context_getter=self.get_context
         )
 
@@ -154,8 +189,9 @@ class UiApiAdapter:
                 # Call agent.handle_text to get response
                 response = await agent.handle_text(request.message, entry_point='__entry__')
 
-                # Build updated history with assistant response
-                updated_history = list(request.history)
+                # Extend the history with the new turn; the request model owns its own list,
+                # so it can be returned without copying it
+                updated_history = request.history
                 # Add user's message
                 updated_history.append({"role": "user", "content": request.message})
                 # Add assistant's response
@@ -171,6 +207,8 @@ class UiApiAdapter:
                 raise HTTPException(status_code=500, detail=str(e))
 
         self.static_path = files("xaibo.server.adapters") / "ui" / "static" / "build"
+        self._index_html: Optional[bytes] = None
+        self._index_etag: Optional[str] = None
 
     def adapt(self, app: FastAPI):
         load_dotenv()
@@ -182,9 +220,23 @@ class UiApiAdapter:
             response = await call_next(request)
             if response.status_code == 404 and "text/html" in request.headers.get("accept", ""):
                 # Return SPA index.html for unhandled routes
-                return FileResponse(self.static_path / "index.html")
+                return self._index_response(request)
+            if response.status_code == 200 and request.url.path.startswith(_IMMUTABLE_ASSETS_PATH):
+                # the build puts a content hash into the names of these files, so they never change
+                response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
             return response
 
+    def _index_response(self, request: Request) -> Response:
+        """Serve the SPA index.html from memory, it is read from disk on first use only."""
+        if self._index_html is None:
+            self._index_html = (self.static_path / "index.html").read_bytes()
+            self._index_etag = f'"{hashlib.md5(self._index_html, usedforsecurity=False).hexdigest()}"'
+        # clients have to revalidate the index, as it points to the current build's assets
+        headers = {"ETag": self._index_etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == self._index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=self._index_html, media_type="text/html", headers=headers)
+
 
     def get_context(self) -> UiContext:
         return UiContext(self.xaibo)
@@ -196,9 +248,11 @@ class UIDebugTraceEventListener:
         """Initialize the debug event listener.
 
         Args:
-            log_level: The logging level to use for event logs (default: logging.DEBUG)
+            output_directory: Directory to write the per-agent JSONL traces to
         """
         self.output_directory = output_directory
+        self.output_directory.mkdir(parents=True, exist_ok=True)
+        self._files: Dict[str, BinaryIO] = {}
 
     def handle_event(self, event: models.Event) -> None:
         """Handle an event by logging it.
@@ -206,10 +260,23 @@ class UIDebugTraceEventListener:
         Args:
             event: The event to log
         """
-        if not self.output_directory.exists():
-            self.output_directory.mkdir(parents=True)
+        f = self._get_file(event.agent_id)
+        # one unbuffered write per line, so readers of the trace see it right away
+        f.write(event.to_json() + b"\n")
+
+    def close(self) -> None:
+        """Close all open trace files."""
+        for f in self._files.values():
+            f.close()
+        self._files = {}
 
-        target_file = self.output_directory / f"{event.agent_id}.jsonl"
-        with target_file.open("a") as f:
-            f.write(json.dumps(event.model_dump(), default=repr))
-            f.write("\n")
\ No newline at end of file
+    def _get_file(self, agent_id: str) -> BinaryIO:
+        """Get the open trace file of an agent.
+
+        The file is opened in append mode, so writes continue at its start after it was truncated by clear_log.
+        """
+        f = self._files.get(agent_id)
+        if f is None:
+            target_file = self.output_directory / f"{agent_id}.jsonl"
+            f = self._files[agent_id] = target_file.open("ab", buffering=0)
+        return f
@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from typing import Type, Optional
 import importlib
@@ -11,14 +12,21 @@ from watchfiles import awatch
 from xaibo import Xaibo, AgentConfig
 from pathlib import Path
 
+@lru_cache(maxsize=None)
 def get_class_by_path(path: str) -> Type:
-    parts = path.split('.')
-    pkg = '.'.join(parts[:-1])
-    cls = parts[-1]
+    pkg, cls = path.rsplit('.', 1)
     package = importlib.import_module(pkg)
     clazz = getattr(package, cls)
     return clazz
 
+async def close_shared_clients() -> None:
+    """Close the connections that LLM modules share between agents"""
+    try:
+        from xaibo.primitives.modules.llm.openai import aclose_shared_clients
+    except ImportError:
+        return
+    await aclose_shared_clients()
+
 class XaiboWebServer:
     def __init__(self, xaibo: Xaibo, adapters: list[str], agent_dir: str, host: str = "127.0.0.1", port: int = 8000, debug: bool = False, openai_api_key: Optional[str] = None, mcp_api_key: Optional[str] = None) -> None:
         @asynccontextmanager
@@ -30,6 +38,9 @@ class XaiboWebServer:
                 await self.watcher_task
             except asyncio.CancelledError:
                 pass
+            await close_shared_clients()
+            if self.debug_listener is not None:
+                self.debug_listener.close()
 
 
         self.xaibo = xaibo
@@ -45,14 +56,17 @@ class XaiboWebServer:
         self.host = host
         self.port = port
         self.configs = {}
+        self._config_cache = {}
         self.watcher_task = None
         self.openai_api_key = openai_api_key
         self.mcp_api_key = mcp_api_key
+        self.debug_listener = None
 
         if debug:
             from xaibo.server.adapters.ui import UIDebugTraceEventListener
             adapters.append("xaibo.server.adapters.UiApiAdapter")
-            self.xaibo.register_event_listener("", UIDebugTraceEventListener(Path("./debug")).handle_event)
+            self.debug_listener = UIDebugTraceEventListener(Path("./debug"))
+            self.xaibo.register_event_listener("", self.debug_listener.handle_event)
 
 
         for adapter in adapters:
@@ -72,23 +86,34 @@ class XaiboWebServer:
             
     def _load_configs(self) -> None:
         """Load configs and register new/changed agents, unregister removed ones"""
-        new_configs = AgentConfig.load_directory(self.agent_dir)
-        
+        self._apply_configs(self._read_configs())
+
+    def _read_configs(self) -> dict[str, AgentConfig]:
+        # unchanged files keep their config instance, so they need neither parsing nor a deep comparison
+        return AgentConfig.load_directory(self.agent_dir, cache=self._config_cache)
+
+    def _apply_configs(self, new_configs: dict[str, AgentConfig]) -> None:
         # Unregister removed agents
         for path in set(self.configs.keys()) - set(new_configs.keys()):
             self.xaibo.unregister_agent(self.configs[path].id)
             
         # Register new/changed agents
         for path, config in new_configs.items():
-            if path not in self.configs or self.configs[path] != config:
+            old_config = self.configs.get(path)
+            if old_config is config:
+                continue
+            if old_config is None or old_config != config:
                 self.xaibo.register_agent(config)
                 
         self.configs = new_configs
 
     async def watch_config_files(self):
         try:
+            # awatch debounces by itself and yields all changes of a burst (e.g. an editor's
+            # write + rename on save) as one set, so each burst triggers a single reload
             async for _ in awatch(self.agent_dir, force_polling=True):
-                self._load_configs()
+                # parse the YAML files off the event loop, but (un)register agents on it
+                self._apply_configs(await asyncio.to_thread(self._read_configs))
         except asyncio.CancelledError:
             pass
 
@@ -1,7 +1,6 @@
 import logging
 
 import pytest
-import os
 from pathlib import Path
 
 
@@ -10,74 +9,52 @@ from xaibo.core.models.response import Response
 from xaibo.primitives.modules.conversation import SimpleConversation
 
 
+@pytest.fixture(scope="module")
+def agent_config(openai_available):
+    """The simple tool orchestrator config, parsed once for all tests of this module"""
+    # Find the resources directory relative to this test file
+    resources_dir = Path(__file__).parent.parent / "resources"
+    return AgentConfig.from_yaml((resources_dir / "yaml" / "simple_tool_orchestrator.yaml").read_text())
+
+@pytest.fixture
+def xaibo(agent_config):
+    """A Xaibo instance with the simple tool orchestrator registered"""
+    xaibo = Xaibo()
+    # instantiating agents modifies their config, so every test gets its own copy
+    xaibo.register_agent(agent_config.model_copy(deep=True))
+    return xaibo
+
 @pytest.fixture
 def empty_conversation():
     return SimpleConversation()
 
-@pytest.mark.asyncio
-async def test_simple_tool_orchestrator_instantiation(empty_conversation):
-    """Test instantiating a simple tool orchestrator agent"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the simple tool orchestrator config
-    with open(resources_dir / "yaml" / "simple_tool_orchestrator.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-
-    # Create registry and register agent
-    xaibo = Xaibo()
-    xaibo.register_agent(config)
-    
-    # Get agent instance
-    agent = xaibo.get_agent_with("minimal-tool-user", ConfigOverrides(
-        instances={'history': empty_conversation},
+def _history_overrides(conversation):
+    return ConfigOverrides(
+        instances={'history': conversation},
         exchange=[ExchangeConfig(
             protocol='ConversationHistoryProtocol',
             provider='history'
         )]
-    ))
-    
+    )
+
+@pytest.fixture
+def agent(xaibo, empty_conversation):
+    """A simple tool orchestrator agent with an empty conversation history"""
+    return xaibo.get_agent_with("minimal-tool-user", _history_overrides(empty_conversation))
+
+@pytest.mark.asyncio
+async def test_simple_tool_orchestrator_instantiation(agent):
+    """Test instantiating a simple tool orchestrator agent"""
     # Verify agent was created successfully
     assert agent is not None
     assert agent.id == "minimal-tool-user"
 
 
 @pytest.mark.asyncio
-async def test_simple_tool_orchestrator_current_time(caplog, empty_conversation):
+async def test_simple_tool_orchestrator_current_time(caplog, agent):
     """Test simple tool orchestrator with current_time tool"""
     caplog.set_level(logging.DEBUG, 'xaibo.events')
 
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the simple tool orchestrator config
-    with open(resources_dir / "yaml" / "simple_tool_orchestrator.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create registry and register agent
-    xaibo = Xaibo()
-    xaibo.register_agent(config)
-    
-    # Get agent instance
-    agent = xaibo.get_agent_with("minimal-tool-user", ConfigOverrides(
-        instances={'history': empty_conversation},
-        exchange=[ExchangeConfig(
-            protocol='ConversationHistoryProtocol',
-            provider='history'
-        )]
-    ))
     # Test with a prompt that should trigger the current_time tool
     response = await agent.handle_text("What time is it right now?")
     
@@ -87,33 +64,8 @@ async def test_simple_tool_orchestrator_current_time(caplog, empty_conversation)
 
 
 @pytest.mark.asyncio
-async def test_simple_tool_orchestrator_calendar(empty_conversation):
+async def test_simple_tool_orchestrator_calendar(agent):
     """Test simple tool orchestrator with calendar tool"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the simple tool orchestrator config
-    with open(resources_dir / "yaml" / "simple_tool_orchestrator.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create registry and register agent
-    xaibo = Xaibo()
-    xaibo.register_agent(config)
-    
-    # Get agent instance
-    agent = xaibo.get_agent_with("minimal-tool-user", ConfigOverrides(
-        instances={'history': empty_conversation},
-        exchange=[ExchangeConfig(
-            protocol='ConversationHistoryProtocol',
-            provider='history'
-        )]
-    ))
     # Get today's date in YYYY-MM-DD format
     from datetime import datetime
     today = datetime.today().strftime("%Y-%m-%d")
@@ -127,37 +79,14 @@ async def test_simple_tool_orchestrator_calendar(empty_conversation):
 
 
 @pytest.mark.asyncio
-async def test_simple_tool_orchestrator_time_and_calendar(empty_conversation):
+async def test_simple_tool_orchestrator_time_and_calendar(xaibo, empty_conversation):
     """Test simple tool orchestrator with time and calendar tool"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-
-    # Load the simple tool orchestrator config
-    with open(resources_dir / "yaml" / "simple_tool_orchestrator.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-
-    # Create registry and register agent
-    xaibo = Xaibo()
-    xaibo.register_agent(config)
-
     events = []
     def collect_events(event):
         events.append(event)
 
     # Get agent instance
-    agent = xaibo.get_agent_with("minimal-tool-user", ConfigOverrides(
-        instances={'history': empty_conversation},
-        exchange=[ExchangeConfig(
-            protocol='ConversationHistoryProtocol',
-            provider='history'
-        )]
-    ), [
+    agent = xaibo.get_agent_with("minimal-tool-user", _history_overrides(empty_conversation), [
         ("", collect_events)
     ])
 
@@ -169,34 +98,8 @@ async def test_simple_tool_orchestrator_time_and_calendar(empty_conversation):
     assert "standup" in response.text.lower() or "focus time" in response.text.lower()
 
 @pytest.mark.asyncio
-async def test_simple_tool_orchestrator_error_handling(empty_conversation):
+async def test_simple_tool_orchestrator_error_handling(agent):
     """Test simple tool orchestrator handles tool errors gracefully"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-
-
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the simple tool orchestrator config
-    with open(resources_dir / "yaml" / "simple_tool_orchestrator.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create registry and register agent
-    xaibo = Xaibo()
-    xaibo.register_agent(config)
-    
-    # Get agent instance
-    agent = xaibo.get_agent_with("minimal-tool-user", ConfigOverrides(
-        instances={'history': empty_conversation},
-        exchange=[ExchangeConfig(
-            protocol='ConversationHistoryProtocol',
-            provider='history'
-        )]
-    ))
     # Test with a prompt that should trigger the weather tool with Germany (which raises an exception)
     response = await agent.handle_text("What's the weather in Berlin, Germany?")
     
@@ -0,0 +1,29 @@
+import importlib.util
+import os
+import socket
+import sys
+
+import pytest
+
+
+if sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None:
+    import uvloop
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the async tests on uvloop"""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def openai_available():
+    """Skip tests that call the OpenAI API when there is no API key or the API can't be reached.
+
+    Reachability is probed once per session, so offline runs don't wait for a connection timeout in every test.
+    """
+    if not os.environ.get("OPENAI_API_KEY"):
+        pytest.skip("OPENAI_API_KEY environment variable not set")
+    try:
+        socket.create_connection(("api.openai.com", 443), timeout=2).close()
+    except OSError as e:
+        pytest.skip(f"OpenAI API not reachable: {e}")
@@ -0,0 +1,49 @@
+import pytest
+from pathlib import Path
+
+from xaibo import AgentConfig, Registry
+
+# Find the resources directory relative to this file
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+
+
+def _load_agent_config(yaml_file: str) -> AgentConfig:
+    """Load an agent config from a YAML resource"""
+    path = RESOURCES_DIR / "yaml" / yaml_file
+    return AgentConfig.from_yaml(path.read_text(encoding="utf-8"))
+
+
+def _registry_with(*agent_configs: AgentConfig) -> Registry:
+    """Create a registry with the given agents registered"""
+    registry = Registry()
+    for agent_config in agent_configs:
+        registry.register_agent(agent_config)
+    return registry
+
+
+@pytest.fixture(scope="session")
+def echo_agent_configs() -> dict[str, AgentConfig]:
+    """Parsed configs of the echo agents by id, loaded once per session.
+
+    Getting an agent leaves its registered config unchanged, so the configs can be shared by every registry.
+    """
+    configs = [_load_agent_config(yaml_file) for yaml_file in ("echo.yaml", "echo_complete.yaml")]
+    return {config.id: config for config in configs}
+
+
+@pytest.fixture(scope="session")
+def echo_registry(echo_agent_configs) -> Registry:
+    """Registry with the minimal echo agent, shared by all tests that only instantiate it"""
+    return _registry_with(echo_agent_configs["echo-agent-minimal"])
+
+
+@pytest.fixture(scope="session")
+def echo_complete_registry(echo_agent_configs) -> Registry:
+    """Registry with the complete echo agent, shared by all tests that only instantiate it"""
+    return _registry_with(echo_agent_configs["echo-agent"])
+
+
+@pytest.fixture
+def registry(echo_agent_configs) -> Registry:
+    """Fresh registry with both echo agents, for tests that register event listeners"""
+    return _registry_with(*echo_agent_configs.values())
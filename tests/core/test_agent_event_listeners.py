@@ -1,29 +1,18 @@
+import threading
+
 import pytest
-from pathlib import Path
-from xaibo import AgentConfig, Registry
 from xaibo.core.models.events import Event
+from xaibo.primitives.event_listeners.queued_event_listener import QueuedEventListener
 
 
 @pytest.mark.asyncio
-async def test_agent_event_listeners():
+async def test_agent_event_listeners(registry):
     """Test event listeners attached to an agent instance"""
     events = []
     
     def event_handler(event: Event):
         events.append(event)
     
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load config and create agent
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Register event listener
     registry.register_event_listener("", event_handler)
     
@@ -36,30 +25,13 @@ async def test_agent_event_listeners():
     assert any(e.module_class == "Echo" for e in events)
 
 @pytest.mark.asyncio
-async def test_agent_event_filtering():
+async def test_agent_event_filtering(registry):
     """Test filtering events by agent ID"""
     events = []
     
     def event_handler(event: Event):
         events.append(event)
     
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load configs for two agents
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config1 = AgentConfig.from_yaml(content)
-        
-    with open(resources_dir / "yaml" / "echo_complete.yaml") as f:
-        content = f.read()
-        config2 = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config1)
-    registry.register_agent(config2)
-    
     # Register event listener for first agent only
     registry.register_event_listener("", event_handler, agent_id="echo-agent-minimal")
     
@@ -76,25 +48,13 @@ async def test_agent_event_filtering():
     assert all(e.agent_id == "echo-agent-minimal" for e in events)
 
 @pytest.mark.asyncio
-async def test_agent_event_prefix_filtering():
+async def test_agent_event_prefix_filtering(registry):
     """Test filtering events by prefix"""
     events = []
     
     def event_handler(event: Event):
         events.append(event)
     
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load config and create agent
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Register event listener with prefix filter
     registry.register_event_listener("xaibo_examples.echo", event_handler)
     
@@ -108,7 +68,7 @@ async def test_agent_event_prefix_filtering():
     assert all(e.event_name.startswith("xaibo_examples.echo") for e in events)
 
 @pytest.mark.asyncio
-async def test_additional_event_listeners():
+async def test_additional_event_listeners(registry):
     """Test adding additional event listeners when getting an agent"""
     events = []
     additional_events = []
@@ -119,18 +79,6 @@ async def test_additional_event_listeners():
     def additional_handler(event: Event):
         additional_events.append(event)
     
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load config and create agent
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Register global event listener
     registry.register_event_listener("", event_handler)
     
@@ -149,7 +97,7 @@ async def test_additional_event_listeners():
     assert len(events) == len(additional_events)
 
 @pytest.mark.asyncio
-async def test_additional_event_listeners_with_prefix():
+async def test_additional_event_listeners_with_prefix(registry):
     """Test adding additional event listeners with prefix filtering"""
     global_events = []
     echo_events = []
@@ -160,18 +108,6 @@ async def test_additional_event_listeners_with_prefix():
     def echo_handler(event: Event):
         echo_events.append(event)
     
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load config and create agent
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Get agent with additional event listeners with different prefixes
     additional_listeners = [
         ("", global_handler),
@@ -191,4 +127,109 @@ async def test_additional_event_listeners_with_prefix():
     assert len(global_events) >= len(echo_events)
     
     # Echo handler should only have echo events
-    assert all(e.event_name.startswith("xaibo_examples.echo") for e in echo_events)
\ No newline at end of file
+    assert all(e.event_name.startswith("xaibo_examples.echo") for e in echo_events)
+
+@pytest.mark.asyncio
+async def test_event_listeners_registered_after_getting_an_agent(registry):
+    """Test that listeners registered later apply to agents created afterwards"""
+    first_events = []
+    later_events = []
+
+    registry.register_event_listener("", first_events.append, agent_id="echo-agent-minimal")
+    await registry.get_agent("echo-agent-minimal").handle_text("Hello")
+    assert len(first_events) > 0
+
+    registry.register_event_listener("", later_events.append)
+    first_events.clear()
+    await registry.get_agent("echo-agent-minimal").handle_text("Hello again")
+
+    assert len(first_events) > 0
+    assert len(later_events) == len(first_events)
+
+
+@pytest.mark.asyncio
+async def test_unregistered_event_listeners_are_not_called(registry):
+    """Test that agents created after a listener was unregistered or replaced no longer call it"""
+    old_events = []
+    new_events = []
+
+    def old_handler(event: Event):
+        old_events.append(event)
+
+    def new_handler(event: Event):
+        new_events.append(event)
+
+    registry.register_event_listener("", old_handler)
+    await registry.get_agent("echo-agent").handle_text("Hello")
+    assert len(old_events) > 0
+    called = len(old_events)
+
+    registry.unregister_event_listener("", old_handler)
+    registry.register_event_listener("", new_handler)
+    await registry.get_agent("echo-agent").handle_text("Hello")
+
+    assert len(old_events) == called
+    assert len(new_events) == called
+    assert registry.event_listeners == [("", None, new_handler)]
+
+    # changing the length of the list directly is noticed as well
+    registry.event_listeners.remove(("", None, new_handler))
+    await registry.get_agent("echo-agent").handle_text("Hello")
+    assert len(new_events) == called
+
+
+@pytest.mark.asyncio
+async def test_queued_event_listener(registry):
+    """Test that a queued event listener hands all events to its handler in order"""
+    events = []
+    listener = QueuedEventListener(events.append)
+    direct_events = []
+
+    registry.register_event_listener("", listener.handle_event)
+    registry.register_event_listener("", direct_events.append)
+
+    agent = registry.get_agent("echo-agent-minimal")
+    await agent.handle_text("Hello world")
+    await listener.aflush()
+
+    assert events == direct_events
+    assert listener.dropped == 0
+    await listener.aclose()
+
+
+def test_queued_event_listener_drops_events_when_full():
+    """Test that events beyond the queue size are dropped instead of blocking, and handler errors are survived"""
+    handled = []
+    release = threading.Event()
+
+    def slow_handler(event):
+        release.wait()
+        if event == "fail":
+            raise ValueError("failed on purpose")
+        handled.append(event)
+
+    listener = QueuedEventListener(slow_handler, max_queue_size=1)
+    listener.handle_event("fail")
+    # the first event may still be queued or already taken by the handler
+    for event in ["first", "second", "third"]:
+        listener.handle_event(event)
+    release.set()
+    listener.flush()
+    listener.handle_event("last")
+    listener.close()
+
+    assert listener.dropped in (2, 3)
+    assert handled[-1] == "last"
+
+
+def test_queued_event_listener_drops_events_after_close():
+    """Test that closing twice is harmless and events after close are counted as dropped"""
+    handled = []
+    listener = QueuedEventListener(handled.append)
+    listener.handle_event("first")
+    listener.close()
+    listener.close()
+    listener.handle_event("late")
+
+    assert handled == ["first"]
+    assert listener.dropped == 1
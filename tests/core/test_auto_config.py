@@ -1,15 +1,14 @@
 from pathlib import Path
 from xaibo import AgentConfig
 
+# Find the resources directory relative to this test file
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+ECHO_YAML = RESOURCES_DIR / "yaml" / "echo.yaml"
+
+
 def test_auto_config_text_handler():
     """Test that text handler is automatically configured when unambiguous"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
+    config = AgentConfig.from_yaml(ECHO_YAML.read_text(encoding="utf-8"))
         
     # Verify text handler exchange was added
     text_handler_exchanges = [ex for ex in config.exchange 
@@ -24,13 +23,7 @@ def test_auto_config_text_handler():
 
 def test_auto_config_response():
     """Test that response module is automatically added"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
+    config = AgentConfig.from_yaml(ECHO_YAML.read_text(encoding="utf-8"))
         
     # Verify response module was added
     response_modules = [m for m in config.modules if m.id == "__response__"]
@@ -42,13 +35,7 @@ def test_auto_config_response():
 
 def test_auto_config_uses_field():
     """Test that uses field is correctly populated for modules that require protocols"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
+    config = AgentConfig.from_yaml(ECHO_YAML.read_text(encoding="utf-8"))
         
     # Find the echo module
     echo_modules = [m for m in config.modules if m.id == "echo"]
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from pathlib import Path
 from xaibo import AgentConfig, Registry, ConfigOverrides, ModuleConfig, ExchangeConfig
@@ -5,83 +7,61 @@ from xaibo.core import Exchange
 
 from xaibo.core.models import Response, EventType
 
+# Find the resources directory relative to this test file
+RESOURCES_DIR = Path(__file__).parent.parent / "resources"
+ECHO_YAML = RESOURCES_DIR / "yaml" / "echo.yaml"
+
 
 @pytest.mark.asyncio
-async def test_instantiate_complete_echo():
+async def test_instantiate_complete_echo(echo_complete_registry):
     """Test instantiating an echo agent from complete config"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the complete echo config
-    with open(resources_dir / "yaml" / "echo_complete.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create registry and register agent
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Get agent instance
-    agent = registry.get_agent("echo-agent")
+    agent = echo_complete_registry.get_agent("echo-agent")
 
     # Test text handling
     response = await agent.handle_text("Hello world")
     assert response.text == "You said: Hello world"
 
 @pytest.mark.asyncio
-async def test_instantiate_minimal_echo():
+async def test_instantiate_minimal_echo(echo_registry):
     """Test instantiating an echo agent from minimal config"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    # Load the minimal echo config
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create registry and register agent
-    registry = Registry()
-    registry.register_agent(config)
-    
     # Get agent instance
-    agent = registry.get_agent("echo-agent-minimal")
+    agent = echo_registry.get_agent("echo-agent-minimal")
     
     # Test text handling
     response = await agent.handle_text("Hello world")
     assert response.text == "You said: Hello world"
 
-@pytest.mark.asyncio
-async def test_instantiate_with_overrides():
-    """Test instantiating an echo agent with custom bindings"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    registry = Registry()
-    registry.register_agent(config)
+class MockResponse:
+    """Response handler that keeps the last response for inspection"""
+    last_response = None
 
-    # Create mock response handler
-    class MockResponse:
-        async def respond_text(self, text: str) -> None:
-            self.last_response = text
+    async def respond_text(self, text: str) -> None:
+        self.last_response = text
 
-        async def get_response(self) -> Response:
-            return Response(self.last_response)
-    
+    async def get_response(self) -> Response:
+        return Response(self.last_response)
+
+
+def _replace_response_instance(mock_response: MockResponse) -> ConfigOverrides:
+    return ConfigOverrides(instances={'__response__': mock_response})
+
+
+def _rebind_response_protocol(mock_response: MockResponse) -> ConfigOverrides:
+    return ConfigOverrides(
+        instances={'mock_response': mock_response},
+        exchange=[ExchangeConfig(module='echo', protocol='ResponseProtocol', provider='mock_response')]
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("make_overrides", [_replace_response_instance, _rebind_response_protocol])
+async def test_instantiate_with_overrides(echo_registry, make_overrides):
+    """Test instantiating an echo agent with custom bindings"""
     mock_response = MockResponse()
 
     # Get agent with mock response handler
-    agent = registry.get_agent_with("echo-agent-minimal", ConfigOverrides(
-        instances={
-            '__response__': mock_response
-        }
-    ))
+    agent = echo_registry.get_agent_with("echo-agent-minimal", make_overrides(mock_response))
     
     # Test text handling
     test_message = "Hello world"
@@ -109,13 +89,8 @@ class ModuleWithNamedDependency:
 @pytest.mark.asyncio
 async def test_instantiate_with_field_name_exchange():
     """Test instantiating an agent with field_name in ExchangeConfig"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
+    content = ECHO_YAML.read_text(encoding="utf-8")
+    config = AgentConfig.from_yaml(content)
     
     # Add modules to config
     config.modules.append(ModuleConfig(
@@ -149,29 +124,15 @@ async def test_instantiate_with_field_name_exchange():
     assert dependency_method_result == "dependency called"
 
 @pytest.mark.asyncio
-async def test_instantiate_with_debug_listener():
+async def test_instantiate_with_debug_listener(echo_registry):
     """Test instantiating an agent with a debug event listener"""
-    # Find the resources directory relative to this test file
-    test_dir = Path(__file__).parent
-    resources_dir = test_dir.parent / "resources"
-    
-    with open(resources_dir / "yaml" / "echo.yaml") as f:
-        content = f.read()
-        config = AgentConfig.from_yaml(content)
-    
-    # Create a registry with debug listener
-    registry = Registry()
-    
     # Create a simple event collector
     collected_events = []
     def collect_event(event):
         collected_events.append(event)
     
-    # Register the agent with event listener
-    registry.register_agent(config)
-    
-    # Get agent instance
-    agent = registry.get_agent_with("echo-agent-minimal", None, additional_event_listeners=[("", collect_event)])
+    # Get agent instance with the event listener
+    agent = echo_registry.get_agent_with("echo-agent-minimal", None, additional_event_listeners=[("", collect_event)])
     
     # Test text handling
     response = await agent.handle_text("Hello world")
@@ -380,3 +341,143 @@ async def test_list_dependency_without_field_name():
     dependency_ids = [await dep.get_id() for dep in dependencies]
     assert "dep1" in dependency_ids
     assert "dep2" in dependency_ids
+
+# Create a module with an annotated constructor return type
+class ModuleWithReturnAnnotation:
+    def __init__(self, dependency: DependencyModule, config=None) -> None:
+        self.dependency = dependency
+
+    async def get_dependency(self):
+        return self.dependency
+
+@pytest.mark.asyncio
+async def test_return_annotation_is_not_a_dependency():
+    """Test that a `-> None` annotation on __init__ is not treated as an injectable parameter"""
+    config = AgentConfig(
+        id='return_annotation_agent',
+        modules=[
+            ModuleConfig(
+                id="annotated_module",
+                module=f"{ModuleWithReturnAnnotation.__module__}.ModuleWithReturnAnnotation"
+            ),
+            ModuleConfig(
+                id="dependency_module",
+                module=f"{DependencyModule.__module__}.DependencyModule"
+            )
+        ],
+        exchange=[
+            ExchangeConfig(
+                module="annotated_module",
+                protocol="DependencyModule",
+                provider="dependency_module"
+            )
+        ]
+    )
+
+    exchange = Exchange(config=config)
+
+    module = exchange.get_module("annotated_module", "test")
+    dependency = await module.get_dependency()
+    assert await dependency.do_something() == "dependency called"
+
+# Create modules that depend on each other
+class CyclicModuleA:
+    def __init__(self, other: DependencyModule, config=None):
+        self.other = other
+
+class CyclicModuleB:
+    def __init__(self, other: DependencyModule, config=None):
+        self.other = other
+
+def test_circular_dependency_raises():
+    """Test that circular dependencies between modules are reported instead of looping forever"""
+    config = AgentConfig(
+        id='cyclic_agent',
+        modules=[
+            ModuleConfig(
+                id="module_a",
+                module=f"{CyclicModuleA.__module__}.CyclicModuleA"
+            ),
+            ModuleConfig(
+                id="module_b",
+                module=f"{CyclicModuleB.__module__}.CyclicModuleB"
+            )
+        ],
+        exchange=[
+            ExchangeConfig(
+                module="module_a",
+                field_name="other",
+                protocol="DependencyModule",
+                provider="module_b"
+            ),
+            ExchangeConfig(
+                module="module_b",
+                field_name="other",
+                protocol="DependencyModule",
+                provider="module_a"
+            )
+        ]
+    )
+
+    with pytest.raises(ValueError, match="Circular dependency detected between modules: module_a -> module_b -> module_a"):
+        Exchange(config=config)
+
+def test_modules_without_dependencies():
+    """Test that modules without injectable parameters are all instantiated"""
+    config = AgentConfig(
+        id='independent_agent',
+        modules=[
+            ModuleConfig(
+                id="dep1",
+                module=f"{DependencyModuleWithId.__module__}.DependencyModuleWithId",
+                config={"id": "dep1"}
+            ),
+            ModuleConfig(
+                id="dep2",
+                module=f"{DependencyModuleWithId.__module__}.DependencyModuleWithId",
+                config={"id": "dep2"}
+            )
+        ]
+    )
+    # the implicit response handler takes no dependencies either
+    exchange = Exchange(config=config)
+
+    assert exchange.module_instances["dep1"].id == "dep1"
+    assert exchange.module_instances["dep2"].id == "dep2"
+    assert "__response__" in exchange.module_instances
+
+def test_get_agent_leaves_registered_config_unchanged():
+    """Test that instantiating agents does not add bindings to the registered config"""
+    config = AgentConfig.from_yaml(ECHO_YAML.read_text())
+    registry = Registry()
+    registry.register_agent(config)
+    exchange_before = list(config.exchange)
+
+    for _ in range(3):
+        registry.get_agent("echo-agent-minimal")
+
+    assert config.exchange == exchange_before
+
+
+def test_agents_can_be_instantiated_while_others_are_registered(echo_agent_configs):
+    """Test that registering and unregistering agents doesn't disturb threads instantiating other agents"""
+    registry = Registry()
+    registry.register_agent(echo_agent_configs["echo-agent-minimal"])
+    stop = threading.Event()
+
+    def churn():
+        while not stop.is_set():
+            registry.register_agent(echo_agent_configs["echo-agent"])
+            registry.unregister_agent("echo-agent")
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    try:
+        for _ in range(500):
+            assert registry.get_agent("echo-agent-minimal").id == "echo-agent-minimal"
+            assert "echo-agent-minimal" in registry.list_agents()
+    finally:
+        stop.set()
+        churner.join()
+
+    assert registry.list_agents() == ["echo-agent-minimal"]
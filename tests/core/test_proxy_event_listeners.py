@@ -1,8 +1,18 @@
+import functools
+
 import pytest
 
 from xaibo.core.exchange import Proxy
 from xaibo.core.models.events import Event, EventType
 
+def passthrough(method):
+    """A decorator that hides that the method it wraps is a coroutine function"""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        return method(*args, **kwargs)
+    return wrapper
+
+
 class DummyClass:
     async def test_method(self, arg1, arg2=None):
         return f"{arg1}-{arg2}"
@@ -10,6 +20,21 @@ class DummyClass:
     async def another_method(self):
         return "hello"
 
+    def sync_method(self, value):
+        return value * 2
+
+    async def stream_method(self):
+        yield "a"
+        yield "b"
+
+    @passthrough
+    async def decorated_method(self, value):
+        return value * 3
+
+    @passthrough
+    async def decorated_failing_method(self):
+        raise ValueError("failed on purpose")
+
 @pytest.mark.asyncio
 async def test_proxy_event_listeners():
     events = []
@@ -86,3 +111,70 @@ async def test_multiple_event_listeners():
     assert all(e.method_name == "another_method" for e in events2)
     assert all(e.agent_id == "test-agent" for e in events1)
     assert all(e.agent_id == "test-agent" for e in events2)
+
+@pytest.mark.asyncio
+async def test_repeated_calls_get_distinct_call_ids():
+    events = []
+
+    def event_handler(event: Event):
+        events.append(event)
+
+    obj = DummyClass()
+    proxy = Proxy(obj, event_listeners=[("", event_handler)], agent_id="test-agent", caller_id="test-caller", module_id="test-module")
+
+    # Method proxies are cached per attribute name
+    assert proxy.test_method is proxy.test_method
+
+    await proxy.test_method("foo")
+    await proxy.test_method("bar")
+
+    assert len(events) == 4
+    assert events[0].call_id == events[1].call_id
+    assert events[2].call_id == events[3].call_id
+    assert events[0].call_id != events[2].call_id
+
+@pytest.mark.asyncio
+async def test_proxy_sync_and_generator_methods():
+    events = []
+
+    def event_handler(event: Event):
+        events.append(event)
+
+    obj = DummyClass()
+    proxy = Proxy(obj, event_listeners=[("", event_handler)], agent_id="test-agent", caller_id="test-caller", module_id="test-module")
+
+    assert proxy.sync_method(21) == 42
+    assert [chunk async for chunk in proxy.stream_method()] == ["a", "b"]
+
+    assert [(e.method_name, e.event_type) for e in events] == [
+        ("sync_method", EventType.CALL),
+        ("sync_method", EventType.RESULT),
+        ("stream_method", EventType.CALL),
+        ("stream_method", EventType.RESULT),
+    ]
+    assert events[1].result == 42
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_listener", [True, False])
+async def test_proxy_decorated_async_methods(with_listener):
+    """Test that awaitables returned by decorated async methods are awaited before their outcome is reported"""
+    events = []
+    listeners = [("", events.append)] if with_listener else []
+    proxy = Proxy(DummyClass(), event_listeners=listeners, agent_id="test-agent", caller_id="test-caller", module_id="test-module")
+
+    assert await proxy.decorated_method(2) == 6
+    with pytest.raises(ValueError, match="failed on purpose"):
+        await proxy.decorated_failing_method()
+
+    if with_listener:
+        assert [(e.method_name, e.event_type) for e in events] == [
+            ("decorated_method", EventType.CALL),
+            ("decorated_method", EventType.RESULT),
+            ("decorated_failing_method", EventType.CALL),
+            ("decorated_failing_method", EventType.EXCEPTION),
+        ]
+        assert events[1].result == 6
+        assert "failed on purpose" in events[3].exception
+    else:
+        assert events == []
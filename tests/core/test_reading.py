@@ -1,5 +1,8 @@
 from pathlib import Path
+
+import pytest
 from ruamel.yaml import YAML
+from ruamel.yaml.constructor import DuplicateKeyError
 from xaibo import AgentConfig
 
 def _read_yaml_config(filename):
@@ -100,3 +103,111 @@ def test_load_directory():
             
             _assert_modules_match(config, raw_yaml)
             _assert_exchange_matches(config, raw_yaml)
+
+def test_load_directory_reuses_cached_configs(tmp_path):
+    """Test that unchanged files are not parsed again when a cache is passed"""
+    yaml_dir = Path(__file__).parent.parent / "resources" / "yaml"
+    echo_path = tmp_path / "echo.yaml"
+    echo_path.write_text((yaml_dir / "echo.yaml").read_text())
+    tool_path = tmp_path / "tool.yaml"
+    tool_path.write_text((yaml_dir / "simple_tool_orchestrator.yaml").read_text())
+
+    cache = {}
+    first = AgentConfig.load_directory(str(tmp_path), cache=cache)
+    second = AgentConfig.load_directory(str(tmp_path), cache=cache)
+    assert first[str(echo_path)] is second[str(echo_path)]
+    assert first[str(tool_path)] is second[str(tool_path)]
+
+    echo_path.write_text((yaml_dir / "echo_complete.yaml").read_text())
+    tool_path.unlink()
+    third = AgentConfig.load_directory(str(tmp_path), cache=cache)
+    assert third[str(echo_path)] is not first[str(echo_path)]
+    assert list(third.keys()) == [str(echo_path)]
+    assert list(cache.keys()) == [str(echo_path)]
+
+def test_load_directory_walks_subdirectories(tmp_path):
+    """Test that configs in nested directories are found, skipping other files and symlinked directories"""
+    yaml_dir = Path(__file__).parent.parent / "resources" / "yaml"
+    nested_dir = tmp_path / "team" / "support"
+    nested_dir.mkdir(parents=True)
+    top_path = tmp_path / "echo.yml"
+    top_path.write_text((yaml_dir / "echo.yaml").read_text())
+    nested_path = nested_dir / "echo_complete.yaml"
+    nested_path.write_text((yaml_dir / "echo_complete.yaml").read_text())
+    (nested_dir / "notes.txt").write_text("not an agent")
+    (tmp_path / "linked").symlink_to(nested_dir, target_is_directory=True)
+
+    configs = AgentConfig.load_directory(str(tmp_path))
+
+    assert sorted(configs.keys()) == sorted([str(top_path), str(nested_path)])
+    assert configs[str(nested_path)].id == "echo-agent"
+
+def test_from_yaml_returns_independent_configs():
+    """Test that parsing the same YAML twice gives equal configs that can be modified independently"""
+    content = (Path(__file__).parent.parent / "resources" / "yaml" / "echo.yaml").read_text()
+
+    first = AgentConfig.from_yaml(content)
+    second = AgentConfig.from_yaml(content)
+    assert first == second
+    assert first is not second
+
+    first.modules.pop()
+    first.modules[0].config["prefix"] = "changed"
+    assert AgentConfig.from_yaml(content) == second
+
+def test_from_yaml_resolves_yaml_1_2_scalars():
+    """Test that plain scalars are read as YAML 1.2, whichever YAML parser is used"""
+    config = AgentConfig.from_yaml("""
+id: scalar-agent
+modules:
+  - module: xaibo_examples.echo.Echo
+    id: echo
+    config:
+      answer: no
+      switch: off
+      enabled: true
+      decimal: 010
+      octal: 0o17
+      hex: 0x1F
+      big: 1_000
+      ratio: 1e3
+      duration: 1:20
+      nothing: ~
+""")
+    echo_config = next(m for m in config.modules if m.id == "echo").config
+    assert echo_config == {
+        "answer": "no",
+        "switch": "off",
+        "enabled": True,
+        "decimal": 10,
+        "octal": 15,
+        "hex": 31,
+        "big": 1000,
+        "ratio": 1000.0,
+        "duration": "1:20",
+        "nothing": None,
+    }
+
+
+@pytest.mark.parametrize("content", [
+    "id: first\nid: second\nmodules: []\n",
+    "id: agent\nmodules:\n  - module: xaibo_examples.echo.Echo\n    id: echo\n    config:\n      prefix: a\n      prefix: b\n",
+])
+def test_from_yaml_rejects_duplicate_keys(content):
+    """Test that duplicate mapping keys are rejected, whichever YAML parser is used"""
+    with pytest.raises(DuplicateKeyError):
+        AgentConfig.from_yaml(content)
+
+
+def test_from_yaml_allows_overriding_merged_keys():
+    """Test that keys merged in with << can be overridden"""
+    config = AgentConfig.from_yaml("""
+id: merge-agent
+modules:
+  - module: xaibo_examples.echo.Echo
+    id: echo
+    config:
+      <<: {prefix: "merged: ", other: 1}
+      prefix: "own: "
+""")
+    assert next(m for m in config.modules if m.id == "echo").config == {"prefix": "own: ", "other": 1}
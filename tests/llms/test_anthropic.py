@@ -1,24 +1,45 @@
 import os
+from contextlib import aclosing
 from pathlib import Path
 import pytest
+import pytest_asyncio
 
 from xaibo.primitives.modules.llm import AnthropicLLM
 from xaibo.core.models.tools import Tool, ToolParameter
 from xaibo.core.models.llm import LLMMessage, LLMMessageContent, LLMMessageContentType, LLMOptions, LLMRole, LLMFunctionCall, LLMFunctionResult
 
 
-@pytest.mark.asyncio
-async def test_anthropic_generate():
-    """Test basic generation with Anthropic LLM"""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def llm():
+    """Anthropic LLM shared by the tests of this module, so they reuse its HTTP connections"""
     # Skip if no API key is available
     if not os.environ.get("ANTHROPIC_API_KEY"):
         pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
+
     llm = AnthropicLLM({
         "model": "claude-3-haiku-20240307"
     })
-    
+    yield llm
+    await llm.client.close()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def opus_llm():
+    """Anthropic LLM using Opus, as it has better tool use capabilities"""
+    # Skip if no API key is available
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
+
+    llm = AnthropicLLM({
+        "model": "claude-3-opus-20240229"
+    })
+    yield llm
+    await llm.client.close()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_generate(llm):
+    """Test basic generation with Anthropic LLM"""
     # Create a simple message
     messages = [
         LLMMessage.user("Say exactly 'hello world'")
@@ -37,18 +58,9 @@ async def test_anthropic_generate():
     assert response.usage.total_tokens > 0
 
 
-@pytest.mark.asyncio
-async def test_anthropic_generate_with_options():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_generate_with_options(llm):
     """Test generation with options"""
-    # Skip if no API key is available
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = AnthropicLLM({
-        "model": "claude-3-haiku-20240307"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.system("You are a helpful assistant that speaks like a pirate."),
@@ -71,18 +83,11 @@ async def test_anthropic_generate_with_options():
     assert not (response.content.endswith(".") or response.content.endswith("!"))
 
 
-@pytest.mark.asyncio
-async def test_anthropic_function_calling():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_function_calling(opus_llm):
     """Test function calling with Anthropic"""
-    # Skip if no API key is available
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = AnthropicLLM({
-        "model": "claude-3-opus-20240229"  # Using Opus as it has better tool use capabilities
-    })
-    
+    llm = opus_llm
+
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -122,18 +127,11 @@ async def test_anthropic_function_calling():
     assert "location" in response.tool_calls[0].arguments
     assert response.tool_calls[0].arguments["location"] == "San Francisco, CA"
 
-@pytest.mark.asyncio
-async def test_anthropic_tool_response():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_tool_response(opus_llm):
     """Test processing of tool call responses with Anthropic"""
-    # Skip if no API key is available
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = AnthropicLLM({
-        "model": "claude-3-opus-20240229"
-    })
-    
+    llm = opus_llm
+
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -170,53 +168,36 @@ async def test_anthropic_tool_response():
     assert "72" in response.content or "sunny" in response.content
 
 
-@pytest.mark.asyncio
-async def test_anthropic_streaming():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_streaming(llm):
     """Test streaming with Anthropic"""
-    # Skip if no API key is available
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = AnthropicLLM({
-        "model": "claude-3-haiku-20240307"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.user(content="Count from 1 to 5")
     ]
     
-    # Generate a streaming response
-    chunks = []
-    async for chunk in llm.generate_stream(messages):
-        chunks.append(chunk)
+    # Count the chunks and the digits seen so far, stopping once the response counted to 5
+    expected_digits = set("12345")
+    seen_digits = set()
+    chunk_count = 0
+    async with aclosing(llm.generate_stream(messages)) as stream:
+        async for chunk in stream:
+            chunk_count += 1
+            seen_digits.update(expected_digits.intersection(chunk))
+            if chunk_count > 1 and seen_digits == expected_digits:
+                break
     
     # Verify we got multiple chunks
-    assert len(chunks) > 1
+    assert chunk_count > 1
     
-    # Verify the combined content makes sense
-    combined = "".join(chunks)
-    assert "1" in combined
-    assert "2" in combined
-    assert "3" in combined
-    assert "4" in combined
-    assert "5" in combined
+    # Verify the streamed content makes sense
+    assert seen_digits == expected_digits
 
 
 
-@pytest.mark.asyncio
-async def test_anthropic_image_content():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_anthropic_image_content(llm):
     """Test Anthropic's ability to understand image content"""
-    # Skip if no API key is available
-    if not os.environ.get("ANTHROPIC_API_KEY"):
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = AnthropicLLM({
-        "model": "claude-3-haiku-20240307"
-    })
-
     test_dir = Path(__file__).parent
     image_path = test_dir.parent / "resources" / "images" / "hello-xaibo.png"
 
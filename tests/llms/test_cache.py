@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+
+from xaibo.core.models.llm import LLMMessage, LLMOptions, LLMResponse
+from xaibo.primitives.modules.llm.cache import LLMCache, SemanticLLMCache
+from xaibo.primitives.modules.llm.mock import MockLLM
+
+
+@pytest.fixture
+def mock_llm():
+    return MockLLM({
+        "responses": [
+            LLMResponse(content="First response").model_dump(),
+            LLMResponse(content="Second response").model_dump(),
+            LLMResponse(content="Third response").model_dump()
+        ]
+    })
+
+
+DETERMINISTIC = LLMOptions(temperature=0)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_cached(mock_llm):
+    cache = LLMCache(mock_llm)
+    messages = [LLMMessage.user("Hello")]
+
+    first = await cache.generate(messages, DETERMINISTIC)
+    second = await cache.generate([LLMMessage.user("Hello")], LLMOptions(temperature=0))
+
+    assert first.content == "First response"
+    assert second.content == "First response"
+    # callers get their own copy of the cached response
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_different_requests_are_not_shared(mock_llm):
+    cache = LLMCache(mock_llm)
+
+    first = await cache.generate([LLMMessage.user("Hello")], DETERMINISTIC)
+    other_message = await cache.generate([LLMMessage.user("Goodbye")], DETERMINISTIC)
+    other_options = await cache.generate([LLMMessage.user("Hello")], LLMOptions(temperature=0, max_tokens=10))
+
+    assert first.content == "First response"
+    assert other_message.content == "Second response"
+    assert other_options.content == "Third response"
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_are_not_cached_by_default(mock_llm):
+    cache = LLMCache(mock_llm)
+    messages = [LLMMessage.user("Hello")]
+
+    assert (await cache.generate(messages)).content == "First response"
+    assert (await cache.generate(messages)).content == "Second response"
+
+    sampling_cache = LLMCache(mock_llm, {"cache_sampled": True})
+    assert (await sampling_cache.generate(messages)).content == "Third response"
+    assert (await sampling_cache.generate(messages)).content == "Third response"
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_response_is_evicted(mock_llm):
+    cache = LLMCache(mock_llm, {"max_entries": 1})
+
+    await cache.generate([LLMMessage.user("Hello")], DETERMINISTIC)
+    await cache.generate([LLMMessage.user("Goodbye")], DETERMINISTIC)
+    response = await cache.generate([LLMMessage.user("Hello")], DETERMINISTIC)
+
+    assert response.content == "Third response"
+
+
+@pytest.mark.asyncio
+async def test_responses_are_persisted_in_cache_dir(mock_llm, tmp_path):
+    messages = [LLMMessage.user("Hello")]
+
+    cache = LLMCache(mock_llm, {"cache_dir": str(tmp_path / "llm")})
+    assert (await cache.generate(messages, DETERMINISTIC)).content == "First response"
+
+    # a new instance, e.g. of the next agent, reads the response from disk
+    restarted_cache = LLMCache(mock_llm, {"cache_dir": str(tmp_path / "llm")})
+    assert (await restarted_cache.generate(messages, DETERMINISTIC)).content == "First response"
+    assert len(list((tmp_path / "llm").glob("*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_streaming_is_passed_through(mock_llm):
+    cache = LLMCache(mock_llm)
+
+    chunks = [chunk async for chunk in cache.generate_stream([LLMMessage.user("Hello")], DETERMINISTIC)]
+
+    assert "".join(chunks) == "First response"
+
+
+class KeywordEmbedder:
+    """Embeds texts by the weather and greeting words they contain"""
+    async def text_to_embedding(self, text: str) -> np.ndarray:
+        text = text.lower()
+        return np.array([
+            float("weather" in text or "forecast" in text),
+            float("hello" in text or "hi" in text.split()),
+            0.1
+        ])
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_reuses_responses_of_similar_requests(mock_llm):
+    cache = SemanticLLMCache(mock_llm, KeywordEmbedder())
+
+    first = await cache.generate([LLMMessage.user("What's the weather like?")], DETERMINISTIC)
+    similar = await cache.generate([LLMMessage.user("What is the weather forecast?")], DETERMINISTIC)
+    different = await cache.generate([LLMMessage.user("Hello there")], DETERMINISTIC)
+
+    assert first.content == "First response"
+    assert similar.content == "First response"
+    assert different.content == "Second response"
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_requires_the_rest_of_the_request_to_match(mock_llm):
+    cache = SemanticLLMCache(mock_llm, KeywordEmbedder())
+
+    first = await cache.generate([LLMMessage.user("What's the weather like?")], DETERMINISTIC)
+    other_options = await cache.generate([LLMMessage.user("What's the weather like?")], LLMOptions(temperature=0, max_tokens=10))
+    other_role = await cache.generate([LLMMessage.system("What's the weather like?")], DETERMINISTIC)
+
+    assert first.content == "First response"
+    assert other_options.content == "Second response"
+    assert other_role.content == "Third response"
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_compares_only_the_last_user_message(mock_llm):
+    cache = SemanticLLMCache(mock_llm, KeywordEmbedder())
+    prompt = LLMMessage.system("You are a helpful assistant that knows the weather. " * 20)
+
+    first = await cache.generate([prompt, LLMMessage.user("What's the weather like?")], DETERMINISTIC)
+    # the long shared prompt doesn't make a different question similar
+    different = await cache.generate([prompt, LLMMessage.user("Hello there")], DETERMINISTIC)
+    similar = await cache.generate([prompt, LLMMessage.user("What is the weather forecast?")], DETERMINISTIC)
+    # earlier messages have to match exactly
+    other_history = await cache.generate([LLMMessage.system("Be brief."), LLMMessage.user("What's the weather like?")], DETERMINISTIC)
+
+    assert first.content == "First response"
+    assert different.content == "Second response"
+    assert similar.content == "First response"
+    assert other_history.content == "Third response"
+
+
+@pytest.mark.asyncio
+async def test_semantic_cache_evicts_the_oldest_responses_of_all_groups(mock_llm):
+    cache = SemanticLLMCache(mock_llm, KeywordEmbedder(), {"max_entries": 2})
+
+    await cache.generate([LLMMessage.user("What's the weather like?")], DETERMINISTIC)
+    await cache.generate([LLMMessage.system("Be brief."), LLMMessage.user("Hello there")], DETERMINISTIC)
+    await cache.generate([LLMMessage.system("Be verbose."), LLMMessage.user("Hello there")], DETERMINISTIC)
+
+    # the weather question was cached first, so it was dropped, while the greetings of both groups are kept
+    assert [responses[0].content for responses in cache._semantic_responses.values()] == ["Second response", "Third response"]
+
+
+@pytest.mark.asyncio
+async def test_cache_dir_is_shared_per_model(tmp_path):
+    def llm(model, content):
+        llm = MockLLM({"responses": [LLMResponse(content=content).model_dump()]})
+        llm.model = model
+        return llm
+
+    messages = [LLMMessage.user("Hello")]
+    config = {"cache_dir": str(tmp_path / "llm")}
+
+    assert (await LLMCache(llm("small", "Small response"), config).generate(messages, DETERMINISTIC)).content == "Small response"
+    assert (await LLMCache(llm("large", "Large response"), config).generate(messages, DETERMINISTIC)).content == "Large response"
+    assert (await LLMCache(llm("small", "Other response"), config).generate(messages, DETERMINISTIC)).content == "Small response"
+    # an explicit namespace takes precedence over the model
+    namespaced = LLMCache(llm("large", "Namespaced response"), {**config, "cache_namespace": "tenant"})
+    assert (await namespaced.generate(messages, DETERMINISTIC)).content == "Namespaced response"
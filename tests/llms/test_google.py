@@ -1,25 +1,32 @@
 import os
+from contextlib import aclosing
 from pathlib import Path
 import pytest
+import pytest_asyncio
 
 from xaibo.primitives.modules.llm.google import GoogleLLM
 from xaibo.core.models.tools import Tool, ToolParameter
 from xaibo.core.models.llm import LLMMessage, LLMMessageContent, LLMMessageContentType, LLMOptions, LLMRole, LLMFunctionCall, LLMFunctionResult
 
 
-@pytest.mark.asyncio
-async def test_google_generate():
-    """Test basic generation with Google Gemini LLM"""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def llm():
+    """Google LLM shared by the tests of this module, so they reuse its HTTP connections"""
     # Skip if no API key is available
     if not os.environ.get("GOOGLE_API_KEY"):
         pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
+
     llm = GoogleLLM({
         "api_key": os.environ.get("GOOGLE_API_KEY"),
         "model": "gemini-2.0-flash-001"
     })
-    
+    yield llm
+    await llm.client.aio.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_generate(llm):
+    """Test basic generation with Google Gemini LLM"""
     # Create a simple message
     messages = [
         LLMMessage.user("Say exactly 'hello world'")
@@ -38,19 +45,9 @@ async def test_google_generate():
     assert response.usage.total_tokens > 0
 
 
-@pytest.mark.asyncio
-async def test_google_generate_with_options():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_generate_with_options(llm):
     """Test generation with options"""
-    # Skip if no API key is available
-    if not os.environ.get("GOOGLE_API_KEY"):
-        pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = GoogleLLM({
-        "api_key": os.environ.get("GOOGLE_API_KEY"),
-        "model": "gemini-2.0-flash-001"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.system("You are a helpful assistant that speaks like a pirate."),
@@ -73,19 +70,9 @@ async def test_google_generate_with_options():
     assert not (response.content.endswith(".") or response.content.endswith("!"))
 
 
-@pytest.mark.asyncio
-async def test_google_function_calling():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_function_calling(llm):
     """Test function calling with Google Gemini"""
-    # Skip if no API key is available
-    if not os.environ.get("GOOGLE_API_KEY"):
-        pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = GoogleLLM({
-        "api_key": os.environ.get("GOOGLE_API_KEY"),
-        "model": "gemini-2.0-flash-001"
-    })
-    
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -125,19 +112,9 @@ async def test_google_function_calling():
     assert "San Francisco" in response.tool_calls[0].arguments["location"]
 
 
-@pytest.mark.asyncio
-async def test_google_tool_response():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_tool_response(llm):
     """Test processing of tool call responses with Google Gemini"""
-    # Skip if no API key is available
-    if not os.environ.get("GOOGLE_API_KEY"):
-        pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = GoogleLLM({
-        "api_key": os.environ.get("GOOGLE_API_KEY"),
-        "model": "gemini-2.0-flash-001"
-    })
-    
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -174,55 +151,36 @@ async def test_google_tool_response():
     assert "72" in response.content or "sunny" in response.content
 
 
-@pytest.mark.asyncio
-async def test_google_streaming():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_streaming(llm):
     """Test streaming with Google Gemini"""
-    # Skip if no API key is available
-    if not os.environ.get("GOOGLE_API_KEY"):
-        pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = GoogleLLM({
-        "api_key": os.environ.get("GOOGLE_API_KEY"),
-        "model": "gemini-2.0-flash-001"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.user("Count from 1 to 5")
     ]
     
-    # Generate a streaming response
-    chunks = []
-    async for chunk in llm.generate_stream(messages):
-        chunks.append(chunk)
+    # Count the chunks and the digits seen so far, stopping once the response counted to 5
+    expected_digits = set("12345")
+    seen_digits = set()
+    chunk_count = 0
+    async with aclosing(llm.generate_stream(messages)) as stream:
+        async for chunk in stream:
+            chunk_count += 1
+            seen_digits.update(expected_digits.intersection(chunk))
+            if chunk_count > 1 and seen_digits == expected_digits:
+                break
     
     # Verify we got multiple chunks
-    assert len(chunks) > 1
+    assert chunk_count > 1
     
-    # Verify the combined content makes sense
-    combined = "".join(chunks)
-    assert "1" in combined
-    assert "2" in combined
-    assert "3" in combined
-    assert "4" in combined
-    assert "5" in combined
+    # Verify the streamed content makes sense
+    assert seen_digits == expected_digits
 
 
 
-@pytest.mark.asyncio
-async def test_google_image_content():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_google_image_content(llm):
     """Test Google Gemini's ability to understand image content"""
-    # Skip if no API key is available
-    if not os.environ.get("GOOGLE_API_KEY"):
-        pytest.skip("GOOGLE_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = GoogleLLM({
-        "api_key": os.environ.get("GOOGLE_API_KEY"),
-        "model": "gemini-2.0-flash-001"
-    })
-
     test_dir = Path(__file__).parent
     image_path = test_dir.parent / "resources" / "images" / "hello-xaibo.png"
 
@@ -1,25 +1,29 @@
-import os
+import asyncio
+import gc
+from contextlib import aclosing
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
-from xaibo.primitives.modules.llm.openai import OpenAILLM
+from xaibo.primitives.modules.llm.openai import OpenAILLM, aclose_shared_clients
 from xaibo.core.models.tools import Tool, ToolParameter
 from xaibo.core.models.llm import LLMMessage, LLMMessageContent, LLMMessageContentType, LLMOptions, LLMRole, LLMFunctionCall, LLMFunctionResult
 
 
-@pytest.mark.asyncio
-async def test_openai_generate():
-    """Test basic generation with OpenAI LLM"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
-    # Initialize the LLM
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def llm(openai_available):
+    """OpenAI LLM shared by the tests of this module, so they reuse its HTTP connections"""
     llm = OpenAILLM({
         "model": "gpt-4.1-nano"
     })
-    
+    yield llm
+    await aclose_shared_clients()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_generate(llm):
+    """Test basic generation with OpenAI LLM"""
     # Create a simple message
     messages = [
         LLMMessage.user("Say exactly 'hello world'")
@@ -38,18 +42,23 @@ async def test_openai_generate():
     assert response.usage.total_tokens > 0
 
 
-@pytest.mark.asyncio
-async def test_openai_generate_with_options():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_concurrent_generate(llm):
+    """Test that concurrent requests over the shared connections each get their own response"""
+    words = ["apple", "banana", "cherry", "grape"]
+
+    responses = await asyncio.gather(*(
+        llm.generate([LLMMessage.user(f"Say exactly '{word}'")])
+        for word in words
+    ))
+
+    for word, response in zip(words, responses):
+        assert word in response.content.lower()
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_generate_with_options(llm):
     """Test generation with options"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = OpenAILLM({
-        "model": "gpt-4.1-nano"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.system("You are a helpful assistant that speaks like a pirate."),
@@ -72,18 +81,9 @@ async def test_openai_generate_with_options():
     assert not (response.content.endswith(".") or response.content.endswith("!"))
 
 
-@pytest.mark.asyncio
-async def test_openai_function_calling():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_function_calling(llm):
     """Test function calling with OpenAI"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = OpenAILLM({
-        "model": "gpt-4.1-nano"
-    })
-    
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -122,18 +122,9 @@ async def test_openai_function_calling():
     assert "location" in response.tool_calls[0].arguments
     assert response.tool_calls[0].arguments["location"] == "San Francisco"
 
-@pytest.mark.asyncio
-async def test_openai_tool_response():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_tool_response(llm):
     """Test processing of tool call responses with OpenAI"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = OpenAILLM({
-        "model": "gpt-4.1-nano"
-    })
-    
     # Define a function
     get_weather_function = Tool(
         name="get_weather",
@@ -170,48 +161,36 @@ async def test_openai_tool_response():
     assert "72" in response.content or "sunny" in response.content
 
 
-@pytest.mark.asyncio
-async def test_openai_streaming():
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_streaming(llm):
     """Test streaming with OpenAI"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
-    # Initialize the LLM
-    llm = OpenAILLM({
-        "model": "gpt-4.1-nano"
-    })
-    
     # Create a simple message
     messages = [
         LLMMessage.user("Count from 1 to 5")
     ]
     
-    # Generate a streaming response
-    chunks = []
-    async for chunk in llm.generate_stream(messages):
-        chunks.append(chunk)
+    # Count the chunks and the digits seen so far, stopping once the response counted to 5
+    expected_digits = set("12345")
+    seen_digits = set()
+    chunk_count = 0
+    async with aclosing(llm.generate_stream(messages)) as stream:
+        async for chunk in stream:
+            chunk_count += 1
+            seen_digits.update(expected_digits.intersection(chunk))
+            if chunk_count > 1 and seen_digits == expected_digits:
+                break
     
     # Verify we got multiple chunks
-    assert len(chunks) > 1
+    assert chunk_count > 1
     
-    # Verify the combined content makes sense
-    combined = "".join(chunks)
-    assert "1" in combined
-    assert "2" in combined
-    assert "3" in combined
-    assert "4" in combined
-    assert "5" in combined
+    # Verify the streamed content makes sense
+    assert seen_digits == expected_digits
 
 
 
 @pytest.mark.asyncio
-async def test_openai_image_content():
+async def test_openai_image_content(openai_available):
     """Test OpenAI's ability to understand image content"""
-    # Skip if no API key is available
-    if not os.environ.get("OPENAI_API_KEY"):
-        pytest.skip("OPENAI_API_KEY environment variable not set")
-    
     # Initialize the LLM
     llm = OpenAILLM({
         "model": "gpt-4o"
@@ -297,3 +276,102 @@ def test_openai_array_schema_generation():
     assert "items" not in options_param, "Non-array parameters should not have 'items' property"
     
     print("✅ Array schema generation test passed - items property is correctly included")
+
+
+def test_openai_function_schemas_are_reused_for_the_same_tools():
+    """Test that function definitions are only built once per tool object"""
+    llm = OpenAILLM({
+        "api_key": "test-key",  # Dummy key for testing
+        "model": "gpt-4.1-nano"
+    })
+
+    tool = Tool(
+        name="get_weather",
+        description="Get the weather",
+        parameters={"city": ToolParameter(type="str", description="City name", required=True)}
+    )
+
+    first = llm._prepare_functions(LLMOptions(functions=[tool]))
+    second = llm._prepare_functions(LLMOptions(functions=[tool]))
+    assert second[0] is first[0]
+
+    other_tool = tool.model_copy(update={"name": "get_forecast"})
+    third = llm._prepare_functions(LLMOptions(functions=[other_tool]))
+    assert third[0]["function"]["name"] == "get_forecast"
+    assert third[0] is not first[0]
+
+    # the next request's instance reuses the definitions as well
+    next_llm = OpenAILLM({"api_key": "test-key", "model": "gpt-4.1-nano"})
+    assert next_llm._prepare_functions(LLMOptions(functions=[tool]))[0] is first[0]
+
+
+@pytest.mark.asyncio
+async def test_openai_instances_share_http_connections():
+    """Test that instances created on the same event loop share their HTTP connections"""
+    first = OpenAILLM({"api_key": "test-key"})
+    second = OpenAILLM({"api_key": "other-key", "base_url": "http://localhost:8000/v1"})
+
+    assert first.client._client is second.client._client
+
+
+@pytest.mark.asyncio
+async def test_openai_instances_get_their_own_api_clients():
+    """Test that instances get their own API clients, which can be closed without affecting the others"""
+    first = OpenAILLM({"api_key": "test-key", "model": "gpt-4.1-nano"})
+    second = OpenAILLM({"api_key": "test-key", "model": "gpt-4.1-mini", "temperature": 0})
+
+    assert first.client is not second.client
+    assert first.model == "gpt-4.1-nano" and second.model == "gpt-4.1-mini"
+
+    await first.client.close()
+    assert not second.client.is_closed()
+    third = OpenAILLM({"api_key": "test-key"})
+    assert third.client._client is second.client._client
+
+
+@pytest.mark.asyncio
+async def test_openai_shared_connections_are_closed_on_shutdown():
+    """Test that the shared connections are closed by aclose_shared_clients and reopened afterwards"""
+    llm = OpenAILLM({"api_key": "test-key"})
+
+    await aclose_shared_clients()
+
+    assert llm.client.is_closed()
+    assert not OpenAILLM({"api_key": "test-key"}).client.is_closed()
+    await aclose_shared_clients()
+
+
+def test_openai_function_schemas_are_dropped_with_their_tools():
+    """Test that cached function definitions don't outlive their tools"""
+    tool = Tool(name="temporary_tool", description="A tool that is thrown away", parameters={})
+    OpenAILLM._function_schemas.get(tool, lambda t: {"name": t.name})
+    key = id(tool)
+    assert key in OpenAILLM._function_schemas._definitions
+
+    del tool
+    gc.collect()
+    assert key not in OpenAILLM._function_schemas._definitions
+
+
+def test_openai_function_schemas_follow_changed_tools():
+    """Test that changes to cached tools, made in place, are picked up"""
+    tool = Tool(name="get_forecast", description="Get the forecast", parameters={
+        "city": ToolParameter(type="string", description="The city", required=True, enum=["Berlin", "Paris"])
+    })
+    llm = OpenAILLM({"api_key": "test-key"})
+    first = llm._prepare_functions(LLMOptions(functions=[tool]))[0]
+    assert llm._prepare_functions(LLMOptions(functions=[tool]))[0] is first
+
+    tool.description = "Get the weather"
+    second = llm._prepare_functions(LLMOptions(functions=[tool]))[0]
+    assert second["function"]["description"] == "Get the weather"
+
+    tool.parameters["city"].enum.append("Tokyo")
+    third = llm._prepare_functions(LLMOptions(functions=[tool]))[0]
+    assert third["function"]["parameters"]["properties"]["city"]["enum"] == ["Berlin", "Paris", "Tokyo"]
+
+    tool.parameters["days"] = ToolParameter(type="integer", description="Number of days")
+    fourth = llm._prepare_functions(LLMOptions(functions=[tool]))[0]
+    assert "days" not in third["function"]["parameters"]["properties"]
+    assert "days" in fourth["function"]["parameters"]["properties"]
+    assert llm._prepare_functions(LLMOptions(functions=[tool]))[0] is fourth
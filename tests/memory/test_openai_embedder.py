@@ -1,8 +1,14 @@
+import asyncio
 import os
 import pytest
 import numpy as np
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
 from openai import BadRequestError
 
+from xaibo.primitives.modules.memory import openai_embedder
 from xaibo.primitives.modules.memory.openai_embedder import OpenAIEmbedder
 
 
@@ -30,6 +36,77 @@ def test_init_missing_api_key():
         if original_api_key is not None:
             os.environ["OPENAI_API_KEY"] = original_api_key
 
+@pytest.mark.asyncio
+async def test_concurrent_texts_are_embedded_in_one_request():
+    """Test that texts embedded concurrently are sent together and resolved in order"""
+    embedder = OpenAIEmbedder({"api_key": "dummy_key"})
+
+    async def create(model, input):
+        # answer out of order, the index identifies the input
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in reversed(list(enumerate(input)))
+        ])
+    embedder.client.embeddings.create = AsyncMock(side_effect=create)
+
+    embeddings = await asyncio.gather(*(embedder.text_to_embedding(text) for text in ["a", "bb", "ccc"]))
+
+    embedder.client.embeddings.create.assert_awaited_once_with(model=embedder.model, input=["a", "bb", "ccc"])
+    assert [embedding.tolist() for embedding in embeddings] == [[1.0], [2.0], [3.0]]
+
+@pytest.mark.asyncio
+async def test_batch_errors_are_raised_for_every_text():
+    """Test that a failed batch request fails all of its callers"""
+    embedder = OpenAIEmbedder({"api_key": "dummy_key"})
+    embedder.client.embeddings.create = AsyncMock(side_effect=RuntimeError("API unavailable"))
+
+    results = await asyncio.gather(
+        embedder.text_to_embedding("a"),
+        embedder.text_to_embedding("b"),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def bad_request(message):
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    return BadRequestError(message, response=httpx.Response(400, request=request), body=None)
+
+@pytest.mark.asyncio
+async def test_rejected_texts_only_fail_their_own_callers():
+    """Test that a request rejected for one text is split up, so the other texts are still embedded"""
+    embedder = OpenAIEmbedder({"api_key": "dummy_key"})
+
+    async def create(model, input):
+        if "" in input:
+            raise bad_request("input must not be empty")
+        return SimpleNamespace(data=[SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)])
+    embedder.client.embeddings.create = AsyncMock(side_effect=create)
+
+    results = await asyncio.gather(
+        *(embedder.text_to_embedding(text) for text in ["a", "bb", "", "dddd", "eeeee"]),
+        return_exceptions=True
+    )
+
+    assert isinstance(results[2], BadRequestError)
+    assert [result.tolist() for i, result in enumerate(results) if i != 2] == [[1.0], [2.0], [4.0], [5.0]]
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_token_budget(monkeypatch):
+    """Test that concurrent texts are sent in several requests when their tokens exceed the request limit"""
+    monkeypatch.setattr(openai_embedder, "MAX_BATCH_TOKENS", 5)
+    embedder = OpenAIEmbedder({"api_key": "dummy_key"})
+
+    async def create(model, input):
+        return SimpleNamespace(data=[SimpleNamespace(index=i, embedding=[float(len(text))]) for i, text in enumerate(input)])
+    embedder.client.embeddings.create = AsyncMock(side_effect=create)
+
+    embeddings = await asyncio.gather(*(embedder.text_to_embedding(text) for text in ["aa", "bbb", "cc", "dddddddd"]))
+
+    assert [call.kwargs["input"] for call in embedder.client.embeddings.create.await_args_list] == [
+        ["aa", "bbb"], ["cc"], ["dddddddd"]
+    ]
+    assert [embedding.tolist() for embedding in embeddings] == [[2.0], [3.0], [2.0], [8.0]]
+
 @pytest.mark.asyncio
 async def test_image_to_embedding_not_implemented():
     """Test image_to_embedding raises NotImplementedError"""
@@ -56,8 +133,7 @@ async def test_audio_to_embedding_not_implemented():
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(not os.environ.get("OPENAI_API_KEY"), reason="OPENAI_API_KEY environment variable not set")
-async def test_integration_text_to_embedding():
+async def test_integration_text_to_embedding(openai_available):
     """Integration test for text_to_embedding with actual API"""
     embedder = OpenAIEmbedder()
     
@@ -71,8 +147,7 @@ async def test_integration_text_to_embedding():
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(not os.environ.get("OPENAI_API_KEY"), reason="OPENAI_API_KEY environment variable not set")
-async def test_text_to_embedding_with_custom_model():
+async def test_text_to_embedding_with_custom_model(openai_available):
     """Test text_to_embedding with custom model"""
     embedder = OpenAIEmbedder({
         "model": "text-embedding-3-small"
@@ -88,8 +163,7 @@ async def test_text_to_embedding_with_custom_model():
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(not os.environ.get("OPENAI_API_KEY"), reason="OPENAI_API_KEY environment variable not set")
-async def test_text_to_embedding_with_additional_params():
+async def test_text_to_embedding_with_additional_params(openai_available):
     """Test text_to_embedding with additional parameters"""
     embedder = OpenAIEmbedder({
         "model": "text-embedding-3-small",
@@ -107,8 +181,7 @@ async def test_text_to_embedding_with_additional_params():
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(not os.environ.get("OPENAI_API_KEY"), reason="OPENAI_API_KEY environment variable not set")
-async def test_empty_text_embedding():
+async def test_empty_text_embedding(openai_available):
     """Test embedding of empty text"""
     embedder = OpenAIEmbedder()
     
@@ -122,8 +195,7 @@ async def test_empty_text_embedding():
 
 
 @pytest.mark.asyncio
-@pytest.mark.skipif(not os.environ.get("OPENAI_API_KEY"), reason="OPENAI_API_KEY environment variable not set")
-async def test_long_text_embedding():
+async def test_long_text_embedding(openai_available):
     """Test that embedding of long text fails with BadRequestError due to token limit exceeded"""
     embedder = OpenAIEmbedder()
 
@@ -0,0 +1,19 @@
+import pytest
+
+from xaibo.core.models import Response
+from xaibo.primitives.modules.response import ResponseHandler
+
+
+@pytest.mark.asyncio
+async def test_response_text_includes_text_added_after_getting_the_response():
+    """Test that a response requested early still sees the text that is added later"""
+    handler = ResponseHandler()
+    response = await handler.get_response()
+    assert response.text is None
+
+    await handler.respond_text("Hello")
+    await handler.respond(Response(text=" world"))
+    assert response.text == "Hello world"
+
+    await handler.respond_text("!")
+    assert (await handler.get_response()).text == "Hello world!"
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+from typing import Dict, Any, List
+
+from xaibo.primitives.modules.orchestrator.simple_tool_orchestrator import SimpleToolOrchestrator
+from xaibo.primitives.modules.llm.mock import MockLLM
+from xaibo.primitives.modules.conversation.conversation import SimpleConversation
+from xaibo.primitives.modules.response import ResponseHandler
+from xaibo.core.models.llm import LLMResponse, LLMFunctionCall, LLMRole
+from xaibo.core.models.tools import Tool, ToolResult
+
+
+class SlowToolProvider:
+    """Tool provider whose tools take a while, recording how many of them run at once"""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def list_tools(self) -> List[Tool]:
+        return [Tool(name="slow_echo", description="Echo a value after a while", parameters={})]
+
+    async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> ToolResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if parameters["value"] == "fail":
+                return ToolResult(success=False, error="failed on purpose")
+            return ToolResult(success=True, result=parameters["value"])
+        finally:
+            self.running -= 1
+
+
+def create_orchestrator(tool_provider: SlowToolProvider, config: Dict[str, Any] = None):
+    """Create an orchestrator whose LLM calls three tools at once and then answers"""
+    llm = MockLLM({"responses": [
+        LLMResponse(content="", tool_calls=[
+            LLMFunctionCall(id=f"call_{value}", name="slow_echo", arguments={"value": value})
+            for value in ("first", "fail", "third")
+        ]).model_dump(),
+        LLMResponse(content="Done").model_dump()
+    ]})
+    conversation = SimpleConversation()
+    response = ResponseHandler()
+    orchestrator = SimpleToolOrchestrator(response, llm, tool_provider, conversation, config)
+    return orchestrator, llm, response
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config, expected_max_running", [
+    ({"parallel_tool_calls": True}, 3),
+    ({"parallel_tool_calls": False}, 1),
+    ({}, 1)
+])
+async def test_tool_calls_of_one_response(config, expected_max_running):
+    """Test that the tool calls of one response only run concurrently when enabled, keeping their order"""
+    tool_provider = SlowToolProvider()
+    orchestrator, llm, response = create_orchestrator(tool_provider, config)
+    generate = llm.generate
+    conversations = []
+
+    async def record_generate(messages, options=None):
+        conversations.append(list(messages))
+        return await generate(messages, options)
+    llm.generate = record_generate
+
+    await orchestrator.handle_text("Echo three values")
+
+    assert tool_provider.max_running == expected_max_running
+    assert (await response.get_response()).text == "Done"
+
+    tool_results = conversations[-1][-1]
+    assert tool_results.role == LLMRole.FUNCTION
+    assert [result.id for result in tool_results.tool_results] == ["call_first", "call_fail", "call_third"]
+    assert [result.content for result in tool_results.tool_results] == ['"first"', "Error: failed on purpose", '"third"']
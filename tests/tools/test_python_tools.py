@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from xaibo.primitives.modules.tools.python_tool_provider import PythonToolProvider, tool
@@ -203,3 +205,34 @@ async def test_mixed_tool_sources():
     result = await provider.execute_tool(divide_tool.name, {"numerator": 10, "denominator": 0})
     assert result.success is False
     assert "divide by zero" in result.error.lower()
+
+
+@pytest.mark.asyncio
+async def test_package_is_only_reloaded_after_it_changed(tmp_path, monkeypatch):
+    """Test that listing tools picks up changed packages but reuses unchanged ones"""
+    package_file = tmp_path / "changing_tools.py"
+    package_file.write_text(
+        "from xaibo.primitives.modules.tools.python_tool_provider import tool\n"
+        "@tool\n"
+        "def first():\n"
+        "    return 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "changing_tools", raising=False)
+    provider = PythonToolProvider({"tool_packages": ["changing_tools"]})
+
+    tools = await provider.list_tools()
+    unchanged_tools = await provider.list_tools()
+    assert [t.name for t in tools] == ["changing_tools-first"]
+    assert unchanged_tools[0] is tools[0]
+
+    package_file.write_text(package_file.read_text().replace("first", "second").replace("return 1", "return 22"))
+    changed_tools = await provider.list_tools()
+    # like any reload, this keeps the names the old source defined
+    assert "changing_tools-second" in [t.name for t in changed_tools]
+
+    result = await provider.execute_tool("changing_tools-second", {})
+    assert result.success is True
+    assert result.result == 22
+
+    monkeypatch.delitem(sys.modules, "changing_tools", raising=False)
@@ -0,0 +1,59 @@
+import pytest
+
+from xaibo.core.models import Tool, ToolResult
+from xaibo.primitives.modules.tools.tool_collector import ToolCollector
+
+
+class CountingToolProvider:
+    """Tool provider that records how often its tools were listed"""
+    def __init__(self, tool_names):
+        self.tool_names = tool_names
+        self.list_calls = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return [Tool(name=name, description=f"{name} tool") for name in self.tool_names]
+
+    async def execute_tool(self, tool_name, parameters):
+        return ToolResult(success=True, result=f"{tool_name}:{parameters}")
+
+
+@pytest.mark.asyncio
+async def test_list_tools_combines_providers():
+    """Test that tools of all providers are listed"""
+    collector = ToolCollector([CountingToolProvider(["a", "b"]), CountingToolProvider(["c"])])
+
+    tools = await collector.list_tools()
+
+    assert [t.name for t in tools] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_uses_cached_providers():
+    """Test that executing tools only lists the provider tools once"""
+    first = CountingToolProvider(["a"])
+    second = CountingToolProvider(["b"])
+    collector = ToolCollector([first, second])
+
+    result_a = await collector.execute_tool("a", {"x": 1})
+    result_b = await collector.execute_tool("b", {})
+
+    assert result_a.result == "a:{'x': 1}"
+    assert result_b.result == "b:{}"
+    assert first.list_calls == 1
+    assert second.list_calls == 1
+
+    collector.invalidate()
+    await collector.execute_tool("a", {})
+    assert first.list_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_unknown_tool():
+    """Test that unknown tools result in an error result"""
+    collector = ToolCollector([CountingToolProvider(["a"])])
+
+    result = await collector.execute_tool("missing", {})
+
+    assert result.success is False
+    assert result.error == "Could not find missing"
@@ -188,6 +188,8 @@ def test_create_response_streaming(client):
     ) as response:
         assert response.status_code == 200
         assert response.headers["Content-Type"] == "text/event-stream; charset=utf-8"
+        assert response.headers["Cache-Control"] == "no-cache, no-transform"
+        assert response.headers["X-Accel-Buffering"] == "no"
         
         events = []
         accumulated_text = ""
@@ -3,6 +3,7 @@ import logging
 import pytest
 import asyncio
 import json
+import time
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
@@ -64,6 +65,24 @@ class StreamingEcho(TextMessageHandlerProtocol):
             await asyncio.sleep(0.05)
 
 
+class BurstEcho(TextMessageHandlerProtocol):
+    """Echo module that sends all words at once and finishes a little later"""
+
+    @classmethod
+    def provides(cls):
+        return [TextMessageHandlerProtocol]
+
+    def __init__(self, response: ResponseProtocol, config: dict | None = None):
+        self.config = config or {}
+        self.linger_seconds = self.config.get("linger_seconds", 0.0)
+        self.response = response
+
+    async def handle_text(self, text: str) -> None:
+        for word in text.split(" "):
+            await self.response.respond_text(f"{word} ")
+        await asyncio.sleep(self.linger_seconds)
+
+
 class HistoryAwareEcho(TextMessageHandlerProtocol):
     """Echo module that is aware of conversation history"""
     
@@ -137,6 +156,21 @@ def xaibo_instance():
         ]
     )
     xaibo.register_agent(streaming_config)
+
+    # Register agents that queue all their chunks at once
+    for agent_id, linger_seconds in (("burst-agent", 0.0), ("lingering-burst-agent", 0.2)):
+        xaibo.register_agent(AgentConfig(
+            id=agent_id,
+            modules=[
+                ModuleConfig(
+                    module=BurstEcho,
+                    id="burst-echo",
+                    config={
+                        "linger_seconds": linger_seconds
+                    }
+                )
+            ]
+        ))
     
     # Register a history-aware echo agent
     history_config = AgentConfig(
@@ -224,6 +258,8 @@ def test_openai_chat_completion_streaming(client):
     ) as response:
         assert response.status_code == 200
         assert response.headers["Content-Type"] == "text/event-stream; charset=utf-8"
+        assert response.headers["Cache-Control"] == "no-cache, no-transform"
+        assert response.headers["X-Accel-Buffering"] == "no"
         
         # Read the streaming response
         full_response = ""
@@ -245,6 +281,41 @@ def test_openai_chat_completion_streaming(client):
     assert "data: [DONE]" in full_response
 
 
+@pytest.mark.parametrize("model", ["burst-agent", "lingering-burst-agent"])
+def test_openai_chat_completion_streaming_ends_with_agent(xaibo_instance, model):
+    """Test that a stream sends every queued chunk and ends when the agent is done, not after a timeout"""
+    app = FastAPI()
+    OpenAiApiAdapter(xaibo_instance, streaming_timeout=10).adapt(app)
+    client = TestClient(app)
+    request_data = {
+        "model": model,
+        "messages": [
+            {"role": "user", "content": "one two three four"}
+        ],
+        "stream": True
+    }
+
+    start = time.monotonic()
+    with client.stream(
+        "POST",
+        "/openai/chat/completions",
+        json=request_data
+    ) as response:
+        complete_content = ""
+        finish_reasons = []
+        for line in response.iter_lines():
+            if line == "data: [DONE]":
+                break
+            if line.startswith("data: "):
+                data = json.loads(line[6:])  # Remove "data: " prefix
+                complete_content += data["choices"][0]["delta"].get("content", "")
+                finish_reasons.append(data["choices"][0]["finish_reason"])
+
+    assert time.monotonic() - start < 5
+    assert complete_content == "one two three four "
+    assert finish_reasons[-1] == "stop"
+
+
 def test_openai_chat_completion_timeout_handling(client):
     """Test that the streaming endpoint handles timeouts correctly"""
     request_data = {
@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from xaibo import Xaibo, AgentConfig, ModuleConfig
+from xaibo.core.models.events import Event, EventType
+from xaibo.server.adapters.ui import UiApiAdapter, UIDebugTraceEventListener, Mutation
+from xaibo.core.protocols import TextMessageHandlerProtocol, ResponseProtocol
+
+
+class Echo(TextMessageHandlerProtocol):
+    """Simple echo module for testing"""
+
+    @classmethod
+    def provides(cls):
+        return [TextMessageHandlerProtocol]
+
+    def __init__(self, response: ResponseProtocol, config: dict | None = None):
+        self.response = response
+
+    async def handle_text(self, text: str) -> None:
+        await self.response.respond_text(f"You said: {text}")
+
+
+@pytest.fixture
+def static_build(tmp_path):
+    """A minimal UI build"""
+    (tmp_path / "index.html").write_text("<html>xaibo</html>")
+    immutable = tmp_path / "_app" / "immutable"
+    immutable.mkdir(parents=True)
+    (immutable / "app.1234.js").write_text("console.log('xaibo')")
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_build):
+    """Create a test client with the UI adapter serving the minimal build"""
+    xaibo = Xaibo()
+    xaibo.register_agent(AgentConfig(
+        id="echo-agent",
+        modules=[ModuleConfig(module=Echo, id="echo")]
+    ))
+    adapter = UiApiAdapter(xaibo)
+    adapter.static_path = static_build
+    app = FastAPI()
+    adapter.adapt(app)
+    return TestClient(app)
+
+
+def test_chat_endpoint(client):
+    """Test that the REST chat endpoint responds and extends the history"""
+    response = client.post("/api/ui/chat/echo-agent", json={
+        "message": "hi",
+        "history": [{"role": "user", "content": "hello"}, {"role": "assistant", "content": "You said: hello"}]
+    })
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["response"] == "You said: hi"
+    assert data["history"][-2:] == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "You said: hi"}
+    ]
+
+
+def test_chat_unknown_agent(client):
+    """Test that chatting with an unknown agent is a 404"""
+    response = client.post("/api/ui/chat/missing", json={"message": "hi"})
+
+    assert response.status_code == 404
+
+
+def test_spa_fallback(client):
+    """Test that unknown HTML routes serve the SPA index and support revalidation"""
+    response = client.get("/agents/echo-agent", headers={"accept": "text/html"})
+
+    assert response.status_code == 200
+    assert response.text == "<html>xaibo</html>"
+    assert response.headers["cache-control"] == "no-cache"
+
+    revalidated = client.get("/agents/echo-agent", headers={
+        "accept": "text/html",
+        "if-none-match": response.headers["etag"]
+    })
+    assert revalidated.status_code == 304
+
+
+def test_immutable_assets_are_cacheable(client):
+    """Test that hashed build assets are served with long-term cache headers"""
+    response = client.get("/_app/immutable/app.1234.js")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+
+def test_debug_trace_continues_after_clear_log(tmp_path, monkeypatch):
+    """Test that clearing a trace keeps the open trace file usable for new events"""
+    monkeypatch.chdir(tmp_path)
+    listener = UIDebugTraceEventListener(Path("./debug"))
+
+    def event(call_id):
+        return Event(
+            agent_id="echo-agent", event_name="echo.handle_text.call", event_type=EventType.CALL,
+            module_id="echo", module_class="Echo", method_name="handle_text", time=0.0,
+            call_id=call_id, caller_id="test"
+        )
+
+    listener.handle_event(event("before"))
+    Mutation().clear_log("echo-agent")
+    listener.handle_event(event("after"))
+    listener.close()
+
+    lines = (tmp_path / "debug" / "echo-agent.jsonl").read_bytes().splitlines()
+    assert [json.loads(line)["call_id"] for line in lines] == ["after"]
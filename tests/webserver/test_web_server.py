@@ -2,6 +2,7 @@ import pytest
 import os
 from unittest.mock import Mock, patch, MagicMock
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from xaibo import Xaibo
 from xaibo.server.web import XaiboWebServer, get_class_by_path
@@ -285,6 +286,11 @@ def test_web_server_debug_mode_adds_ui_adapter(xaibo_instance, temp_agent_dir):
         # Verify event listener was registered
         mock_listener.assert_called_once()
 
+        # Verify the event listener is closed when the server shuts down
+        with TestClient(server.app):
+            mock_listener.return_value.close.assert_not_called()
+        mock_listener.return_value.close.assert_called_once()
+
 
 def test_command_line_argument_parsing():
     """Test command line argument parsing for API keys"""